@@ -0,0 +1,383 @@
+"""Benchmark the /api/courses endpoints and write machine-readable results.
+
+Usage:
+    python -m benchmarks.bench_api --courses 10000 --lessons 5
+    python -m benchmarks.bench_api --database-uri postgresql://user:pw@localhost/bench \\
+        --courses 100000 --mode wsgi --concurrency 8
+
+Run from the project root: the schema is created with the Alembic migrations, so
+Postgres gets the same indexes and search triggers as production. Results go to
+benchmarks/results/<timestamp>-<commit>.json; compare two runs with
+``python -m benchmarks.compare``.
+"""
+
+import argparse
+import http.client
+import json
+import platform
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from importlib.metadata import version
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import flask
+import sqlalchemy
+from flask_migrate import downgrade, upgrade
+from sqlalchemy import insert, inspect, text
+from werkzeug.serving import make_server
+
+from crud_flask import create_app
+from crud_flask.config import ProductionConfig
+from crud_flask.models.models import Category, Course, Lesson, Status, db
+from crud_flask.services.search import SQLITE_SEARCH_TABLE
+
+RESULTS_DIR = Path(__file__).parent / "results"
+SEED_BATCH = 10_000
+FULL_LIST_LIMIT = 20_000
+
+
+def git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * len(sorted_values))) - 1)
+    return sorted_values[max(index, 0)]
+
+
+def summarize(latencies: List[float], wall: float, errors: int) -> Dict:
+    ordered = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall, 2) if wall else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+            "p50": round(percentile(ordered, 0.50), 3),
+            "p90": round(percentile(ordered, 0.90), 3),
+            "p99": round(percentile(ordered, 0.99), 3),
+            "max": round(ordered[-1], 3) if ordered else 0.0,
+        },
+    }
+
+
+def reset_schema(app: flask.Flask) -> None:
+    """Rebuild the schema through the migrations so every run starts empty."""
+    with app.app_context():
+        if inspect(db.engine).has_table("alembic_version"):
+            downgrade(revision="base")
+        else:
+            db.drop_all()
+        # No migration owns the SQLite FTS index; a leftover one would make the
+        # next install skip its rebuild and serve search from stale rows
+        with db.engine.begin() as connection:
+            connection.execute(text(f"DROP TABLE IF EXISTS {SQLITE_SEARCH_TABLE}"))
+        upgrade()
+
+
+def seed(app: flask.Flask, courses: int, lessons: int) -> float:
+    """Insert ``courses`` x ``lessons`` rows in batches; returns seconds taken."""
+    categories, statuses = list(Category), list(Status)
+    created_at = datetime(2025, 1, 1)
+    started = time.perf_counter()
+    with app.app_context():
+        for start in range(0, courses, SEED_BATCH):
+            stop = min(start + SEED_BATCH, courses)
+            db.session.execute(
+                insert(Course),
+                [
+                    {
+                        "id": i + 1,
+                        "name": f"Course {i} {categories[i % len(categories)].value}",
+                        "description": f"Benchmark course number {i}",
+                        "category": categories[i % len(categories)],
+                        "status": statuses[i % len(statuses)],
+                        "created_at": created_at + timedelta(seconds=i),
+                        "updated_at": created_at + timedelta(seconds=i),
+                    }
+                    for i in range(start, stop)
+                ],
+            )
+            if lessons:
+                db.session.execute(
+                    insert(Lesson),
+                    [
+                        {
+                            "name": f"Lesson {j}",
+                            "youtube_url": f"https://youtube.com/watch?v={i}-{j}",
+                            "course_id": i + 1,
+                        }
+                        for i in range(start, stop)
+                        for j in range(lessons)
+                    ],
+                )
+            db.session.commit()
+
+        if db.engine.dialect.name == "postgresql":
+            db.session.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence('courses', 'id'), "
+                    "(SELECT max(id) FROM courses))"
+                )
+            )
+            db.session.commit()
+            db.session.execute(text("ANALYZE"))
+        db.session.remove()
+    return time.perf_counter() - started
+
+
+def endpoints(
+    courses: int, cursor: str, include_full_list: bool
+) -> List[Tuple[str, str, Callable]]:
+    """(name, method, request factory) triples; factories return (path, body)."""
+    rng = random.Random(42)
+    middle = max(courses // 40, 1)
+    catalog = [
+        (
+            "paginated_first_page",
+            "GET",
+            lambda: ("/api/courses/paginated?page=1&per_page=20", None),
+        ),
+        (
+            "paginated_deep_page",
+            "GET",
+            lambda: (f"/api/courses/paginated?page={middle}&per_page=20", None),
+        ),
+        (
+            "paginated_filtered_sorted",
+            "GET",
+            lambda: (
+                "/api/courses/paginated?page=1&per_page=20&category=backend"
+                "&status=active&sort=name&order=desc",
+                None,
+            ),
+        ),
+        (
+            "paginated_sparse_fields",
+            "GET",
+            lambda: ("/api/courses/paginated?page=1&per_page=20&fields=id,name", None),
+        ),
+        (
+            "cursor_page",
+            "GET",
+            lambda: (f"/api/courses/paginated?per_page=20&after={cursor}", None),
+        ),
+        ("search", "GET", lambda: ("/api/courses/search?q=backend&per_page=20", None)),
+        (
+            "get_by_id",
+            "GET",
+            lambda: (f"/api/courses/{rng.randint(1, courses)}", None),
+        ),
+        (
+            "create",
+            "POST",
+            lambda: (
+                "/api/courses",
+                {
+                    "name": "Benchmark create",
+                    "category": "BACKEND",
+                    "lessons": [{"name": "Lesson", "youtube_url": "url"}],
+                },
+            ),
+        ),
+    ]
+    if include_full_list or courses <= FULL_LIST_LIMIT:
+        catalog.insert(0, ("list_all", "GET", lambda: ("/api/courses", None)))
+    return catalog
+
+
+def first_cursor(client) -> str:
+    response = client.get("/api/courses/paginated?per_page=20&after=")
+    return (response.get_json() or {}).get("nextCursor") or ""
+
+
+def run_test_client(
+    app, method, factory, requests, warmup
+) -> Tuple[List[float], int, float]:
+    """Sequential requests through the test client: app cost without HTTP."""
+    client = app.test_client()
+
+    def call() -> Tuple[float, bool]:
+        path, body = factory()
+        started = time.perf_counter()
+        response = client.open(path, method=method, json=body)
+        response.get_data()
+        return (time.perf_counter() - started) * 1000, response.status_code >= 400
+
+    for _ in range(warmup):
+        call()
+
+    started = time.perf_counter()
+    results = [call() for _ in range(requests)]
+    wall = time.perf_counter() - started
+    return [latency for latency, _ in results], sum(f for _, f in results), wall
+
+
+def run_wsgi(
+    host, port, method, factory, requests, warmup, concurrency
+) -> Tuple[List[float], int, float]:
+    """Concurrent HTTP requests against a threaded WSGI server."""
+
+    def call() -> Tuple[float, bool]:
+        path, body = factory()
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload else {}
+        started = time.perf_counter()
+        connection = http.client.HTTPConnection(host, port, timeout=60)
+        try:
+            connection.request(method, path, body=payload, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            failed = response.status >= 400
+        except OSError:
+            failed = True
+        finally:
+            connection.close()
+        return (time.perf_counter() - started) * 1000, failed
+
+    for _ in range(warmup):
+        call()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: call(), range(requests)))
+    wall = time.perf_counter() - started
+    return [latency for latency, _ in results], sum(f for _, f in results), wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-uri", default="sqlite:////tmp/crud_flask_bench.db")
+    parser.add_argument("--courses", type=int, default=10_000)
+    parser.add_argument("--lessons", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--mode", choices=["client", "wsgi", "both"], default="both")
+    parser.add_argument("--endpoint", action="append", help="Only run these endpoints")
+    parser.add_argument("--include-full-list", action="store_true")
+    parser.add_argument(
+        "--skip-seed",
+        action="store_true",
+        help="Reuse the data already in --database-uri",
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    config = type(
+        "BenchmarkConfig",
+        (ProductionConfig,),
+        {"SQLALCHEMY_DATABASE_URI": args.database_uri, "METRICS_ENABLED": False},
+    )
+    app = create_app(config)
+
+    seed_seconds = None
+    if not args.skip_seed:
+        reset_schema(app)
+        seed_seconds = seed(app, args.courses, args.lessons)
+        print(
+            f"seeded {args.courses} courses x {args.lessons} lessons "
+            f"in {seed_seconds:.1f}s"
+        )
+    else:
+        with app.app_context():
+            if not inspect(db.engine).has_table("courses"):
+                parser.error("--skip-seed needs an existing courses table")
+            args.courses = db.session.query(Course).count()
+
+    with app.app_context():
+        dialect = db.engine.dialect.name
+
+    cursor = first_cursor(app.test_client())
+    catalog = [
+        (name, method, factory)
+        for name, method, factory in endpoints(
+            args.courses, cursor, args.include_full_list
+        )
+        if not args.endpoint or name in args.endpoint
+    ]
+
+    modes = ["client", "wsgi"] if args.mode == "both" else [args.mode]
+    server = thread = None
+    if "wsgi" in modes:
+        server = make_server("127.0.0.1", 0, app, threaded=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+    results = []
+    try:
+        for mode in modes:
+            for name, method, factory in catalog:
+                if mode == "client":
+                    latencies, errors, wall = run_test_client(
+                        app, method, factory, args.requests, args.warmup
+                    )
+                else:
+                    latencies, errors, wall = run_wsgi(
+                        "127.0.0.1",
+                        server.server_port,
+                        method,
+                        factory,
+                        args.requests,
+                        args.warmup,
+                        args.concurrency,
+                    )
+                summary = {"endpoint": name, "method": method, "mode": mode}
+                summary.update(summarize(latencies, wall, errors))
+                results.append(summary)
+                latency = summary["latency_ms"]
+                print(
+                    f"{mode:<6} {name:<28} {summary['throughput_rps']:9.1f} req/s"
+                    f"   p50 {latency['p50']:8.2f} ms   p99 {latency['p99']:8.2f} ms"
+                    f"   errors {errors}"
+                )
+    finally:
+        if server is not None:
+            server.shutdown()
+            thread.join()
+
+    commit = git("rev-parse", "HEAD")
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": commit,
+            "branch": git("rev-parse", "--abbrev-ref", "HEAD"),
+            "dirty": bool(git("status", "--porcelain")),
+            "python": platform.python_version(),
+            "flask": version("flask"),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "dialect": dialect,
+            "courses": args.courses,
+            "lessons_per_course": args.lessons,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "seed_seconds": seed_seconds,
+        },
+        "results": results,
+    }
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = RESULTS_DIR / f"{stamp}-{(commit or 'nogit')[:8]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
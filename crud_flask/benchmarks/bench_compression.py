@@ -0,0 +1,162 @@
+"""Measure the CPU-vs-bytes tradeoff of response compression.
+
+Usage:
+    python -m benchmarks.bench_compression --courses 5000 --lessons 5
+    python -m benchmarks.bench_compression --skip-seed \\
+        --database-uri postgresql://user:pw@localhost/bench
+
+Payloads are real responses of the course API (served with compression off),
+then compressed with every available encoding at several levels. For each
+combination the report lists compressed size, ratio, compression time and the
+estimated time to deliver the response (CPU + transfer) over a few link speeds.
+Results go to benchmarks/results/compression-<timestamp>-<commit>.json.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from crud_flask import create_app
+from crud_flask.compression import CODECS, available_encodings, compress
+from crud_flask.config import ProductionConfig
+from benchmarks.bench_api import RESULTS_DIR, git, reset_schema, seed
+
+LEVELS = {
+    "gzip": (1, 6, 9),
+    "br": (1, 4, 6, 11),
+    "zstd": (1, 3, 9, 19),
+}
+
+# Link speeds in megabits per second
+LINKS = {"3g": 1.6, "slow_wifi": 10.0, "broadband": 100.0}
+
+
+def payloads(app, courses: int) -> List[Tuple[str, bytes]]:
+    client = app.test_client()
+    targets = [
+        ("get_by_id", "/api/courses/1"),
+        ("page_20", "/api/courses/paginated?page=1&per_page=20"),
+        ("page_100", "/api/courses/paginated?page=1&per_page=100"),
+        ("export_ndjson", "/api/courses/export"),
+    ]
+    if courses <= 20_000:
+        targets.insert(3, ("list_all", "/api/courses"))
+    return [(name, client.get(path).get_data()) for name, path in targets]
+
+
+def measure(encoding: str, level: int, data: bytes, repeats: int) -> Dict:
+    timings, compressed = [], b""
+    for _ in range(repeats):
+        started = time.perf_counter()
+        compressed = compress(encoding, level, data)
+        timings.append(time.perf_counter() - started)
+
+    cpu_ms = statistics.median(timings) * 1000
+    return {
+        "encoding": encoding,
+        "level": level,
+        "bytes": len(compressed),
+        "ratio": round(len(data) / len(compressed), 2),
+        "cpu_ms": round(cpu_ms, 3),
+        "mb_per_s": round(len(data) / 1e6 / (cpu_ms / 1000), 1) if cpu_ms else None,
+        "delivery_ms": {
+            link: round(cpu_ms + transfer_ms(len(compressed), mbps), 2)
+            for link, mbps in LINKS.items()
+        },
+    }
+
+
+def transfer_ms(size: int, mbps: float) -> float:
+    return size * 8 / (mbps * 1e6) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-uri", default="sqlite:////tmp/crud_flask_bench.db")
+    parser.add_argument("--courses", type=int, default=5_000)
+    parser.add_argument("--lessons", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--skip-seed",
+        action="store_true",
+        help="Reuse the data already in --database-uri",
+    )
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+
+    config = type(
+        "CompressionBenchmarkConfig",
+        (ProductionConfig,),
+        {
+            "SQLALCHEMY_DATABASE_URI": args.database_uri,
+            "METRICS_ENABLED": False,
+            "COMPRESSION_ENABLED": False,
+        },
+    )
+    app = create_app(config)
+    if not args.skip_seed:
+        reset_schema(app)
+        seed(app, args.courses, args.lessons)
+
+    encodings = available_encodings(CODECS)
+    results = []
+    for name, data in payloads(app, args.courses):
+        identity = {
+            "encoding": "identity",
+            "level": None,
+            "bytes": len(data),
+            "ratio": 1.0,
+            "cpu_ms": 0.0,
+            "mb_per_s": None,
+            "delivery_ms": {
+                link: round(transfer_ms(len(data), mbps), 2)
+                for link, mbps in LINKS.items()
+            },
+        }
+        print(f"\n{name}: {len(data):,} bytes")
+        for row in [identity] + [
+            measure(encoding, level, data, args.repeats)
+            for encoding in encodings
+            for level in LEVELS[encoding]
+        ]:
+            results.append({"payload": name, **row})
+            delivery = "  ".join(
+                f"{link} {ms:9.2f} ms" for link, ms in row["delivery_ms"].items()
+            )
+            print(
+                f"  {row['encoding']:<8} {str(row['level'] or ''):>3}"
+                f" {row['bytes']:>11,} B  x{row['ratio']:<6} cpu {row['cpu_ms']:8.2f} ms"
+                f"  {delivery}"
+            )
+
+    commit = git("rev-parse", "HEAD")
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": commit,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "courses": args.courses,
+            "lessons_per_course": args.lessons,
+            "repeats": args.repeats,
+            "links_mbps": LINKS,
+        },
+        "results": results,
+    }
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = RESULTS_DIR / f"compression-{stamp}-{(commit or 'nogit')[:8]}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\nresults written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare the ORM + stdlib JSON list path with Core rows + the fast provider.
+
+Usage: python -m benchmarks.bench_serialization --courses 2000 --lessons 5
+"""
+
+import argparse
+import statistics
+import time
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from flask_sqlalchemy.query import Query
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from crud_flask.json_provider import get_json_provider_class
+from crud_flask.models.models import Category, Course, Lesson, Status, db
+from crud_flask.services.course_service import CourseService
+
+
+def seed(session_factory, courses, lessons):
+    session = session_factory()
+    session.execute(
+        insert(Course),
+        [
+            {
+                "name": f"Course {i}",
+                "description": "Benchmark course " * 4,
+                "category": list(Category)[i % len(Category)],
+                "status": list(Status)[i % len(Status)],
+            }
+            for i in range(courses)
+        ],
+    )
+    session.execute(
+        insert(Lesson),
+        [
+            {
+                "name": f"Lesson {j}",
+                "youtube_url": f"https://youtube.com/watch?v={i}-{j}",
+                "course_id": i + 1,
+            }
+            for i in range(courses)
+            for j in range(lessons)
+        ],
+    )
+    session.commit()
+    session.close()
+
+
+def measure(label, func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        size = len(func())
+        timings.append((time.perf_counter() - started) * 1000)
+    print(
+        f"{label:<32} median {statistics.median(timings):8.2f} ms"
+        f"   min {min(timings):8.2f} ms   {size / 1024:8.1f} KiB"
+    )
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--lessons", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    db.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine, query_cls=Query)
+    seed(session_factory, args.courses, args.lessons)
+
+    app = Flask(__name__)
+    stdlib = DefaultJSONProvider(app)
+    fast = get_json_provider_class("auto")(app)
+    orm_service = CourseService(session_factory, Course, Lesson)
+    core_service = CourseService(
+        session_factory, Course, Lesson, fast_serialization=True
+    )
+
+    print(
+        f"{args.courses} courses x {args.lessons} lessons, "
+        f"fast provider: {type(fast).__name__}"
+    )
+    baseline = measure(
+        "get_all ORM + stdlib json",
+        lambda: stdlib.dumps(orm_service.get_all()),
+        args.repeat,
+    )
+    measure(
+        "get_all ORM + fast json",
+        lambda: fast.dumps(orm_service.get_all()),
+        args.repeat,
+    )
+    optimized = measure(
+        "get_all Core rows + fast json",
+        lambda: fast.dumps(core_service.get_all()),
+        args.repeat,
+    )
+    measure(
+        "paginated(50) ORM + stdlib json",
+        lambda: stdlib.dumps(orm_service.get_all_paginated(1, 50)),
+        args.repeat,
+    )
+    measure(
+        "paginated(50) Core + fast json",
+        lambda: fast.dumps(core_service.get_all_paginated(1, 50)),
+        args.repeat,
+    )
+    print(f"get_all speedup: {baseline / optimized:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
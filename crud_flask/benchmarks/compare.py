@@ -0,0 +1,52 @@
+"""Compare two bench_api result files endpoint by endpoint.
+
+Usage: python -m benchmarks.compare baseline.json candidate.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+
+def load(path: Path) -> dict:
+    report = json.loads(path.read_text())
+    return report["meta"], {
+        (result["mode"], result["endpoint"]): result for result in report["results"]
+    }
+
+
+def change(before: float, after: float) -> str:
+    if not before:
+        return "     n/a"
+    return f"{(after - before) / before * 100:+7.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("candidate", type=Path)
+    args = parser.parse_args()
+
+    base_meta, baseline = load(args.baseline)
+    cand_meta, candidate = load(args.candidate)
+    print(
+        f"baseline  {(base_meta['commit'] or 'unknown')[:8]}  "
+        f"{base_meta['dialect']} {base_meta['courses']} courses"
+    )
+    print(
+        f"candidate {(cand_meta['commit'] or 'unknown')[:8]}  "
+        f"{cand_meta['dialect']} {cand_meta['courses']} courses"
+    )
+    print(f"{'mode':<6} {'endpoint':<28} {'req/s':>9} {'p50':>9} {'p99':>9}")
+    for key in sorted(baseline.keys() & candidate.keys()):
+        before, after = baseline[key], candidate[key]
+        print(
+            f"{key[0]:<6} {key[1]:<28} "
+            f"{change(before['throughput_rps'], after['throughput_rps']):>9} "
+            f"{change(before['latency_ms']['p50'], after['latency_ms']['p50']):>9} "
+            f"{change(before['latency_ms']['p99'], after['latency_ms']['p99']):>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,164 @@
-import os
+from typing import Type, Union
 from flask import Flask
 from flask_cors import CORS
 from flask_migrate import Migrate
+from crud_flask.cli import init_cli
+from crud_flask.compression import ResponseCompressor, init_compression
+from crud_flask.config import Config, get_config
+from crud_flask.json_provider import get_json_provider_class
+from crud_flask.metrics import RequestMetrics, init_request_metrics, instrument_queries
+from crud_flask.pool import engine_options_for, instrument_pool, warm_up_pool
+from crud_flask.replicas import (
+    PIN_HEADER,
+    REPLICA_BIND_PREFIX,
+    ReplicaRouter,
+    init_replica_routing,
+    replica_binds,
+)
 from crud_flask.routes.course_routes import CourseRoutes
+from crud_flask.routes.health_routes import HealthRoutes
+from crud_flask.routes.lesson_routes import LessonRoutes
+from crud_flask.routes.metrics_routes import MetricsRoutes
 from crud_flask.services.course_service import CourseService
+from crud_flask.services.lesson_service import LessonService
+from crud_flask.services.search import include_object
+from crud_flask.services.query_cache import CachedCourseService, create_cache_backend
 from crud_flask.models.models import Course, Lesson, db
-from dotenv import load_dotenv
 
-load_dotenv()
+migrate = Migrate(db=db, include_object=include_object)
 
-app = Flask(__name__)
 
-app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "dev")
-app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv("SQLALCHEMY_DATABASE_URI")
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = (
-    os.getenv("SQLALCHEMY_TRACK_MODIFICATIONS", "True").lower() == "true"
-)
-app.config["SQLALCHEMY_ECHO"] = os.getenv("SQLALCHEMY_ECHO", "True").lower() == "true"
+def create_app(config: Union[str, Type[Config], None] = None) -> Flask:
+    app = Flask(__name__)
+    app.config.from_object(get_config(config))
 
-cors_origins = os.getenv("CORS_ORIGINS", "*")
-CORS(app, origins=cors_origins.split(","))
+    app.json = get_json_provider_class(app.config["JSON_PROVIDER"])(app)
 
-db.init_app(app)
-Migrate(app, db)
+    CORS(
+        app,
+        origins=app.config["CORS_ORIGINS"].split(","),
+        expose_headers=[PIN_HEADER],
+    )
+
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = engine_options_for(
+        app.config["SQLALCHEMY_DATABASE_URI"],
+        app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),
+    )
+    app.config["SQLALCHEMY_BINDS"] = {
+        **app.config.get("SQLALCHEMY_BINDS", {}),
+        **replica_binds(app.config["SQLALCHEMY_REPLICA_URIS"]),
+    }
+    db.init_app(app)
+    migrate.init_app(app)
 
-with app.app_context():
+    with app.app_context():
+        app.extensions["pool_metrics"] = {
+            key or "default": instrument_pool(engine)
+            for key, engine in db.engines.items()
+        }
+        if app.config["METRICS_ENABLED"]:
+            for engine in db.engines.values():
+                instrument_queries(engine)
+        replica_router = ReplicaRouter(
+            lambda: db.session,
+            {
+                key: engine
+                for key, engine in db.engines.items()
+                if key and key.startswith(REPLICA_BIND_PREFIX)
+            },
+            health_check_interval=app.config["DB_REPLICA_HEALTH_INTERVAL"],
+            pin_seconds=app.config["DB_READ_YOUR_WRITES_SECONDS"],
+        )
+    init_replica_routing(app, replica_router)
+    app.extensions["replica_router"] = replica_router
 
     def get_db_session():
         return db.session
 
     course_service = CourseService(
+        session_factory=get_db_session,
+        read_session_factory=replica_router.session,
+        course_model=Course,
+        lesson_model=Lesson,
+        lesson_loading=app.config["COURSE_LESSON_LOADING"],
+        count_mode=app.config["COURSE_COUNT_MODE"],
+        count_cache_ttl=app.config["COURSE_COUNT_CACHE_TTL"],
+        estimate_threshold=app.config["COURSE_COUNT_ESTIMATE_THRESHOLD"],
+        fast_serialization=app.config["COURSE_FAST_SERIALIZATION"],
+    )
+
+    if app.config["COURSE_CACHE_BACKEND"] != "none":
+        course_service = CachedCourseService(
+            course_service,
+            create_cache_backend(
+                app.config["COURSE_CACHE_BACKEND"],
+                maxsize=app.config["COURSE_CACHE_MAXSIZE"],
+                ttl=app.config["COURSE_CACHE_TTL"],
+                redis_url=app.config["REDIS_URL"],
+            ),
+            pin_seconds=replica_router.pin_seconds,
+            served_by_replica=replica_router.served_by_replica,
+        )
+        app.extensions["course_cache"] = course_service
+
+    lesson_service = LessonService(
         session_factory=get_db_session,
         course_model=Course,
         lesson_model=Lesson,
+        on_change=(
+            app.extensions["course_cache"].invalidate
+            if "course_cache" in app.extensions
+            else None
+        ),
     )
 
+    app.extensions["course_service"] = course_service
+    app.extensions["lesson_service"] = lesson_service
     course_routes = CourseRoutes(course_service)
     app.register_blueprint(course_routes.bp)
+    app.register_blueprint(LessonRoutes(lesson_service).bp)
+    app.register_blueprint(HealthRoutes(db).bp)
+    init_cli(app)
+
+    if app.config["METRICS_ENABLED"]:
+        request_metrics = RequestMetrics()
+        init_request_metrics(app, request_metrics)
+        app.extensions["request_metrics"] = request_metrics
+        app.register_blueprint(MetricsRoutes(request_metrics).bp)
+
+    if app.config["COMPRESSION_ENABLED"]:
+        compressor = ResponseCompressor(
+            encodings=[
+                encoding.strip()
+                for encoding in app.config["COMPRESSION_ENCODINGS"].split(",")
+                if encoding.strip()
+            ],
+            levels={
+                "gzip": app.config["COMPRESSION_GZIP_LEVEL"],
+                "br": app.config["COMPRESSION_BR_LEVEL"],
+                "zstd": app.config["COMPRESSION_ZSTD_LEVEL"],
+            },
+            min_size=app.config["COMPRESSION_MIN_SIZE"],
+            stream_flush_size=app.config["COMPRESSION_STREAM_FLUSH_SIZE"],
+        )
+        init_compression(app, compressor)
+        app.extensions["compression"] = compressor
+
+    return app
+
+
+def dispose_engines(app: Flask) -> None:
+    """Drop pooled connections inherited from a parent process after fork."""
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
+
+
+def warm_up_pools(app: Flask) -> int:
+    """Open DB_POOL_WARMUP connections per engine before taking traffic."""
+    size = app.config["DB_POOL_WARMUP"]
+    if size <= 0:
+        return 0
 
-if __name__ == "__main__":
-    app.run(debug=True)
+    with app.app_context():
+        return sum(warm_up_pool(engine, size) for engine in db.engines.values())
@@ -0,0 +1,66 @@
+import click
+from flask import Flask, current_app
+from flask.cli import AppGroup
+
+from crud_flask.models.models import db
+from crud_flask.services.search import rebuild_search_index
+from crud_flask.services.stats import (
+    course_stats_drift,
+    install_course_stats,
+    rebuild_course_stats,
+)
+
+course_stats_cli = AppGroup("course-stats", help="Maintain the course_stats table.")
+search_cli = AppGroup("search", help="Maintain the course search index.")
+
+
+def _invalidate_caches(app: Flask) -> None:
+    if "course_cache" in app.extensions:
+        app.extensions["course_cache"].invalidate()
+
+
+@course_stats_cli.command("rebuild")
+def rebuild() -> None:
+    """Recount course_stats from courses and lessons and reinstall its triggers."""
+    install_course_stats(db.session, force=True)
+    db.session.commit()
+    _invalidate_caches(current_app)
+    click.echo("course_stats rebuilt")
+
+
+@course_stats_cli.command("check")
+@click.option("--fix", is_flag=True, help="Rebuild the table when it drifted.")
+def check(fix: bool) -> None:
+    """Compare course_stats with a full recount; exits 1 on drift."""
+    drift = course_stats_drift(db.session)
+    if not drift:
+        click.echo("course_stats is in sync")
+        return
+
+    for row in drift:
+        click.echo(
+            f"{row['category']}/{row['status']}: "
+            f"courses {row['courses']['stored']} != {row['courses']['actual']}, "
+            f"lessons {row['lessons']['stored']} != {row['lessons']['actual']}"
+        )
+    if not fix:
+        raise SystemExit(1)
+
+    rows = rebuild_course_stats(db.session)
+    db.session.commit()
+    _invalidate_caches(current_app)
+    click.echo(f"course_stats rebuilt ({rows} rows)")
+
+
+@search_cli.command("rebuild")
+def rebuild_search() -> None:
+    """Reindex every course; on SQLite also reinstall the FTS5 table and triggers."""
+    rebuild_search_index(db.session)
+    db.session.commit()
+    _invalidate_caches(current_app)
+    click.echo("search index rebuilt")
+
+
+def init_cli(app: Flask) -> None:
+    app.cli.add_command(course_stats_cli)
+    app.cli.add_command(search_cli)
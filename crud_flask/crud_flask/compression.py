@@ -0,0 +1,191 @@
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from flask import Flask, Response, request
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/plain",
+    "text/html",
+    "text/csv",
+)
+
+
+class GzipCompressor:
+
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+# Content-Encoding token -> (module needed, compressor class)
+CODECS: Dict[str, tuple] = {
+    "zstd": (zstandard, ZstdCompressor),
+    "br": (brotli, BrotliCompressor),
+    "gzip": (True, GzipCompressor),
+}
+
+
+def available_encodings(names: Iterable[str]) -> List[str]:
+    encodings = []
+    for name in names:
+        if name not in CODECS:
+            raise ValueError(
+                f"Invalid compression encoding '{name}', expected any of {list(CODECS)}"
+            )
+        if CODECS[name][0] is not None:
+            encodings.append(name)
+    return encodings
+
+
+def compress(encoding: str, level: int, data: bytes) -> bytes:
+    compressor = CODECS[encoding][1](level)
+    return compressor.compress(data) + compressor.finish()
+
+
+def is_compressible(mimetype: Optional[str]) -> bool:
+    if not mimetype:
+        return False
+    return mimetype in COMPRESSIBLE_MIMETYPES or mimetype.endswith("+json")
+
+
+class ResponseCompressor:
+    """Negotiates Accept-Encoding and compresses responses after each request.
+
+    Buffered bodies below ``min_size`` (or that would not shrink) go out as is;
+    streamed bodies are compressed chunk by chunk and flushed after the first
+    chunk and then every ``stream_flush_size`` input bytes, so clients keep
+    receiving data while the stream is produced. ETags are weakened on any
+    negotiated response because they identify the course version, not bytes.
+    """
+
+    def __init__(
+        self,
+        encodings: Iterable[str] = ("zstd", "br", "gzip"),
+        levels: Optional[Dict[str, int]] = None,
+        min_size: int = 1024,
+        stream_flush_size: int = 16 * 1024,
+    ):
+        self.encodings = available_encodings(encodings)
+        self.levels = {"zstd": 3, "br": 4, "gzip": 6, **(levels or {})}
+        self.min_size = min_size
+        self.stream_flush_size = stream_flush_size
+
+    def negotiate(self) -> Optional[str]:
+        accept = request.accept_encodings
+        best, best_quality = None, 0.0
+        for encoding in self.encodings:
+            quality = accept.quality(encoding)
+            if quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def _compressor(self, encoding: str) -> Any:
+        return CODECS[encoding][1](self.levels[encoding])
+
+    def _stream(self, encoding: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        compressor = self._compressor(encoding)
+        pending, flushed_once = 0, False
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            pending += len(chunk)
+            if not flushed_once or pending >= self.stream_flush_size:
+                data += compressor.flush()
+                pending, flushed_once = 0, True
+            if data:
+                yield data
+        yield compressor.finish()
+
+    def __call__(self, response: Response) -> Response:
+        if response.status_code == 304:
+            if self.negotiate() is not None:
+                self._weaken_etag(response)
+            return response
+
+        if (
+            response.status_code < 200
+            or response.status_code == 204
+            or response.direct_passthrough
+            or "Content-Encoding" in response.headers
+            or not is_compressible(response.mimetype)
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        encoding = self.negotiate()
+        if encoding is None or request.method == "HEAD":
+            return response
+
+        if response.is_streamed:
+            response.response = self._stream(encoding, response.iter_encoded())
+            response.headers.pop("Content-Length", None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            compressed = compress(encoding, self.levels[encoding], data)
+            if len(compressed) >= len(data):
+                return response
+            response.set_data(compressed)
+
+        response.headers["Content-Encoding"] = encoding
+        self._weaken_etag(response)
+        return response
+
+    def _weaken_etag(self, response: Response) -> None:
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+
+def init_compression(app: Flask, compressor: ResponseCompressor) -> None:
+    app.after_request(compressor)
@@ -0,0 +1,91 @@
+import os
+from typing import Type, Union
+from dotenv import load_dotenv
+from crud_flask.pool import engine_options_from_env
+
+load_dotenv()
+
+
+def env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, str(default)).lower() == "true"
+
+
+class Config:
+    SECRET_KEY = os.getenv("SECRET_KEY", "dev")
+    SQLALCHEMY_DATABASE_URI = os.getenv("SQLALCHEMY_DATABASE_URI")
+    SQLALCHEMY_TRACK_MODIFICATIONS = env_bool("SQLALCHEMY_TRACK_MODIFICATIONS", True)
+    SQLALCHEMY_ECHO = env_bool("SQLALCHEMY_ECHO", True)
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options_from_env()
+    DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", "0"))
+    SQLALCHEMY_REPLICA_URIS = [
+        uri.strip()
+        for uri in os.getenv("SQLALCHEMY_REPLICA_URIS", "").split(",")
+        if uri.strip()
+    ]
+    DB_REPLICA_HEALTH_INTERVAL = float(os.getenv("DB_REPLICA_HEALTH_INTERVAL", "5"))
+    DB_READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+    CORS_ORIGINS = os.getenv("CORS_ORIGINS", "*")
+    COURSE_LESSON_LOADING = os.getenv("COURSE_LESSON_LOADING", "selectin")
+    COURSE_COUNT_MODE = os.getenv("COURSE_COUNT_MODE", "exact")
+    COURSE_COUNT_CACHE_TTL = float(os.getenv("COURSE_COUNT_CACHE_TTL", "30"))
+    COURSE_COUNT_ESTIMATE_THRESHOLD = int(
+        os.getenv("COURSE_COUNT_ESTIMATE_THRESHOLD", "100000")
+    )
+    COURSE_FAST_SERIALIZATION = env_bool("COURSE_FAST_SERIALIZATION", False)
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto")
+    COURSE_CACHE_BACKEND = os.getenv("COURSE_CACHE_BACKEND", "none")
+    COURSE_CACHE_TTL = float(os.getenv("COURSE_CACHE_TTL", "60"))
+    COURSE_CACHE_MAXSIZE = int(os.getenv("COURSE_CACHE_MAXSIZE", "1024"))
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+    METRICS_ENABLED = env_bool("METRICS_ENABLED", True)
+    COMPRESSION_ENABLED = env_bool("COMPRESSION_ENABLED", True)
+    COMPRESSION_ENCODINGS = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip")
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_STREAM_FLUSH_SIZE = int(
+        os.getenv("COMPRESSION_STREAM_FLUSH_SIZE", "16384")
+    )
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+    COMPRESSION_BR_LEVEL = int(os.getenv("COMPRESSION_BR_LEVEL", "4"))
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+
+class DevelopmentConfig(Config):
+    DEBUG = True
+
+
+class ProductionConfig(Config):
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ECHO = False
+    SQLALCHEMY_ENGINE_OPTIONS = engine_options_from_env(
+        pool_pre_ping=True, pool_recycle=1800
+    )
+
+
+class TestingConfig(Config):
+    TESTING = True
+    SECRET_KEY = "test_secret_key"
+    SQLALCHEMY_DATABASE_URI = os.getenv("TEST_DB_URI", "sqlite:///:memory:")
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ECHO = False
+    DB_POOL_WARMUP = 0
+    SQLALCHEMY_REPLICA_URIS = []
+    COURSE_CACHE_BACKEND = "none"
+
+
+CONFIGS = {
+    "development": DevelopmentConfig,
+    "production": ProductionConfig,
+    "testing": TestingConfig,
+}
+
+
+def get_config(config: Union[str, Type[Config], None] = None) -> Type[Config]:
+    if config is None:
+        config = os.getenv("APP_CONFIG", "development")
+    if not isinstance(config, str):
+        return config
+    if config not in CONFIGS:
+        raise ValueError(
+            f"Invalid config profile '{config}', expected one of {sorted(CONFIGS)}"
+        )
+    return CONFIGS[config]
@@ -0,0 +1,83 @@
+from typing import Any, Type
+from flask import Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+class OrjsonProvider(DefaultJSONProvider):
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.dumps_bytes(obj).decode()
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(obj)
+        return self._app.response_class(
+            self.dumps_bytes(obj) + b"\n", mimetype=self.mimetype
+        )
+
+
+class MsgspecProvider(DefaultJSONProvider):
+
+    def __init__(self, app: Any):
+        super().__init__(app)
+        self.encoder = msgspec.json.Encoder(
+            enc_hook=self.default, order="sorted" if self.sort_keys else None
+        )
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self.encoder.encode(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return msgspec.json.decode(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(obj)
+        return self._app.response_class(
+            self.encoder.encode(obj) + b"\n", mimetype=self.mimetype
+        )
+
+
+def get_json_provider_class(name: str = "auto") -> Type[JSONProvider]:
+    if name == "auto":
+        if orjson is not None:
+            return OrjsonProvider
+        if msgspec is not None:
+            return MsgspecProvider
+        return DefaultJSONProvider
+
+    providers = {
+        "orjson": (orjson, OrjsonProvider),
+        "msgspec": (msgspec, MsgspecProvider),
+        "stdlib": (True, DefaultJSONProvider),
+    }
+    if name not in providers:
+        raise ValueError(
+            f"Invalid JSON provider '{name}', expected auto or one of {list(providers)}"
+        )
+
+    module, provider = providers[name]
+    if module is None:
+        raise RuntimeError(f"JSON_PROVIDER={name} requires the '{name}' package")
+    return provider
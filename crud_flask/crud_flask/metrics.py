@@ -0,0 +1,191 @@
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items())
+
+
+class RequestMetrics:
+    """Latency histograms and SQL totals per route, rendered for Prometheus."""
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self.latency: Dict[Tuple[str, str, str], List] = {}
+        self.queries: Dict[Tuple[str, str], List] = {}
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        seconds: float,
+        db_queries: int,
+        db_seconds: float,
+    ) -> None:
+        with self._lock:
+            histogram = self.latency.setdefault(
+                (method, route, str(status)), [[0] * len(self.buckets), 0.0, 0]
+            )
+            for index, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    histogram[0][index] += 1
+                    break
+            histogram[1] += seconds
+            histogram[2] += 1
+
+            totals = self.queries.setdefault((method, route), [0, 0.0])
+            totals[0] += db_queries
+            totals[1] += db_seconds
+
+    def render(self) -> List[str]:
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route and status.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (method, route, status), (counts, total, count) in sorted(
+                self.latency.items()
+            ):
+                labels = _labels(method=method, route=route, status=status)
+                cumulative = 0
+                for bound, bucket in zip(self.buckets, counts):
+                    cumulative += bucket
+                    lines.append(
+                        f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} '
+                        f"{cumulative}"
+                    )
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {count}'
+                )
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {total}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {count}")
+
+            lines.extend(
+                [
+                    "# HELP http_request_db_queries_total SQL statements by route.",
+                    "# TYPE http_request_db_queries_total counter",
+                ]
+            )
+            for (method, route), (queries, _) in sorted(self.queries.items()):
+                labels = _labels(method=method, route=route)
+                lines.append(f"http_request_db_queries_total{{{labels}}} {queries}")
+
+            lines.extend(
+                [
+                    "# HELP http_request_db_seconds_total Time spent in SQL by route.",
+                    "# TYPE http_request_db_seconds_total counter",
+                ]
+            )
+            for (method, route), (_, seconds) in sorted(self.queries.items()):
+                labels = _labels(method=method, route=route)
+                lines.append(f"http_request_db_seconds_total{{{labels}}} {seconds}")
+        return lines
+
+
+POOL_SERIES = {
+    "connects": ("db_pool_connects_total", "counter"),
+    "checkouts": ("db_pool_checkouts_total", "counter"),
+    "checkins": ("db_pool_checkins_total", "counter"),
+    "overflowCheckouts": ("db_pool_overflow_checkouts_total", "counter"),
+    "invalidations": ("db_pool_invalidations_total", "counter"),
+    "softInvalidations": ("db_pool_soft_invalidations_total", "counter"),
+    "timeouts": ("db_pool_checkout_timeouts_total", "counter"),
+    "waitSecondsTotal": ("db_pool_checkout_wait_seconds_total", "counter"),
+    "waitSecondsMax": ("db_pool_checkout_wait_seconds_max", "gauge"),
+    "size": ("db_pool_size", "gauge"),
+    "checkedIn": ("db_pool_checked_in", "gauge"),
+    "checkedOut": ("db_pool_checked_out", "gauge"),
+    "overflow": ("db_pool_overflow", "gauge"),
+}
+
+CACHE_SERIES = {
+    "hits": ("course_cache_hits_total", "counter"),
+    "misses": ("course_cache_misses_total", "counter"),
+    "evictions": ("course_cache_evictions_total", "counter"),
+    "invalidations": ("course_cache_invalidations_total", "counter"),
+    "size": ("course_cache_size", "gauge"),
+}
+
+
+def render_stats(
+    series: Dict[str, Tuple[str, str]], stats: Dict[str, Dict[str, float]]
+) -> List[str]:
+    """Render ``{label value: stats dict}`` snapshots as Prometheus samples."""
+    lines = []
+    for key, (name, kind) in series.items():
+        samples = [
+            (label, values[key]) for label, values in stats.items() if key in values
+        ]
+        if not samples:
+            continue
+        lines.append(f"# TYPE {name} {kind}")
+        for label, value in samples:
+            lines.append(f"{name}{{{label}}} {value}")
+    return lines
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Count statements and SQL time into the current request's ``g``."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, many):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, many):
+        elapsed = time.perf_counter() - conn.info["query_started_at"].pop()
+        if has_request_context():
+            g.db_queries = g.get("db_queries", 0) + 1
+            g.db_seconds = g.get("db_seconds", 0.0) + elapsed
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(context):
+        connection = context.connection
+        if connection is not None and connection.info.get("query_started_at"):
+            connection.info["query_started_at"].pop()
+
+
+def init_request_metrics(app: Flask, metrics: RequestMetrics) -> None:
+    @app.before_request
+    def start_timer():
+        g.request_started_at = time.perf_counter()
+        g.db_queries = 0
+        g.db_seconds = 0.0
+
+    @app.after_request
+    def record_request(response: Response) -> Response:
+        started_at = g.get("request_started_at")
+        if started_at is None:
+            return response
+
+        elapsed = time.perf_counter() - started_at
+        db_queries = g.get("db_queries", 0)
+        db_seconds = g.get("db_seconds", 0.0)
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe(
+            request.method,
+            route,
+            response.status_code,
+            elapsed,
+            db_queries,
+            db_seconds,
+        )
+        response.headers.add(
+            "Server-Timing",
+            f'db;dur={db_seconds * 1000:.2f};desc="{db_queries} queries", '
+            f"total;dur={elapsed * 1000:.2f}",
+        )
+        return response
@@ -1,6 +1,16 @@
 from typing import List
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import DateTime, Integer, String, Enum, ForeignKey, func
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    Enum,
+    ForeignKey,
+    Index,
+    event,
+    func,
+)
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Mapped, relationship, mapped_column
 import enum
 from datetime import datetime
@@ -8,6 +18,15 @@ from datetime import datetime
 db = SQLAlchemy()
 
 
+@event.listens_for(Engine, "connect")
+def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+    # SQLite ignores ON DELETE CASCADE unless foreign keys are enabled per connection
+    if "sqlite" in type(dbapi_connection).__module__:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 class Category(enum.Enum):
     BACKEND = "Backend"
     FRONTEND = "Frontend"
@@ -19,8 +38,29 @@ class Status(enum.Enum):
     INACTIVE = "Inactive"
 
 
+COURSE_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "category",
+    "status",
+    "created_at",
+    "updated_at",
+)
+
+LESSON_FIELDS = (
+    "id",
+    "name",
+    "youtube_url",
+    "created_at",
+    "updated_at",
+    "course_id",
+)
+
+
 class Lesson(db.Model):
     __tablename__ = "lessons"
+    __table_args__ = (Index("ix_lessons_course_id_id", "course_id", "id"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -32,7 +72,7 @@ class Lesson(db.Model):
         DateTime, nullable=False, default=func.now(), onupdate=func.now()
     )
     course_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("courses.id"), nullable=False
+        Integer, ForeignKey("courses.id", ondelete="CASCADE"), nullable=False
     )
 
     def to_dict(self):
@@ -48,6 +88,19 @@ class Lesson(db.Model):
 
 class Course(db.Model):
     __tablename__ = "courses"
+    __table_args__ = (
+        Index("ix_courses_created_at_id", "created_at", "id"),
+        Index("ix_courses_updated_at_id", "updated_at", "id"),
+        Index("ix_courses_name_id", "name", "id"),
+        Index("ix_courses_category_created_at_id", "category", "created_at", "id"),
+        Index(
+            "ix_courses_status_category_created_at_id",
+            "status",
+            "category",
+            "created_at",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -62,18 +115,40 @@ class Course(db.Model):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=func.now(), onupdate=func.now()
     )
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
     lessons: Mapped[List[Lesson]] = relationship(
-        "Lesson", backref="course", lazy=True, cascade="all, delete-orphan"
+        "Lesson",
+        backref="course",
+        lazy=True,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "name": self.name,
-            "description": self.description,
-            "category": self.category.value,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "lessons": [lesson.to_dict() for lesson in self.lessons],
-        }
+    def to_dict(self, fields=None, include_lessons=True):
+        data = {}
+        for field in fields or COURSE_FIELDS:
+            value = getattr(self, field)
+            if isinstance(value, enum.Enum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            data[field] = value
+
+        if include_lessons:
+            data["lessons"] = [lesson.to_dict() for lesson in self.lessons]
+        return data
+
+
+class CourseStats(db.Model):
+    __tablename__ = "course_stats"
+
+    category: Mapped[Category] = mapped_column(Enum(Category), primary_key=True)
+    status: Mapped[Status] = mapped_column(Enum(Status), primary_key=True)
+    course_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    lesson_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
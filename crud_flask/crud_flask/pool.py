@@ -0,0 +1,181 @@
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
+
+POOL_OPTIONS = {
+    "pool_size": ("DB_POOL_SIZE", int),
+    "max_overflow": ("DB_MAX_OVERFLOW", int),
+    "pool_timeout": ("DB_POOL_TIMEOUT", float),
+    "pool_recycle": ("DB_POOL_RECYCLE", int),
+    "pool_use_lifo": ("DB_POOL_USE_LIFO", lambda value: value.lower() == "true"),
+}
+
+QUEUE_POOL_OPTIONS = (
+    "poolclass",
+    "pool_size",
+    "max_overflow",
+    "pool_timeout",
+    "pool_use_lifo",
+)
+
+
+def engine_options_from_env(**defaults: Any) -> Dict[str, Any]:
+    """Build SQLALCHEMY_ENGINE_OPTIONS from DB_POOL_* variables.
+
+    Only variables that are set are passed on. The result does not depend on the
+    database URI; ``engine_options_for`` drops what a given URI cannot take.
+    """
+    options: Dict[str, Any] = {"poolclass": InstrumentedQueuePool, **defaults}
+    for option, (name, parse) in POOL_OPTIONS.items():
+        value = os.getenv(name)
+        if value is not None:
+            options[option] = parse(value)
+
+    pre_ping = os.getenv("DB_POOL_PRE_PING")
+    if pre_ping is not None:
+        options["pool_pre_ping"] = pre_ping.lower() == "true"
+    return options
+
+
+def engine_options_for(uri: Optional[str], options: Dict[str, Any]) -> Dict[str, Any]:
+    """Drop queue-only options for in-memory SQLite.
+
+    Flask-SQLAlchemy runs in-memory SQLite on a StaticPool, and ``create_engine``
+    rejects ``pool_size`` and friends for it.
+    """
+    if not uri:
+        return options
+    url = make_url(uri)
+    if url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+        return options
+    return {
+        option: value
+        for option, value in options.items()
+        if option not in QUEUE_POOL_OPTIONS
+    }
+
+
+class PoolMetrics:
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.overflow_checkouts = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.timeouts = 0
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def incr(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def observe_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        pool = self.engine.pool
+        with self._lock:
+            stats = {
+                "pool": type(pool).__name__,
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "overflowCheckouts": self.overflow_checkouts,
+                "invalidations": self.invalidations,
+                "softInvalidations": self.soft_invalidations,
+                "timeouts": self.timeouts,
+                "waitSecondsTotal": self.wait_seconds_total,
+                "waitSecondsMax": self.wait_seconds_max,
+                "waitSecondsAvg": (
+                    self.wait_seconds_total / self.waits if self.waits else 0.0
+                ),
+            }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                {
+                    "size": pool.size(),
+                    "checkedIn": pool.checkedin(),
+                    "checkedOut": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return stats
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that reports how long each checkout waited for a connection."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            if self.metrics is not None:
+                self.metrics.incr("timeouts")
+            raise
+        finally:
+            if self.metrics is not None:
+                self.metrics.observe_wait(time.perf_counter() - start)
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def instrument_pool(engine: Engine) -> PoolMetrics:
+    metrics = PoolMetrics(engine)
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        metrics.incr("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.incr("checkouts")
+        if isinstance(engine.pool, QueuePool) and engine.pool.overflow() > 0:
+            metrics.incr("overflow_checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        metrics.incr("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def on_soft_invalidate(dbapi_connection, connection_record, exception):
+        metrics.incr("soft_invalidations")
+
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.metrics = metrics
+    return metrics
+
+
+def warm_up_pool(engine: Engine, size: int) -> int:
+    """Open ``size`` connections at once and hand them back to the pool."""
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.raw_connection())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
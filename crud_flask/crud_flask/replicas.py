@@ -0,0 +1,147 @@
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import Flask, Response, g, has_request_context, request
+from flask_sqlalchemy.query import Query
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+REPLICA_BIND_PREFIX = "replica_"
+PIN_COOKIE = "db_primary_until"
+# Cross-origin clients without credentials echo this header instead of the cookie
+PIN_HEADER = "X-DB-Primary-Until"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def replica_binds(uris: List[str]) -> Dict[str, str]:
+    return {f"{REPLICA_BIND_PREFIX}{index}": uri for index, uri in enumerate(uris)}
+
+
+class ReplicaHealth:
+
+    def __init__(self):
+        self.healthy = True
+        self.checked_at: Optional[float] = None
+        self.failures = 0
+        self.error: Optional[str] = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"healthy": self.healthy, "failures": self.failures, "error": self.error}
+
+
+class ReplicaRouter:
+    """Hands out read sessions on a healthy replica, writes stay on the primary.
+
+    Replicas are tried round-robin and probed with ``SELECT 1`` at most once per
+    ``health_check_interval``; when none answers, reads fall back to the primary.
+    Within a request every read uses the same replica, and write requests plus
+    any request carrying a fresh PIN_COOKIE (or PIN_HEADER) read from the
+    primary, so a client sees its own writes for ``pin_seconds`` despite
+    replication lag.
+    """
+
+    def __init__(
+        self,
+        primary_session_factory: Callable[[], Session],
+        replicas: Dict[str, Engine],
+        health_check_interval: float = 5.0,
+        pin_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.primary_session_factory = primary_session_factory
+        self.replicas: List[Tuple[str, Engine]] = list(replicas.items())
+        self.health_check_interval = health_check_interval
+        self.pin_seconds = pin_seconds
+        self.clock = clock
+        self.health = {name: ReplicaHealth() for name, _ in self.replicas}
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def _is_healthy(self, name: str, engine: Engine) -> bool:
+        health = self.health[name]
+        now = self.clock()
+        if (
+            health.checked_at is not None
+            and now - health.checked_at < self.health_check_interval
+        ):
+            return health.healthy
+
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+            health.healthy, health.error = True, None
+        except Exception as e:
+            health.healthy, health.error = False, str(e)
+            health.failures += 1
+        health.checked_at = now
+        return health.healthy
+
+    def choose(self) -> Optional[Tuple[str, Engine]]:
+        with self._lock:
+            start = self._next
+            self._next = (start + 1) % max(len(self.replicas), 1)
+
+        for offset in range(len(self.replicas)):
+            name, engine = self.replicas[(start + offset) % len(self.replicas)]
+            if self._is_healthy(name, engine):
+                return name, engine
+        return None
+
+    def pinned(self) -> bool:
+        if not has_request_context():
+            return False
+        if request.method not in SAFE_METHODS:
+            return True
+
+        now = time.time()
+        for value in (request.headers.get(PIN_HEADER), request.cookies.get(PIN_COOKIE)):
+            try:
+                # Values beyond one pin window were not issued by pin()
+                if now < float(value or 0) <= now + self.pin_seconds:
+                    return True
+            except ValueError:
+                continue
+        return False
+
+    def served_by_replica(self) -> bool:
+        return has_request_context() and g.get("db_replica") is not None
+
+    def _request_replica(self) -> Optional[Tuple[str, Engine]]:
+        if not has_request_context():
+            return self.choose()
+        if "db_replica" not in g:
+            g.db_replica = self.choose()
+        return g.db_replica
+
+    def session(self) -> Session:
+        if not self.replicas or self.pinned():
+            return self.primary_session_factory()
+
+        replica = self._request_replica()
+        if replica is None:
+            return self.primary_session_factory()
+        return Session(bind=replica[1], query_cls=Query)
+
+    def pin(self, response: Response) -> Response:
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            until = str(time.time() + self.pin_seconds)
+            response.set_cookie(
+                PIN_COOKIE,
+                until,
+                max_age=math.ceil(self.pin_seconds),
+                httponly=True,
+                samesite="Lax",
+            )
+            response.headers[PIN_HEADER] = until
+        return response
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {name: health.snapshot() for name, health in self.health.items()}
+
+
+def init_replica_routing(app: Flask, router: ReplicaRouter) -> None:
+    if router.replicas and router.pin_seconds > 0:
+        app.after_request(router.pin)
@@ -1,6 +1,14 @@
-from typing import Tuple
-from flask import Blueprint, request, jsonify, Response
-from ..services.course_service import CourseService
+from typing import Iterator, List, Optional, Tuple
+from flask import (
+    Blueprint,
+    current_app,
+    request,
+    jsonify,
+    Response,
+    stream_with_context,
+)
+from ..models.models import COURSE_FIELDS
+from ..services.course_service import CourseService, VersionConflict, tag_versions
 
 
 class CourseRoutes:
@@ -13,24 +21,170 @@ class CourseRoutes:
     def _register_routes(self):
         self.bp.route("", methods=["GET"])(self.get_all)
         self.bp.route("/paginated", methods=["GET"])(self.get_all_paginated)
+        self.bp.route("/export", methods=["GET"])(self.export)
+        self.bp.route("/search", methods=["GET"])(self.search)
+        self.bp.route("/stats", methods=["GET"])(self.get_stats)
         self.bp.route("/<int:id>", methods=["GET"])(self.get_by_id)
         self.bp.route("", methods=["POST"])(self.create)
+        self.bp.route("/bulk", methods=["POST"])(self.bulk_create)
         self.bp.route("/<int:id>", methods=["PUT"])(self.update)
+        self.bp.route("/<int:id>", methods=["PATCH"])(self.patch)
         self.bp.route("/<int:id>", methods=["DELETE"])(self.delete_by_id)
+        self.bp.route("", methods=["DELETE"])(self.delete_many)
+
+    def _projection(self) -> dict:
+        fields = request.args.get("fields")
+        include = request.args.get("include")
+        projection = {}
+
+        if fields is not None:
+            projection["fields"] = [
+                field.strip() for field in fields.split(",") if field.strip()
+            ]
+            invalid = set(projection["fields"]) - set(COURSE_FIELDS)
+            if invalid or not projection["fields"]:
+                raise ValueError(f"Invalid fields {sorted(invalid)}")
+            projection["include_lessons"] = False
+
+        if include is not None:
+            includes = {item.strip() for item in include.split(",") if item.strip()}
+            if includes - {"lessons"}:
+                raise ValueError(f"Invalid include {sorted(includes - {'lessons'})}")
+            projection["include_lessons"] = "lessons" in includes
+
+        return projection
+
+    def _not_modified(self, etag: str) -> Optional[Response]:
+        if not request.if_none_match.contains_weak(etag):
+            return None
+
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+
+    def _expected_versions(self, id: int) -> Optional[List[int]]:
+        if not request.if_match or request.if_match.star_tag:
+            return None
+
+        # Weak comparison: compressed responses carry the same tag as W/"..."
+        return tag_versions(id, request.if_match.as_set(include_weak=True))
+
+    def _precondition_failed(self) -> Tuple[Response, int]:
+        return jsonify({"error": "Course was modified by another request"}), 412
+
+    def _conditional(self, response: Response) -> Response:
+        # Tag the listing that was actually built: no extra query, and a page
+        # served from the course cache stays free of database round trips
+        response.add_etag()
+        return response.make_conditional(request)
+
+    def _with_etag(self, response: Response, etag: Optional[str]) -> Response:
+        if etag is not None:
+            response.set_etag(etag)
+        return response
 
     def get_all(self) -> Response:
-        return jsonify(self.course_service.get_all())
+        try:
+            projection = self._projection()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        return self._conditional(jsonify(self.course_service.get_all(**projection)))
 
     def get_all_paginated(self) -> Response:
+        try:
+            projection = self._projection()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         try:
             page = int(request.args.get("page", 1))
             per_page = int(request.args.get("per_page", 10))
-            return jsonify(self.course_service.get_all_paginated(page, per_page))
+            query = {
+                **projection,
+                "category": request.args.get("category"),
+                "status": request.args.get("status"),
+                "sort": request.args.get("sort", "created_at"),
+                "order": request.args.get("order", "asc"),
+            }
+            if "after" in request.args or "before" in request.args:
+                result = self.course_service.get_page_by_cursor(
+                    per_page,
+                    after=request.args.get("after"),
+                    before=request.args.get("before"),
+                    **query,
+                )
+            else:
+                result = self.course_service.get_all_paginated(page, per_page, **query)
         except ValueError:
             return jsonify({"error": "Invalid pagination parameters"}), 400
 
+        return self._conditional(jsonify(result))
+
+    def search(self) -> Response:
+        try:
+            page = int(request.args.get("page", 1))
+            per_page = int(request.args.get("per_page", 10))
+            return jsonify(
+                self.course_service.search(
+                    request.args.get("q", ""), page, per_page, **self._projection()
+                )
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+    def get_stats(self) -> Response:
+        return jsonify(self.course_service.get_stats())
+
+    def export(self) -> Response:
+        export_format = request.args.get("format", "ndjson")
+        if export_format not in ("ndjson", "json"):
+            return (
+                jsonify({"error": f"Unsupported export format '{export_format}'"}),
+                400,
+            )
+
+        try:
+            projection = self._projection()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        courses = self.course_service.iter_all(**projection)
+        if export_format == "ndjson":
+            body, mimetype = self._ndjson_lines(courses), "application/x-ndjson"
+        else:
+            body, mimetype = self._json_array_chunks(courses), "application/json"
+
+        return Response(stream_with_context(body), mimetype=mimetype)
+
+    def _ndjson_lines(self, courses: Iterator[dict]) -> Iterator[str]:
+        for course in courses:
+            yield current_app.json.dumps(course) + "\n"
+
+    def _json_array_chunks(self, courses: Iterator[dict]) -> Iterator[str]:
+        yield "["
+        for index, course in enumerate(courses):
+            yield ("," if index else "") + current_app.json.dumps(course)
+        yield "]"
+
     def get_by_id(self, id: int) -> Response:
-        return jsonify(self.course_service.get_by_id(id))
+        try:
+            projection = self._projection()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        tagged = self.course_service.get_tagged_by_id(
+            id,
+            projection=request.query_string.decode() if projection else None,
+            **projection,
+        )
+        if tagged is None:
+            return jsonify({"error": f"Course with ID {id} not found"}), 404
+
+        not_modified = self._not_modified(tagged["etag"])
+        if not_modified is not None:
+            return not_modified
+        return self._with_etag(jsonify(tagged["course"]), tagged["etag"])
 
     def create(self) -> Response:
         try:
@@ -39,16 +193,80 @@ class CourseRoutes:
         except Exception as e:
             return jsonify({"error": str(e)}), 400
 
+    def bulk_create(self) -> Response:
+        mode = request.args.get("mode", "atomic")
+        if mode not in ("atomic", "partial"):
+            return jsonify({"error": f"Invalid bulk mode '{mode}'"}), 400
+
+        data = request.get_json(silent=True)
+        if not isinstance(data, list):
+            return jsonify({"error": "Expected a JSON array of courses"}), 400
+
+        try:
+            result = self.course_service.bulk_create(data, atomic=mode == "atomic")
+        except Exception as e:
+            return jsonify({"error": str(e)}), 400
+
+        if not result["failed"]:
+            return jsonify(result), 201
+        if not result["created"]:
+            return jsonify(result), 400
+        return jsonify(result), 207
+
     def update(self, id: int) -> Response:
         try:
             data = request.get_json()
-            return jsonify(self.course_service.update(id, data))
+            response = jsonify(
+                self.course_service.update(id, data, self._expected_versions(id))
+            )
+            return self._with_etag(response, self.course_service.get_version_tag(id))
+        except VersionConflict:
+            return self._precondition_failed()
         except Exception as e:
             return jsonify({"error": str(e)}), 400
 
+    def patch(self, id: int) -> Response:
+        try:
+            patched = self.course_service.patch(
+                id, request.get_json(silent=True), self._expected_versions(id)
+            )
+        except VersionConflict:
+            return self._precondition_failed()
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+        if patched is None:
+            return jsonify({"error": f"Course with ID {id} not found"}), 404
+        course, etag = patched
+        return self._with_etag(jsonify(course), etag)
+
     def delete_by_id(self, id: int) -> Response:
         try:
-            self.course_service.delete_by_id(id)
+            self.course_service.delete_by_id(id, self._expected_versions(id))
             return jsonify({"message": "Course deleted"}), 200
+        except VersionConflict:
+            return self._precondition_failed()
         except Exception as e:
             return jsonify({"error": str(e)}), 400
+
+    def delete_many(self) -> Response:
+        try:
+            ids = [
+                int(id) for id in request.args.get("ids", "").split(",") if id.strip()
+            ]
+        except ValueError:
+            return (
+                jsonify({"error": "ids must be a comma-separated list of integers"}),
+                400,
+            )
+
+        try:
+            result = self.course_service.delete_many(ids)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+
+        return jsonify(result), 200
@@ -0,0 +1,43 @@
+from flask import Blueprint, current_app, jsonify
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+
+
+class HealthRoutes:
+
+    def __init__(self, db: SQLAlchemy):
+        self.db = db
+        self.bp = Blueprint("health", __name__, url_prefix="/health")
+        self._register_routes()
+
+    def _register_routes(self):
+        self.bp.route("/db", methods=["GET"])(self.database)
+
+    def database(self):
+        error = None
+        try:
+            with self.db.engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except Exception as e:
+            error = str(e)
+
+        pools = {
+            name: metrics.snapshot()
+            for name, metrics in current_app.extensions.get("pool_metrics", {}).items()
+        }
+        router = current_app.extensions.get("replica_router")
+        replicas = router.snapshot() if router is not None else {}
+        if error is not None:
+            return (
+                jsonify(
+                    {
+                        "status": "unavailable",
+                        "error": error,
+                        "pools": pools,
+                        "replicas": replicas,
+                    }
+                ),
+                503,
+            )
+
+        return jsonify({"status": "ok", "pools": pools, "replicas": replicas}), 200
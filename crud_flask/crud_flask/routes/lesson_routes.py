@@ -0,0 +1,78 @@
+from flask import Blueprint, request, jsonify, Response
+from ..services.lesson_service import LessonService
+
+
+class LessonRoutes:
+
+    def __init__(self, lesson_service: LessonService):
+        self.lesson_service = lesson_service
+        self.bp = Blueprint(
+            "lessons", __name__, url_prefix="/api/courses/<int:course_id>/lessons"
+        )
+        self._register_routes()
+
+    def _register_routes(self):
+        self.bp.route("", methods=["GET"])(self.get_page)
+        self.bp.route("", methods=["POST"])(self.create)
+        self.bp.route("/<int:lesson_id>", methods=["GET"])(self.get_by_id)
+        self.bp.route("/<int:lesson_id>", methods=["PUT"])(self.update)
+        self.bp.route("/<int:lesson_id>", methods=["DELETE"])(self.delete_by_id)
+
+    def _course_not_found(self, course_id: int) -> Response:
+        return jsonify({"error": f"Course with ID {course_id} not found"}), 404
+
+    def _lesson_not_found(self, course_id: int, lesson_id: int) -> Response:
+        return (
+            jsonify(
+                {"error": f"Lesson with ID {lesson_id} not found in course {course_id}"}
+            ),
+            404,
+        )
+
+    def get_page(self, course_id: int) -> Response:
+        try:
+            per_page = int(request.args.get("per_page", 20))
+            page = self.lesson_service.get_page(
+                course_id, per_page, after=request.args.get("after")
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if page is None:
+            return self._course_not_found(course_id)
+        return jsonify(page)
+
+    def get_by_id(self, course_id: int, lesson_id: int) -> Response:
+        lesson = self.lesson_service.get_by_id(course_id, lesson_id)
+        if lesson is None:
+            return self._lesson_not_found(course_id, lesson_id)
+        return jsonify(lesson)
+
+    def create(self, course_id: int) -> Response:
+        try:
+            lesson = self.lesson_service.create(
+                course_id, request.get_json(silent=True)
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if lesson is None:
+            return self._course_not_found(course_id)
+        return jsonify(lesson), 201
+
+    def update(self, course_id: int, lesson_id: int) -> Response:
+        try:
+            lesson = self.lesson_service.update(
+                course_id, lesson_id, request.get_json(silent=True)
+            )
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        if lesson is None:
+            return self._lesson_not_found(course_id, lesson_id)
+        return jsonify(lesson)
+
+    def delete_by_id(self, course_id: int, lesson_id: int) -> Response:
+        if not self.lesson_service.delete_by_id(course_id, lesson_id):
+            return self._lesson_not_found(course_id, lesson_id)
+        return jsonify({"message": "Lesson deleted"}), 200
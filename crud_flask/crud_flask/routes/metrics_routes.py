@@ -0,0 +1,33 @@
+from flask import Blueprint, Response, current_app
+from ..metrics import CACHE_SERIES, POOL_SERIES, RequestMetrics, render_stats
+
+
+class MetricsRoutes:
+
+    def __init__(self, request_metrics: RequestMetrics):
+        self.request_metrics = request_metrics
+        self.bp = Blueprint("metrics", __name__)
+        self._register_routes()
+
+    def _register_routes(self):
+        self.bp.route("/metrics", methods=["GET"])(self.metrics)
+
+    def metrics(self):
+        lines = self.request_metrics.render()
+
+        pools = current_app.extensions.get("pool_metrics", {})
+        lines.extend(
+            render_stats(
+                POOL_SERIES,
+                {f'pool="{name}"': pool.snapshot() for name, pool in pools.items()},
+            )
+        )
+
+        cache = current_app.extensions.get("course_cache")
+        if cache is not None:
+            lines.extend(render_stats(CACHE_SERIES, {'cache="course"': cache.stats()}))
+
+        return Response(
+            "\n".join(lines) + "\n",
+            mimetype="text/plain; version=0.0.4",
+        )
@@ -0,0 +1,171 @@
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from flask_sqlalchemy.query import Query
+from sqlalchemy import select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session, selectinload
+
+from crud_flask.models.models import Course, Lesson
+from crud_flask.services.course_service import CourseService
+
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def async_database_uri(database_uri: str) -> str:
+    url = make_url(database_uri)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(
+            f"No async driver for '{backend}', expected one of {sorted(ASYNC_DRIVERS)}"
+        )
+    return url.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(
+        hide_password=False
+    )
+
+
+class AsyncCourseService:
+    """Awaitable counterpart of CourseService on ``sqlalchemy.ext.asyncio``.
+
+    Every call opens an AsyncSession and runs the matching CourseService method
+    against its sync session with ``run_sync``, so validation, queries and
+    serialization are shared while the driver I/O stays on the event loop.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker,
+        course_model: Course,
+        lesson_model: Lesson,
+        **options: Any,
+    ):
+        self.session_factory = session_factory
+        self.course_model = course_model
+        self.lesson_model = lesson_model
+        self._session: ContextVar[Session] = ContextVar("course_session")
+        self.service = CourseService(
+            session_factory=self._session.get,
+            course_model=course_model,
+            lesson_model=lesson_model,
+            **options,
+        )
+
+    @property
+    def count_cache(self):
+        return self.service.count_cache
+
+    async def _run(self, method: Callable, *args: Any, **kwargs: Any) -> Any:
+        def call(session: Session) -> Any:
+            token = self._session.set(session)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._session.reset(token)
+
+        async with self.session_factory() as session:
+            return await session.run_sync(call)
+
+    async def get_all(
+        self, fields: Optional[List[str]] = None, include_lessons: bool = True
+    ) -> List[Dict[str, Any]]:
+        return await self._run(self.service.get_all, fields, include_lessons)
+
+    async def iter_all(
+        self,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        options = self.service._projection_options(
+            fields,
+            include_lessons,
+            lesson_options=[selectinload(self.course_model.lessons)],
+        )
+        try:
+            async with self.session_factory() as session:
+                courses = await session.stream_scalars(
+                    select(self.course_model)
+                    .options(*options)
+                    .order_by(self.course_model.id)
+                    .execution_options(yield_per=batch_size)
+                )
+                async for course in courses:
+                    yield course.to_dict(fields, include_lessons)
+        except Exception as e:
+            raise Exception(f"Error exporting courses: {e}")
+
+    async def get_all_paginated(self, page: int, per_page: int, **kwargs: Any):
+        return await self._run(self.service.get_all_paginated, page, per_page, **kwargs)
+
+    async def get_page_by_cursor(self, per_page: int, **kwargs: Any):
+        return await self._run(self.service.get_page_by_cursor, per_page, **kwargs)
+
+    async def search(self, q: str, **kwargs: Any) -> Dict[str, Any]:
+        return await self._run(self.service.search, q, **kwargs)
+
+    async def get_by_id(self, id: int, **kwargs: Any) -> Dict[str, Any]:
+        return await self._run(self.service.get_by_id, id, **kwargs)
+
+    async def get_tagged_by_id(
+        self, id: int, **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        return await self._run(self.service.get_tagged_by_id, id, **kwargs)
+
+    async def get_version_tag(self, id: int) -> Optional[str]:
+        return await self._run(self.service.get_version_tag, id)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return await self._run(self.service.get_stats)
+
+    async def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self._run(self.service.create, data)
+
+    async def bulk_create(
+        self, items: List[Dict[str, Any]], atomic: bool = True
+    ) -> Dict[str, Any]:
+        return await self._run(self.service.bulk_create, items, atomic)
+
+    async def update(
+        self,
+        id: int,
+        data: Dict[str, Any],
+        expected_versions: Optional[List[int]] = None,
+    ) -> Dict[str, Any]:
+        return await self._run(self.service.update, id, data, expected_versions)
+
+    async def patch(
+        self,
+        id: int,
+        data: Dict[str, Any],
+        expected_versions: Optional[List[int]] = None,
+    ) -> Optional[Tuple[Dict[str, Any], str]]:
+        return await self._run(self.service.patch, id, data, expected_versions)
+
+    async def delete_by_id(
+        self, id: int, expected_versions: Optional[List[int]] = None
+    ) -> bool:
+        return await self._run(self.service.delete_by_id, id, expected_versions)
+
+    async def delete_many(self, ids: List[int]) -> Dict[str, List[int]]:
+        return await self._run(self.service.delete_many, ids)
+
+
+def create_async_course_service(
+    database_uri: str, engine_options: Optional[Dict[str, Any]] = None, **options: Any
+) -> AsyncCourseService:
+    engine: AsyncEngine = create_async_engine(
+        async_database_uri(database_uri), **(engine_options or {})
+    )
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=True, query_cls=Query
+    )
+    return AsyncCourseService(session_factory, Course, Lesson, **options)
@@ -0,0 +1,33 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+
+class TotalCountCache:
+
+    def __init__(self, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: Dict[Hashable, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable = ()) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                return None
+
+            return value
+
+    def set(self, value: int, key: Hashable = ()) -> None:
+        with self._lock:
+            self._entries[key] = (value, self.clock() + self.ttl)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
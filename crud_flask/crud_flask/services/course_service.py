@@ -1,18 +1,219 @@
+import hashlib
 import math
-from typing import Any, Dict, List
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    String,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    text,
+    tuple_,
+    update,
+    values,
+)
+from sqlalchemy.orm import (
+    Query,
+    Session,
+    joinedload,
+    load_only,
+    noload,
+    selectinload,
+)
 
-from crud_flask.models.models import Category, Course, Lesson, Status
+from crud_flask.models.models import (
+    COURSE_FIELDS,
+    LESSON_FIELDS,
+    Category,
+    Course,
+    CourseStats,
+    Lesson,
+    Status,
+)
+from crud_flask.services.count_cache import TotalCountCache
+from crud_flask.services.cursor import decode_cursor, encode_cursor
+from crud_flask.services.search import search_course_ids
+from crud_flask.services.serializers import course_rows_to_dicts, rows_to_dicts
+from crud_flask.services.stats import summarize_course_stats
+
+LESSON_LOADING_STRATEGIES = {
+    "selectin": selectinload,
+    "joined": joinedload,
+    "none": None,
+}
+
+COUNT_MODES = ("exact", "cached", "estimated")
+
+SORT_FIELDS = ("id", "name", "created_at", "updated_at")
+
+MAX_DELETE_IDS = 1000
+
+MAX_BULK_ITEMS = 1000
+
+PATCH_FIELDS = ("name", "description", "category", "status")
+
+
+class VersionConflict(Exception):
+    """The course exists but no longer has any of the expected versions."""
+
+
+def version_tag(id: int, version: int, projection: Optional[str] = None) -> str:
+    """``<id>-<version>``, plus ``;<projection>`` for a sparse representation."""
+    tag = f"{id}-{version}"
+    if projection:
+        tag += ";" + hashlib.sha1(projection.encode()).hexdigest()[:16]
+    return tag
+
+
+def tag_versions(id: int, tags: Iterable[str]) -> List[int]:
+    """Versions of course ``id`` named by ``version_tag`` strings; others are skipped."""
+    versions = []
+    for tag in tags:
+        # Any projection of a version is a precondition on that version
+        tag_id, _, version = tag.partition(";")[0].partition("-")
+        if tag_id == str(id) and version.isdigit():
+            versions.append(int(version))
+    return versions
 
 
 class CourseService:
 
     def __init__(
-        self, session_factory: Session, course_model: Course, lesson_model: Lesson
+        self,
+        session_factory: Session,
+        course_model: Course,
+        lesson_model: Lesson,
+        lesson_loading: str = "selectin",
+        count_mode: str = "exact",
+        count_cache_ttl: float = 30.0,
+        estimate_threshold: int = 100_000,
+        fast_serialization: bool = False,
+        read_session_factory: Optional[Session] = None,
     ):
+        if lesson_loading not in LESSON_LOADING_STRATEGIES:
+            raise ValueError(
+                f"Invalid lesson loading strategy '{lesson_loading}', "
+                f"expected one of {sorted(LESSON_LOADING_STRATEGIES)}"
+            )
+
+        if count_mode not in COUNT_MODES:
+            raise ValueError(
+                f"Invalid count mode '{count_mode}', expected one of {list(COUNT_MODES)}"
+            )
+
         self.session_factory = session_factory
+        self.read_session_factory = read_session_factory or session_factory
         self.course_model = course_model
         self.lesson_model = lesson_model
+        self.lesson_loading = lesson_loading
+        self.count_mode = count_mode
+        self.count_cache = TotalCountCache(ttl=count_cache_ttl)
+        self.estimate_threshold = estimate_threshold
+        self.fast_serialization = fast_serialization
+
+    def _lesson_loader_options(self) -> list:
+        loader = LESSON_LOADING_STRATEGIES[self.lesson_loading]
+        if loader is None:
+            return []
+        return [loader(self.course_model.lessons)]
+
+    def _projection_options(
+        self,
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+        sort_columns: tuple = (),
+        lesson_options: Optional[list] = None,
+    ) -> list:
+        options = []
+        if fields is not None:
+            invalid = [field for field in fields if field not in COURSE_FIELDS]
+            if invalid or not fields:
+                raise ValueError(
+                    f"Invalid fields {invalid}, expected any of {list(COURSE_FIELDS)}"
+                )
+            columns = {getattr(self.course_model, field) for field in fields}
+            options.append(load_only(*columns.union(sort_columns)))
+
+        if not include_lessons:
+            options.append(noload(self.course_model.lessons))
+        elif lesson_options is None:
+            options.extend(self._lesson_loader_options())
+        else:
+            options.extend(lesson_options)
+        return options
+
+    def _course_columns(self, fields: Optional[List[str]] = None) -> tuple:
+        if fields is not None:
+            self._projection_options(fields)
+        keys = ["id"] + [field for field in fields or COURSE_FIELDS if field != "id"]
+        return keys, [getattr(self.course_model, key) for key in keys]
+
+    def _fetch_course_dicts(
+        self,
+        session: Session,
+        statement: Any,
+        keys: List[str],
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+        all_lessons: bool = False,
+    ) -> List[Dict[str, Any]]:
+        course_rows = session.execute(statement).all()
+
+        lesson_rows = []
+        if include_lessons and course_rows:
+            lessons = select(
+                *[getattr(self.lesson_model, key) for key in LESSON_FIELDS]
+            ).order_by(self.lesson_model.id)
+            if not all_lessons:
+                lessons = lessons.where(
+                    self.lesson_model.course_id.in_([row[0] for row in course_rows])
+                )
+            lesson_rows = session.execute(lessons).all()
+
+        courses = course_rows_to_dicts(
+            course_rows, keys, lesson_rows, LESSON_FIELDS, include_lessons
+        )
+        if fields is not None and "id" not in fields:
+            for course in courses:
+                del course["id"]
+        return courses
+
+    def _total_count(
+        self, session: Session, query: Query = None, key: tuple = ()
+    ) -> Tuple[int, bool]:
+        filtered = any(value is not None for value in key)
+        if self.count_mode == "estimated" and not filtered:
+            estimate = self.__estimated_count(session)
+            if estimate is not None and estimate >= self.estimate_threshold:
+                return estimate, False
+
+        if self.count_mode == "cached":
+            cached = self.count_cache.get(key)
+            if cached is not None:
+                return cached, True
+
+        if query is None:
+            query = session.query(self.course_model)
+        total = query.count()
+        if self.count_mode == "cached":
+            self.count_cache.set(total, key)
+        return total, True
+
+    def __estimated_count(self, session: Session) -> Optional[int]:
+        if session.get_bind().dialect.name != "postgresql":
+            return None
+
+        estimate = session.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"),
+            {"t": self.course_model.__tablename__},
+        ).scalar()
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
 
     def __dict_to_course(self, data: dict[str, Any]) -> Course:
         try:
@@ -39,60 +240,471 @@ class CourseService:
         except Exception as e:
             raise Exception(f"Error converting dict to Course: {e}")
 
-    def get_all(self) -> List[Dict[str, Any]]:
+    def __validate_course_payload(
+        self, data: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        if not isinstance(data, dict):
+            raise ValueError("Course payload must be an object")
+
+        name = data.get("name")
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError("Course name is required")
+        if len(name) > 100:
+            raise ValueError("Course name must have at most 100 characters")
+
         try:
-            session: Session = self.session_factory()
-            courses: List[Course] = session.query(self.course_model).all()
-            return [course.to_dict() for course in courses]
+            category = Category[str(data["category"]).upper()]
+        except KeyError:
+            raise ValueError(f"Invalid category '{data.get('category')}'")
+
+        try:
+            status = Status[str(data.get("status", Status.ACTIVE.name)).upper()]
+        except KeyError:
+            raise ValueError(f"Invalid status '{data.get('status')}'")
+
+        description = data.get("description")
+        if description is not None and not isinstance(description, str):
+            raise ValueError("Course description must be a string or null")
+
+        lessons = data.get("lessons") or []
+        if not isinstance(lessons, list):
+            raise ValueError("Course lessons must be an array")
+
+        lesson_rows = []
+        for lesson_data in lessons:
+            if not isinstance(lesson_data, dict):
+                raise ValueError("Lesson payload must be an object")
+            for field in ("name", "youtube_url"):
+                value = lesson_data.get(field)
+                if not isinstance(value, str) or not value.strip():
+                    raise ValueError(f"Lesson {field} is required")
+                if len(value) > 100:
+                    raise ValueError(f"Lesson {field} must have at most 100 characters")
+            lesson_rows.append(
+                {"name": lesson_data["name"], "youtube_url": lesson_data["youtube_url"]}
+            )
+
+        course_row = {
+            "name": name,
+            "description": description,
+            "category": category,
+            "status": status,
+        }
+        return course_row, lesson_rows
+
+    def get_all(
+        self, fields: Optional[List[str]] = None, include_lessons: bool = True
+    ) -> List[Dict[str, Any]]:
+        options = self._projection_options(fields, include_lessons)
+        try:
+            session: Session = self.read_session_factory()
+            if self.fast_serialization:
+                keys, columns = self._course_columns(fields)
+                return self._fetch_course_dicts(
+                    session,
+                    select(*columns),
+                    keys,
+                    fields,
+                    include_lessons,
+                    all_lessons=True,
+                )
+
+            courses: List[Course] = (
+                session.query(self.course_model).options(*options).all()
+            )
+            return [course.to_dict(fields, include_lessons) for course in courses]
         except Exception as e:
             raise Exception(f"Error fetching all courses: {e}")
         finally:
             session.close()
 
-    def get_all_paginated(self, page: int, per_page: int) -> Dict[str, Any]:
+    def iter_all(
+        self,
+        batch_size: int = 1000,
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+    ) -> Iterator[Dict[str, Any]]:
+        options = self._projection_options(
+            fields,
+            include_lessons,
+            lesson_options=[selectinload(self.course_model.lessons)],
+        )
         try:
-            session: Session = self.session_factory()
-            courses: List[Course] = (
+            session: Session = self.read_session_factory()
+            courses = (
                 session.query(self.course_model)
-                .paginate(page=page, per_page=per_page, error_out=False)
-                .items
+                .options(*options)
+                .order_by(self.course_model.id)
+                .yield_per(batch_size)
             )
+            for course in courses:
+                yield course.to_dict(fields, include_lessons)
+        except Exception as e:
+            raise Exception(f"Error exporting courses: {e}")
+        finally:
+            session.close()
+
+    def __course_filters(
+        self, category: Optional[str] = None, status: Optional[str] = None
+    ) -> list:
+        filters = []
+        try:
+            if category:
+                filters.append(self.course_model.category == Category[category.upper()])
+            if status:
+                filters.append(self.course_model.status == Status[status.upper()])
+        except KeyError as e:
+            raise ValueError(f"Invalid filter value {e}")
+        return filters
+
+    def __sort_columns(self, sort: str) -> tuple:
+        if sort not in SORT_FIELDS:
+            raise ValueError(
+                f"Invalid sort field '{sort}', expected one of {list(SORT_FIELDS)}"
+            )
+        if sort == "id":
+            return (self.course_model.id,)
+        return getattr(self.course_model, sort), self.course_model.id
+
+    def __order_by(self, columns: tuple, descending: bool) -> list:
+        return [column.desc() if descending else column.asc() for column in columns]
+
+    def get_all_paginated(
+        self,
+        page: int,
+        per_page: int,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        sort: str = "created_at",
+        order: str = "asc",
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+    ) -> Dict[str, Any]:
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Invalid sort order '{order}'")
+        filters = self.__course_filters(category, status)
+        sort_columns = self.__sort_columns(sort)
+        options = self._projection_options(fields, include_lessons, sort_columns)
+
+        try:
+            session: Session = self.read_session_factory()
+            query = session.query(self.course_model)
+            if filters:
+                query = query.filter(*filters)
+
+            if self.fast_serialization:
+                keys, columns = self._course_columns(fields)
+                data = self._fetch_course_dicts(
+                    session,
+                    select(*columns)
+                    .where(*filters)
+                    .order_by(*self.__order_by(sort_columns, order == "desc"))
+                    .limit(per_page)
+                    .offset((max(page, 1) - 1) * per_page),
+                    keys,
+                    fields,
+                    include_lessons,
+                )
+            else:
+                courses: List[Course] = (
+                    query.options(*options)
+                    .order_by(*self.__order_by(sort_columns, order == "desc"))
+                    .paginate(
+                        page=page, per_page=per_page, error_out=False, count=False
+                    )
+                    .items
+                )
+                data = [course.to_dict(fields, include_lessons) for course in courses]
+
+            total_count, exact = self._total_count(
+                session, query, key=(category, status)
+            )
+            total_pages = math.ceil(total_count / per_page)
             return {
                 "pageIndex": page,
                 "pageSize": per_page,
-                "totalCount": session.query(self.course_model).count(),
-                "totalPages": math.ceil(
-                    session.query(self.course_model).count() / per_page
-                ),
+                "totalCount": total_count,
+                "totalCountExact": exact,
+                "totalPages": total_pages,
                 "canPreviousPage": page > 1,
-                "canNextPage": page
-                < math.ceil(session.query(self.course_model).count() / per_page),
-                "data": [course.to_dict() for course in courses],
+                "canNextPage": page < total_pages,
+                "data": data,
             }
         except Exception as e:
             raise Exception(f"Error fetching paginated courses: {e}")
         finally:
             session.close()
 
-    def get_by_id(self, id: int) -> Dict[str, Any]:
+    def get_page_by_cursor(
+        self,
+        per_page: int,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+        category: Optional[str] = None,
+        status: Optional[str] = None,
+        sort: str = "created_at",
+        order: str = "asc",
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+    ) -> Dict[str, Any]:
+        if per_page < 1:
+            raise ValueError("per_page must be greater than zero")
+        if order not in ("asc", "desc"):
+            raise ValueError(f"Invalid sort order '{order}'")
+        filters = self.__course_filters(category, status)
+        sort_columns = self.__sort_columns(sort)
+        options = self._projection_options(fields, include_lessons, sort_columns)
+
+        backwards = bool(before)
+        cursor = before if backwards else after
+        key = (
+            self.__decode_course_cursor(cursor, sort, order, sort_columns)
+            if cursor
+            else None
+        )
+        descending = (order == "desc") != backwards
+
+        try:
+            session: Session = self.read_session_factory()
+            query = session.query(self.course_model).options(*options)
+            if filters:
+                query = query.filter(*filters)
+
+            if key is not None:
+                sort_key = tuple_(*sort_columns)
+                query = query.filter(sort_key < key if descending else sort_key > key)
+
+            courses: List[Course] = (
+                query.order_by(*self.__order_by(sort_columns, descending))
+                .limit(per_page + 1)
+                .all()
+            )
+            has_more = len(courses) > per_page
+            courses = courses[:per_page]
+            if backwards:
+                courses.reverse()
+
+            if backwards:
+                has_next, has_previous = True, has_more
+            else:
+                has_next, has_previous = has_more, key is not None
+
+            return {
+                "pageSize": per_page,
+                "nextCursor": (
+                    self.__encode_course_cursor(courses[-1], sort, order, sort_columns)
+                    if courses and has_next
+                    else None
+                ),
+                "prevCursor": (
+                    self.__encode_course_cursor(courses[0], sort, order, sort_columns)
+                    if courses and has_previous
+                    else None
+                ),
+                "data": [course.to_dict(fields, include_lessons) for course in courses],
+            }
+        except Exception as e:
+            raise Exception(f"Error fetching courses by cursor: {e}")
+        finally:
+            session.close()
+
+    def __encode_course_cursor(
+        self, course: Course, sort: str, order: str, sort_columns: tuple
+    ) -> str:
+        values = [getattr(course, column.key) for column in sort_columns]
+        return encode_cursor([sort, order, *values])
+
+    def __decode_course_cursor(
+        self, cursor: str, sort: str, order: str, sort_columns: tuple
+    ) -> tuple:
+        cursor_sort, cursor_order, *values = decode_cursor(
+            cursor, size=2 + len(sort_columns)
+        )
+        if (cursor_sort, cursor_order) != (sort, order):
+            raise ValueError(f"Cursor '{cursor}' does not match sort {sort} {order}")
+
+        try:
+            return tuple(
+                (
+                    datetime.fromisoformat(value)
+                    if isinstance(column.type, DateTime)
+                    else column.type.python_type(value)
+                )
+                for column, value in zip(sort_columns, values)
+            )
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid cursor '{cursor}'")
+
+    def search(
+        self,
+        q: str,
+        page: int = 1,
+        per_page: int = 10,
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+    ) -> Dict[str, Any]:
+        if not q or not q.strip():
+            raise ValueError("Search query is required")
+        if page < 1 or per_page < 1:
+            raise ValueError("page and per_page must be greater than zero")
+        options = self._projection_options(fields, include_lessons)
+
         try:
             session: Session = self.session_factory()
-            course: Course = session.query(self.course_model).get(id)
+            ranked, total_count = search_course_ids(
+                session, q, limit=per_page, offset=(page - 1) * per_page
+            )
+            courses: Dict[int, Course] = {}
+            if ranked:
+                courses = {
+                    course.id: course
+                    for course in session.query(self.course_model)
+                    .options(*options)
+                    .filter(self.course_model.id.in_([id for id, _ in ranked]))
+                }
+
+            total_pages = math.ceil(total_count / per_page)
+            return {
+                "pageIndex": page,
+                "pageSize": per_page,
+                "totalCount": total_count,
+                "totalPages": total_pages,
+                "canPreviousPage": page > 1,
+                "canNextPage": page < total_pages,
+                "data": [
+                    {**courses[id].to_dict(fields, include_lessons), "rank": rank}
+                    for id, rank in ranked
+                    if id in courses
+                ],
+            }
+        except Exception as e:
+            session.rollback()
+            raise Exception(f"Error searching courses: {e}")
+        finally:
+            session.close()
+
+    def get_by_id(
+        self,
+        id: int,
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+    ) -> Dict[str, Any]:
+        options = self._projection_options(fields, include_lessons, lesson_options=[])
+        try:
+            session: Session = self.read_session_factory()
+            query = session.query(self.course_model)
+            if options:
+                query = query.options(*options)
+            course: Course = query.get(id)
             if not course:
                 raise Exception(f"Course with ID {id} not found")
 
-            return course.to_dict()
+            return course.to_dict(fields, include_lessons)
+        except Exception as e:
+            raise Exception(f"Error fetching course with ID {id}: {e}")
+        finally:
+            session.close()
+
+    def get_tagged_by_id(
+        self,
+        id: int,
+        fields: Optional[List[str]] = None,
+        include_lessons: bool = True,
+        projection: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """The course and its ETag from one read; None when it does not exist.
+
+        Keeping both in one payload means a cached body can never be served
+        under the tag of a newer version.
+        """
+        options = self._projection_options(
+            fields,
+            include_lessons,
+            sort_columns=(self.course_model.version,),
+            lesson_options=[],
+        )
+        try:
+            session: Session = self.read_session_factory()
+            query = session.query(self.course_model)
+            if options:
+                query = query.options(*options)
+            course: Course = query.get(id)
+            if not course:
+                return None
+
+            return {
+                "course": course.to_dict(fields, include_lessons),
+                "etag": version_tag(id, course.version, projection),
+            }
         except Exception as e:
             raise Exception(f"Error fetching course with ID {id}: {e}")
         finally:
             session.close()
 
+    def get_version_tag(self, id: int) -> Optional[str]:
+        try:
+            session: Session = self.read_session_factory()
+            version = session.execute(
+                select(self.course_model.version).where(self.course_model.id == id)
+            ).scalar()
+            if version is None:
+                return None
+
+            return version_tag(id, version)
+        except Exception as e:
+            raise Exception(f"Error fetching version of course with ID {id}: {e}")
+        finally:
+            session.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        try:
+            session: Session = self.read_session_factory()
+            rows = session.execute(
+                select(
+                    CourseStats.category,
+                    CourseStats.status,
+                    CourseStats.course_count,
+                    CourseStats.lesson_count,
+                )
+            ).all()
+            return summarize_course_stats(rows)
+        except Exception as e:
+            raise Exception(f"Error fetching course stats: {e}")
+        finally:
+            session.close()
+
+    def __exists(self, session: Session, id: int) -> bool:
+        return (
+            session.execute(
+                select(self.course_model.id).where(self.course_model.id == id)
+            ).scalar()
+            is not None
+        )
+
+    def __claim_version(
+        self, session: Session, id: int, expected_versions: List[int]
+    ) -> None:
+        # Compare and bump in one statement, so of two writers holding the
+        # same tag only the first one matches the row
+        result = session.execute(
+            update(self.course_model)
+            .where(
+                self.course_model.id == id,
+                self.course_model.version.in_(expected_versions),
+            )
+            .values(version=self.course_model.version + 1),
+            execution_options={"synchronize_session": False},
+        )
+        if result.rowcount == 0 and self.__exists(session, id):
+            raise VersionConflict(f"Course with ID {id} was modified")
+
     def create(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        session: Session = self.session_factory()
         try:
             course = self.__dict_to_course(data)
-            session: Session = self.session_factory()
             session.add(course)
             session.commit()
+            self.count_cache.invalidate()
             return course.to_dict()
         except Exception as e:
             session.rollback()
@@ -100,14 +712,80 @@ class CourseService:
         finally:
             session.close()
 
-    def update(self, id: int, data: Dict[str, Any]) -> Course:
+    def bulk_create(
+        self, items: List[Dict[str, Any]], atomic: bool = True
+    ) -> Dict[str, Any]:
+        if len(items) > MAX_BULK_ITEMS:
+            raise ValueError(f"At most {MAX_BULK_ITEMS} courses can be created at once")
+
+        results: List[Dict[str, Any]] = []
+        valid: List[Tuple[int, Dict[str, Any], List[Dict[str, Any]]]] = []
+
+        for index, data in enumerate(items):
+            try:
+                course_row, lesson_rows = self.__validate_course_payload(data)
+                valid.append((index, course_row, lesson_rows))
+                results.append({"index": index, "status": "pending"})
+            except ValueError as e:
+                results.append({"index": index, "status": "error", "error": str(e)})
+
+        failed = len(items) - len(valid)
+        if atomic and failed:
+            for index, _, _ in valid:
+                results[index]["status"] = "skipped"
+            return {"created": 0, "failed": failed, "results": results}
+
+        if not valid:
+            return {"created": 0, "failed": failed, "results": results}
+
+        session: Session = self.session_factory()
+        try:
+            course_ids = session.scalars(
+                insert(self.course_model).returning(
+                    self.course_model.id, sort_by_parameter_order=True
+                ),
+                [course_row for _, course_row, _ in valid],
+            ).all()
+
+            lesson_rows = [
+                {**lesson_row, "course_id": course_id}
+                for (_, _, lessons), course_id in zip(valid, course_ids)
+                for lesson_row in lessons
+            ]
+            if lesson_rows:
+                session.execute(insert(self.lesson_model), lesson_rows)
+
+            session.commit()
+            self.count_cache.invalidate()
+        except Exception as e:
+            session.rollback()
+            raise Exception(f"Error bulk creating courses: {e}")
+        finally:
+            session.close()
+
+        for (index, _, _), course_id in zip(valid, course_ids):
+            results[index].update({"status": "created", "id": course_id})
+
+        return {"created": len(valid), "failed": failed, "results": results}
+
+    def update(
+        self,
+        id: int,
+        data: Dict[str, Any],
+        expected_versions: Optional[List[int]] = None,
+    ) -> Course:
         session = self.session_factory()
         try:
+            if expected_versions is not None:
+                self.__claim_version(session, id, expected_versions)
+
             course: Course = session.query(self.course_model).get(id)
             if not course:
                 raise Exception(f"Course with ID {id} not found")
 
-            temp_course: Course = self.__dict_to_course(data)
+            temp_course: Course = self.__dict_to_course(
+                {key: value for key, value in data.items() if key != "lessons"}
+            )
 
             if temp_course.name is not None:
                 course.name = temp_course.name
@@ -121,42 +799,15 @@ class CourseService:
             if temp_course.status is not None:
                 course.status = temp_course.status
 
-            if temp_course.lessons:
-                existing_lessons = {lesson.id: lesson for lesson in course.lessons}
-
-                submitted_lesson_ids = {
-                    lesson.id for lesson in temp_course.lessons if lesson.id is not None
-                }
+            if expected_versions is None:
+                course.version = self.course_model.version + 1
 
-                lesson_ids_to_remove = (
-                    set(existing_lessons.keys()) - submitted_lesson_ids
-                )
-                for lesson_id in lesson_ids_to_remove:
-                    lesson = existing_lessons[lesson_id]
-                    course.lessons.remove(lesson)
-                    session.delete(lesson)
-
-                for temp_lesson in temp_course.lessons:
-                    if (
-                        temp_lesson.id is not None
-                        and temp_lesson.id in existing_lessons
-                    ):
-                        lesson = existing_lessons[temp_lesson.id]
-                        if temp_lesson.name is not None:
-                            lesson.name = temp_lesson.name
-
-                        if temp_lesson.youtube_url is not None:
-                            lesson.youtube_url = temp_lesson.youtube_url
-                    else:
-                        new_lesson = Lesson(
-                            name=temp_lesson.name,
-                            youtube_url=temp_lesson.youtube_url,
-                            course=course,
-                        )
-                        course.lessons.append(new_lesson)
-                        session.add(new_lesson)
+            if data.get("lessons"):
+                self.__sync_lessons(session, id, data["lessons"])
 
             session.commit()
+            if "category" in data or "status" in data:
+                self.count_cache.invalidate()
             return course.to_dict()
         except Exception as e:
             session.rollback()
@@ -164,18 +815,232 @@ class CourseService:
         finally:
             session.close()
 
-    def delete_by_id(self, id: int) -> bool:
+    def __validate_patch(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            raise ValueError("Merge patch must be a JSON object")
+        if "lessons" in data:
+            raise ValueError(
+                "Lessons cannot be patched, use /api/courses/<id>/lessons instead"
+            )
+        invalid = sorted(set(data) - set(PATCH_FIELDS))
+        if invalid:
+            raise ValueError(
+                f"Invalid patch fields {invalid}, expected any of {list(PATCH_FIELDS)}"
+            )
+
+        values: Dict[str, Any] = {}
+        if "name" in data:
+            name = data["name"]
+            if not isinstance(name, str) or not name.strip():
+                raise ValueError("Course name is required")
+            if len(name) > 100:
+                raise ValueError("Course name must have at most 100 characters")
+            values["name"] = name
+
+        if "description" in data:
+            if data["description"] is not None and not isinstance(
+                data["description"], str
+            ):
+                raise ValueError("Course description must be a string or null")
+            values["description"] = data["description"]
+
+        for field, enum in (("category", Category), ("status", Status)):
+            if field in data:
+                try:
+                    values[field] = enum[str(data[field]).upper()]
+                except KeyError:
+                    raise ValueError(f"Invalid {field} '{data[field]}'")
+        return values
+
+    def patch(
+        self,
+        id: int,
+        data: Dict[str, Any],
+        expected_versions: Optional[List[int]] = None,
+    ) -> Optional[Tuple[Dict[str, Any], str]]:
+        values = self.__validate_patch(data)
+        columns = [getattr(self.course_model, field) for field in COURSE_FIELDS]
+        columns.append(self.course_model.version)
+        try:
+            session: Session = self.session_factory()
+            if values:
+                statement = (
+                    update(self.course_model)
+                    .values(**values, version=self.course_model.version + 1)
+                    .returning(*columns)
+                )
+            else:
+                statement = select(*columns)
+            statement = statement.where(self.course_model.id == id)
+            if expected_versions is not None:
+                statement = statement.where(
+                    self.course_model.version.in_(expected_versions)
+                )
+
+            row = session.execute(
+                statement, execution_options={"synchronize_session": False}
+            ).first()
+            if row is None:
+                if expected_versions is not None and self.__exists(session, id):
+                    raise VersionConflict(f"Course with ID {id} was modified")
+                session.rollback()
+                return None
+
+            session.commit()
+            if "category" in values or "status" in values:
+                self.count_cache.invalidate()
+            return rows_to_dicts([row], COURSE_FIELDS)[0], version_tag(id, row.version)
+        except VersionConflict:
+            session.rollback()
+            raise
+        except Exception as e:
+            session.rollback()
+            raise Exception(f"Error patching course with ID {id}: {e}")
+        finally:
+            session.close()
+
+    def __sync_lessons(
+        self, session: Session, course_id: int, lessons: List[Dict[str, Any]]
+    ) -> None:
+        existing_ids = set(
+            session.scalars(
+                select(self.lesson_model.id).where(
+                    self.lesson_model.course_id == course_id
+                )
+            )
+        )
+
+        updated = [lesson for lesson in lessons if lesson.get("id") in existing_ids]
+        created = [lesson for lesson in lessons if lesson.get("id") not in existing_ids]
+        kept_ids = {lesson["id"] for lesson in updated}
+
+        if existing_ids - kept_ids:
+            session.execute(
+                delete(self.lesson_model).where(
+                    self.lesson_model.course_id == course_id,
+                    self.lesson_model.id.not_in(kept_ids),
+                ),
+                execution_options={"synchronize_session": False},
+            )
+
+        updated = [
+            lesson
+            for lesson in updated
+            if lesson.get("name") is not None or lesson.get("youtube_url") is not None
+        ]
+        if updated:
+            self.__bulk_update_lessons(session, updated)
+
+        if created:
+            session.execute(
+                insert(self.lesson_model),
+                [
+                    {
+                        "name": lesson.get("name"),
+                        "youtube_url": lesson.get("youtube_url"),
+                        "course_id": course_id,
+                    }
+                    for lesson in created
+                ],
+            )
+
+    def __bulk_update_lessons(
+        self, session: Session, lessons: List[Dict[str, Any]]
+    ) -> None:
+        if session.get_bind().dialect.name == "postgresql":
+            rows = values(
+                column("id", Integer),
+                column("name", String),
+                column("youtube_url", String),
+                name="lesson_updates",
+            ).data(
+                [
+                    (lesson["id"], lesson.get("name"), lesson.get("youtube_url"))
+                    for lesson in lessons
+                ]
+            )
+            session.execute(
+                update(self.lesson_model)
+                .where(self.lesson_model.id == rows.c.id)
+                .values(
+                    name=func.coalesce(rows.c.name, self.lesson_model.name),
+                    youtube_url=func.coalesce(
+                        rows.c.youtube_url, self.lesson_model.youtube_url
+                    ),
+                ),
+                execution_options={"synchronize_session": False},
+            )
+            return
+
+        session.execute(
+            update(self.lesson_model),
+            [
+                {
+                    key: value
+                    for key, value in lesson.items()
+                    if key in ("id", "name", "youtube_url") and value is not None
+                }
+                for lesson in lessons
+            ],
+        )
+
+    def delete_by_id(
+        self, id: int, expected_versions: Optional[List[int]] = None
+    ) -> bool:
         try:
             session = self.session_factory()
-            course: Course = session.query(self.course_model).get(id)
-            if not course:
+            statement = delete(self.course_model).where(self.course_model.id == id)
+            if expected_versions is not None:
+                statement = statement.where(
+                    self.course_model.version.in_(expected_versions)
+                )
+
+            result = session.execute(
+                statement, execution_options={"synchronize_session": False}
+            )
+            if result.rowcount == 0:
+                if expected_versions is not None and self.__exists(session, id):
+                    raise VersionConflict(f"Course with ID {id} was modified")
                 raise Exception(f"Course with ID {id} not found")
 
-            session.delete(course)
             session.commit()
+            self.count_cache.invalidate()
             return True
+        except VersionConflict:
+            session.rollback()
+            raise
         except Exception as e:
             session.rollback()
             raise Exception(f"Error deleting course with ID {id}: {e}")
         finally:
             session.close()
+
+    def delete_many(self, ids: List[int]) -> Dict[str, List[int]]:
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            raise ValueError("At least one course ID is required")
+        if len(ids) > MAX_DELETE_IDS:
+            raise ValueError(f"At most {MAX_DELETE_IDS} courses can be deleted at once")
+
+        try:
+            session = self.session_factory()
+            deleted = set(
+                session.scalars(
+                    delete(self.course_model)
+                    .where(self.course_model.id.in_(ids))
+                    .returning(self.course_model.id),
+                    execution_options={"synchronize_session": False},
+                )
+            )
+            session.commit()
+            if deleted:
+                self.count_cache.invalidate()
+            return {
+                "deleted": [id for id in ids if id in deleted],
+                "notFound": [id for id in ids if id not in deleted],
+            }
+        except Exception as e:
+            session.rollback()
+            raise Exception(f"Error deleting courses: {e}")
+        finally:
+            session.close()
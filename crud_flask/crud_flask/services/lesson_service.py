@@ -0,0 +1,213 @@
+from typing import Any, Callable, Dict, List, Optional
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from crud_flask.models.models import LESSON_FIELDS, Course, Lesson
+from crud_flask.services.cursor import decode_cursor, encode_cursor
+from crud_flask.services.serializers import rows_to_dicts
+
+MAX_LESSON_PAGE_SIZE = 100
+
+LESSON_WRITE_FIELDS = ("name", "youtube_url")
+
+
+class LessonService:
+    """Lessons of one course, addressed without loading the whole course.
+
+    Reads select plain lesson columns; writes are single statements that also
+    bump the parent course version so course ETags and caches stay honest.
+    Methods return None (or False) when the course or lesson does not exist.
+    """
+
+    def __init__(
+        self,
+        session_factory: Session,
+        course_model: Course,
+        lesson_model: Lesson,
+        on_change: Optional[Callable[[], None]] = None,
+    ):
+        self.session_factory = session_factory
+        self.course_model = course_model
+        self.lesson_model = lesson_model
+        self.on_change = on_change
+
+    def _columns(self) -> List[Any]:
+        return [getattr(self.lesson_model, key) for key in LESSON_FIELDS]
+
+    def _course_exists(self, session: Session, course_id: int) -> bool:
+        return (
+            session.execute(
+                select(self.course_model.id).where(self.course_model.id == course_id)
+            ).scalar()
+            is not None
+        )
+
+    def _touch_course(self, session: Session, course_id: int) -> bool:
+        result = session.execute(
+            update(self.course_model)
+            .where(self.course_model.id == course_id)
+            .values(version=self.course_model.version + 1),
+            execution_options={"synchronize_session": False},
+        )
+        return result.rowcount > 0
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
+
+    def __validate_lesson_payload(
+        self, data: Dict[str, Any], partial: bool = False
+    ) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            raise ValueError("Lesson payload must be an object")
+
+        row = {}
+        for field in LESSON_WRITE_FIELDS:
+            if partial and field not in data:
+                continue
+            value = data.get(field)
+            if not isinstance(value, str) or not value.strip():
+                raise ValueError(f"Lesson {field} is required")
+            if len(value) > 100:
+                raise ValueError(f"Lesson {field} must have at most 100 characters")
+            row[field] = value
+
+        if not row:
+            raise ValueError(f"Lesson payload needs any of {list(LESSON_WRITE_FIELDS)}")
+        return row
+
+    def get_page(
+        self, course_id: int, per_page: int = 20, after: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        if per_page < 1 or per_page > MAX_LESSON_PAGE_SIZE:
+            raise ValueError(f"per_page must be between 1 and {MAX_LESSON_PAGE_SIZE}")
+
+        after_id = None
+        if after:
+            (after_id,) = decode_cursor(after, size=1)
+            if not isinstance(after_id, int):
+                raise ValueError(f"Invalid cursor '{after}'")
+
+        try:
+            session: Session = self.session_factory()
+            query = select(*self._columns()).where(
+                self.lesson_model.course_id == course_id
+            )
+            if after_id is not None:
+                query = query.where(self.lesson_model.id > after_id)
+
+            rows = session.execute(
+                query.order_by(self.lesson_model.id).limit(per_page + 1)
+            ).all()
+            if not rows and not self._course_exists(session, course_id):
+                return None
+
+            has_more = len(rows) > per_page
+            rows = rows[:per_page]
+            return {
+                "pageSize": per_page,
+                "nextCursor": encode_cursor([rows[-1][0]]) if has_more else None,
+                "data": rows_to_dicts(rows, LESSON_FIELDS),
+            }
+        except Exception as e:
+            raise Exception(
+                f"Error fetching lessons of course with ID {course_id}: {e}"
+            )
+        finally:
+            session.close()
+
+    def get_by_id(self, course_id: int, lesson_id: int) -> Optional[Dict[str, Any]]:
+        try:
+            session: Session = self.session_factory()
+            row = session.execute(
+                select(*self._columns()).where(
+                    self.lesson_model.id == lesson_id,
+                    self.lesson_model.course_id == course_id,
+                )
+            ).first()
+            if row is None:
+                return None
+
+            return rows_to_dicts([row], LESSON_FIELDS)[0]
+        except Exception as e:
+            raise Exception(f"Error fetching lesson with ID {lesson_id}: {e}")
+        finally:
+            session.close()
+
+    def create(self, course_id: int, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        row = self.__validate_lesson_payload(data)
+        try:
+            session: Session = self.session_factory()
+            if not self._touch_course(session, course_id):
+                session.rollback()
+                return None
+
+            lesson = session.execute(
+                insert(self.lesson_model)
+                .values(course_id=course_id, **row)
+                .returning(*self._columns())
+            ).one()
+            session.commit()
+            self._changed()
+            return rows_to_dicts([lesson], LESSON_FIELDS)[0]
+        except Exception as e:
+            session.rollback()
+            raise Exception(
+                f"Error creating lesson for course with ID {course_id}: {e}"
+            )
+        finally:
+            session.close()
+
+    def update(
+        self, course_id: int, lesson_id: int, data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        row = self.__validate_lesson_payload(data, partial=True)
+        try:
+            session: Session = self.session_factory()
+            lesson = session.execute(
+                update(self.lesson_model)
+                .where(
+                    self.lesson_model.id == lesson_id,
+                    self.lesson_model.course_id == course_id,
+                )
+                .values(**row)
+                .returning(*self._columns()),
+                execution_options={"synchronize_session": False},
+            ).first()
+            if lesson is None:
+                session.rollback()
+                return None
+
+            self._touch_course(session, course_id)
+            session.commit()
+            self._changed()
+            return rows_to_dicts([lesson], LESSON_FIELDS)[0]
+        except Exception as e:
+            session.rollback()
+            raise Exception(f"Error updating lesson with ID {lesson_id}: {e}")
+        finally:
+            session.close()
+
+    def delete_by_id(self, course_id: int, lesson_id: int) -> bool:
+        try:
+            session: Session = self.session_factory()
+            result = session.execute(
+                delete(self.lesson_model).where(
+                    self.lesson_model.id == lesson_id,
+                    self.lesson_model.course_id == course_id,
+                ),
+                execution_options={"synchronize_session": False},
+            )
+            if result.rowcount == 0:
+                session.rollback()
+                return False
+
+            self._touch_course(session, course_id)
+            session.commit()
+            self._changed()
+            return True
+        except Exception as e:
+            session.rollback()
+            raise Exception(f"Error deleting lesson with ID {lesson_id}: {e}")
+        finally:
+            session.close()
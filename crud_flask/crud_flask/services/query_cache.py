@@ -0,0 +1,211 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_MISSING = object()
+
+
+class LRUCacheBackend:
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+
+            value, expires_at = entry
+            if self.clock() >= expires_at:
+                del self._entries[key]
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (value, self.clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+
+    def __init__(self, client: Any, prefix: str = "courses:", ttl: float = 60.0):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.evictions = 0
+
+    def get(self, key: str) -> Any:
+        value = self.client.get(self.prefix + key)
+        if value is None:
+            return _MISSING
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        self.client.set(self.prefix + key, json.dumps(value), ex=int(self.ttl))
+
+    def get_counter(self, key: str) -> int:
+        return int(self.client.get(self.prefix + key) or 0)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(self.prefix + key))
+
+    def __len__(self) -> int:
+        return 0
+
+
+def create_cache_backend(
+    backend: str,
+    maxsize: int = 1024,
+    ttl: float = 60.0,
+    redis_url: Optional[str] = None,
+):
+    if backend == "memory":
+        return LRUCacheBackend(maxsize=maxsize, ttl=ttl)
+
+    if backend == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "COURSE_CACHE_BACKEND=redis requires the 'redis' package"
+            )
+        return RedisCacheBackend(redis.Redis.from_url(redis_url), ttl=ttl)
+
+    raise ValueError(f"Invalid cache backend '{backend}'")
+
+
+class CachedCourseService:
+
+    GENERATION_KEY = "generation"
+    INVALIDATED_AT_KEY = "invalidated_at"
+    READ_METHODS = (
+        "get_all",
+        "get_all_paginated",
+        "get_page_by_cursor",
+        "get_by_id",
+        "get_tagged_by_id",
+        "search",
+        "get_stats",
+    )
+    WRITE_METHODS = (
+        "create",
+        "bulk_create",
+        "update",
+        "patch",
+        "delete_by_id",
+        "delete_many",
+    )
+
+    def __init__(
+        self,
+        course_service: Any,
+        backend: Any,
+        pin_seconds: float = 0.0,
+        served_by_replica: Optional[Callable[[], bool]] = None,
+    ):
+        self.course_service = course_service
+        self.backend = backend
+        self.pin_seconds = pin_seconds
+        self.served_by_replica = served_by_replica
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.course_service, name)
+        if name in self.READ_METHODS:
+            return self.__cached(name, attribute)
+        if name in self.WRITE_METHODS:
+            return self.__invalidating(attribute)
+        return attribute
+
+    def __cached(self, name: str, method: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            generation = self.backend.get_counter(self.GENERATION_KEY)
+            key = f"{generation}:{name}:" + json.dumps(
+                [args, kwargs], sort_keys=True, default=str
+            )
+
+            value = self.backend.get(key)
+            if value is not _MISSING:
+                self.__count("hits")
+                return value
+
+            self.__count("misses")
+            value = method(*args, **kwargs)
+            if not self.__may_lag():
+                self.backend.set(key, value)
+            return value
+
+        return wrapper
+
+    def __invalidating(self, method: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.invalidate()
+
+        return wrapper
+
+    def __may_lag(self) -> bool:
+        # A replica read right after a write may predate it; caching it under
+        # the new generation would serve it to clients pinned to the primary
+        if self.served_by_replica is None or not self.served_by_replica():
+            return False
+        invalidated_at = self.backend.get(self.INVALIDATED_AT_KEY)
+        return (
+            invalidated_at is not _MISSING
+            and time.time() - invalidated_at < self.pin_seconds
+        )
+
+    def __count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def invalidate(self) -> None:
+        self.backend.set(self.INVALIDATED_AT_KEY, time.time())
+        self.backend.incr(self.GENERATION_KEY)
+        self.__count("invalidations")
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.backend.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self.backend),
+        }
@@ -0,0 +1,175 @@
+from typing import Any, List, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_VECTOR_INDEX = "ix_courses_search_vector"
+SQLITE_SEARCH_TABLE = "courses_fts"
+
+# Lesson triggers recompute the whole lesson column of every course they touch;
+# an UPDATE that moves a lesson refreshes both the old and the new course.
+LESSON_DOCUMENT = f"""
+    UPDATE {SQLITE_SEARCH_TABLE}
+    SET lessons = (
+        SELECT coalesce(group_concat(lessons.name, ' '), '')
+        FROM lessons WHERE lessons.course_id = {SQLITE_SEARCH_TABLE}.course_id
+    )
+    WHERE course_id IN ({{course_ids}})
+"""
+
+SQLITE_SEARCH_TRIGGERS = {
+    "courses_fts_after_insert": (
+        "AFTER INSERT ON courses",
+        f"""
+        INSERT INTO {SQLITE_SEARCH_TABLE} (course_id, name, description, lessons)
+        VALUES (NEW.id, NEW.name, coalesce(NEW.description, ''), '')
+        """,
+    ),
+    "courses_fts_after_update": (
+        "AFTER UPDATE OF name, description ON courses",
+        f"""
+        UPDATE {SQLITE_SEARCH_TABLE}
+        SET name = NEW.name, description = coalesce(NEW.description, '')
+        WHERE course_id = NEW.id
+        """,
+    ),
+    "courses_fts_after_delete": (
+        "AFTER DELETE ON courses",
+        f"DELETE FROM {SQLITE_SEARCH_TABLE} WHERE course_id = OLD.id",
+    ),
+    "lessons_fts_after_insert": (
+        "AFTER INSERT ON lessons",
+        LESSON_DOCUMENT.format(course_ids="NEW.course_id"),
+    ),
+    "lessons_fts_after_update": (
+        "AFTER UPDATE OF name, course_id ON lessons",
+        LESSON_DOCUMENT.format(course_ids="OLD.course_id, NEW.course_id"),
+    ),
+    "lessons_fts_after_delete": (
+        "AFTER DELETE ON lessons",
+        LESSON_DOCUMENT.format(course_ids="OLD.course_id"),
+    ),
+}
+
+SQLITE_SEARCH_DDL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_SEARCH_TABLE}
+    USING fts5(course_id UNINDEXED, name, description, lessons)
+    """,
+    *[
+        statement
+        for name, (timing, body) in SQLITE_SEARCH_TRIGGERS.items()
+        for statement in (
+            f"DROP TRIGGER IF EXISTS {name}",
+            f"CREATE TRIGGER {name} {timing} BEGIN {body}; END",
+        )
+    ],
+]
+
+SQLITE_SEARCH_REBUILD = f"""
+    INSERT INTO {SQLITE_SEARCH_TABLE} (course_id, name, description, lessons)
+    SELECT
+        courses.id,
+        courses.name,
+        coalesce(courses.description, ''),
+        coalesce(
+            (SELECT group_concat(name, ' ') FROM lessons
+             WHERE lessons.course_id = courses.id),
+            ''
+        )
+    FROM courses
+"""
+
+POSTGRES_SEARCH_REBUILD = """
+    UPDATE courses SET search_vector = courses_search_document(id, name, description)
+"""
+
+POSTGRES_SEARCH_QUERY = """
+    SELECT courses.id, ts_rank(courses.search_vector, query) AS rank,
+           count(*) OVER () AS total
+    FROM courses, websearch_to_tsquery('simple', :q) AS query
+    WHERE courses.search_vector @@ query
+    ORDER BY rank DESC, courses.id
+    LIMIT :limit OFFSET :offset
+"""
+
+SQLITE_SEARCH_QUERY = f"""
+    SELECT id, score AS rank, count(*) OVER () AS total
+    FROM (
+        SELECT course_id AS id, -bm25({SQLITE_SEARCH_TABLE}) AS score
+        FROM {SQLITE_SEARCH_TABLE}
+        WHERE {SQLITE_SEARCH_TABLE} MATCH :q
+    )
+    ORDER BY rank DESC, id
+    LIMIT :limit OFFSET :offset
+"""
+
+
+def install_sqlite_search(session: Session, force: bool = False) -> bool:
+    """Create the FTS5 index and its triggers and refill it from scratch.
+
+    Returns True when anything was (re)installed. A missing trigger means
+    writes went unindexed, so the index is rebuilt rather than trusted. The
+    migration installs all of this; ``flask search rebuild`` covers schemas
+    built with ``db.create_all()``.
+    """
+    connection = session.connection()
+    names = ", ".join(f"'{name}'" for name in SQLITE_SEARCH_TRIGGERS)
+    installed = connection.exec_driver_sql(
+        f"SELECT count(*) FROM sqlite_master "
+        f"WHERE type = 'trigger' AND name IN ({names})"
+    ).scalar()
+    if (
+        installed == len(SQLITE_SEARCH_TRIGGERS)
+        and inspect(connection).has_table(SQLITE_SEARCH_TABLE)
+        and not force
+    ):
+        return False
+
+    for statement in SQLITE_SEARCH_DDL:
+        connection.exec_driver_sql(statement)
+    connection.exec_driver_sql(f"DELETE FROM {SQLITE_SEARCH_TABLE}")
+    connection.exec_driver_sql(SQLITE_SEARCH_REBUILD)
+    return True
+
+
+def rebuild_search_index(session: Session) -> None:
+    """Recompute every course's search document from courses and lessons."""
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(text(POSTGRES_SEARCH_REBUILD))
+    else:
+        install_sqlite_search(session, force=True)
+
+
+def sqlite_match_expression(q: str) -> str:
+    return " ".join('"' + term.replace('"', '""') + '"' for term in q.split())
+
+
+def search_course_ids(
+    session: Session, q: str, limit: int, offset: int
+) -> Tuple[List[Tuple[int, float]], int]:
+    if session.get_bind().dialect.name == "postgresql":
+        statement, params = POSTGRES_SEARCH_QUERY, {"q": q}
+    else:
+        statement, params = SQLITE_SEARCH_QUERY, {"q": sqlite_match_expression(q)}
+
+    rows = session.execute(
+        text(statement), {**params, "limit": limit, "offset": offset}
+    ).all()
+    if not rows and offset:
+        _, total = search_course_ids(session, q, limit=1, offset=0)
+        return [], total
+    total = rows[0].total if rows else 0
+    return [(row.id, row.rank) for row in rows], total
+
+
+def include_object(
+    object: Any, name: str, type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    if type_ == "column" and name == SEARCH_VECTOR_COLUMN:
+        return False
+    if type_ == "index" and name == SEARCH_VECTOR_INDEX:
+        return False
+    if type_ == "table" and name.startswith(SQLITE_SEARCH_TABLE):
+        return False
+    return True
@@ -0,0 +1,41 @@
+import enum
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Sequence
+
+
+def _convert(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+# Rows become plain dicts rather than pre-encoded JSON: the course cache, the
+# pagination envelope and field projection all work on dicts, and the JSON
+# provider encodes them in one pass. What is skipped is ORM hydration.
+def rows_to_dicts(rows: Iterable[Sequence[Any]], keys: Sequence[str]) -> List[Dict]:
+    return [{key: _convert(value) for key, value in zip(keys, row)} for row in rows]
+
+
+def course_rows_to_dicts(
+    course_rows: Iterable[Sequence[Any]],
+    course_keys: Sequence[str],
+    lesson_rows: Iterable[Sequence[Any]] = (),
+    lesson_keys: Sequence[str] = (),
+    include_lessons: bool = True,
+) -> List[Dict]:
+    courses = rows_to_dicts(course_rows, course_keys)
+    if not include_lessons:
+        return courses
+
+    course_id_index = list(lesson_keys).index("course_id")
+    lessons_by_course: Dict[int, List[Dict]] = {}
+    for lesson_row in lesson_rows:
+        lessons_by_course.setdefault(lesson_row[course_id_index], []).append(
+            {key: _convert(value) for key, value in zip(lesson_keys, lesson_row)}
+        )
+
+    for course in courses:
+        course["lessons"] = lessons_by_course.get(course["id"], [])
+    return courses
@@ -0,0 +1,280 @@
+from typing import Any, Dict, Iterable, List, Sequence
+from sqlalchemy.orm import Session
+
+from crud_flask.models.models import Category, Status
+
+STATS_TABLE = "course_stats"
+
+# Every trigger adds (category, status, course delta, lesson delta) rows to the
+# summary, so inserts, moves and deletes all share one upsert.
+STATS_UPSERT = f"""
+    INSERT INTO {STATS_TABLE} (category, status, course_count, lesson_count)
+    SELECT category, status, sum(courses), sum(lessons) FROM ({{deltas}}) AS deltas
+    WHERE true
+    GROUP BY category, status
+    ON CONFLICT (category, status) DO UPDATE SET
+        course_count = {STATS_TABLE}.course_count + excluded.course_count,
+        lesson_count = {STATS_TABLE}.lesson_count + excluded.lesson_count
+"""
+
+LESSONS_OF_OLD_COURSE = "(SELECT count(*) FROM lessons WHERE course_id = OLD.id)"
+
+SQLITE_STATS_TRIGGERS = {
+    "course_stats_courses_insert": (
+        "AFTER INSERT ON courses",
+        "SELECT NEW.category AS category, NEW.status AS status, "
+        "1 AS courses, 0 AS lessons",
+    ),
+    "course_stats_courses_update": (
+        "AFTER UPDATE OF category, status ON courses "
+        "WHEN OLD.category IS NOT NEW.category OR OLD.status IS NOT NEW.status",
+        f"SELECT OLD.category AS category, OLD.status AS status, "
+        f"-1 AS courses, -{LESSONS_OF_OLD_COURSE} AS lessons "
+        f"UNION ALL SELECT NEW.category, NEW.status, 1, {LESSONS_OF_OLD_COURSE}",
+    ),
+    # Before the row goes: ON DELETE CASCADE removes the lessons afterwards and
+    # the lesson trigger can no longer find the course they belonged to.
+    "course_stats_courses_delete": (
+        "BEFORE DELETE ON courses",
+        f"SELECT OLD.category AS category, OLD.status AS status, "
+        f"-1 AS courses, -{LESSONS_OF_OLD_COURSE} AS lessons",
+    ),
+    "course_stats_lessons_insert": (
+        "AFTER INSERT ON lessons",
+        "SELECT category, status, 0 AS courses, 1 AS lessons "
+        "FROM courses WHERE id = NEW.course_id",
+    ),
+    "course_stats_lessons_update": (
+        "AFTER UPDATE OF course_id ON lessons "
+        "WHEN OLD.course_id IS NOT NEW.course_id",
+        "SELECT category, status, 0 AS courses, -1 AS lessons "
+        "FROM courses WHERE id = OLD.course_id "
+        "UNION ALL SELECT category, status, 0, 1 FROM courses WHERE id = NEW.course_id",
+    ),
+    "course_stats_lessons_delete": (
+        "AFTER DELETE ON lessons",
+        "SELECT category, status, 0 AS courses, -1 AS lessons "
+        "FROM courses WHERE id = OLD.course_id",
+    ),
+}
+
+SQLITE_STATS_DDL = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {name}
+    {timing} BEGIN
+        {STATS_UPSERT.format(deltas=deltas)};
+    END
+    """
+    for name, (timing, deltas) in SQLITE_STATS_TRIGGERS.items()
+]
+
+# Postgres works per statement on transition tables, so a COPY or a bulk
+# INSERT updates each summary row once instead of once per course.
+POSTGRES_STATS_TRIGGERS = {
+    "course_stats_courses_insert": (
+        "courses",
+        "AFTER INSERT ON courses REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT",
+        "SELECT category, status, count(*) AS courses, 0 AS lessons "
+        "FROM new_rows GROUP BY category, status",
+    ),
+    "course_stats_courses_update": (
+        "courses",
+        "AFTER UPDATE ON courses "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT",
+        """
+        WITH moved AS (
+            SELECT old_rows.category AS old_category, old_rows.status AS old_status,
+                   new_rows.category AS new_category, new_rows.status AS new_status,
+                   (SELECT count(*) FROM lessons
+                    WHERE lessons.course_id = new_rows.id) AS lessons
+            FROM old_rows JOIN new_rows ON new_rows.id = old_rows.id
+            WHERE old_rows.category <> new_rows.category
+               OR old_rows.status <> new_rows.status
+        )
+        SELECT old_category AS category, old_status AS status,
+               -1 AS courses, -lessons AS lessons FROM moved
+        UNION ALL
+        SELECT new_category, new_status, 1, lessons FROM moved
+        """,
+    ),
+    "course_stats_courses_delete": (
+        "courses",
+        "BEFORE DELETE ON courses FOR EACH ROW",
+        f"SELECT OLD.category AS category, OLD.status AS status, "
+        f"-1 AS courses, -{LESSONS_OF_OLD_COURSE} AS lessons",
+    ),
+    "course_stats_lessons_insert": (
+        "lessons",
+        "AFTER INSERT ON lessons REFERENCING NEW TABLE AS new_rows "
+        "FOR EACH STATEMENT",
+        "SELECT courses.category, courses.status, 0 AS courses, count(*) AS lessons "
+        "FROM new_rows JOIN courses ON courses.id = new_rows.course_id "
+        "GROUP BY courses.category, courses.status",
+    ),
+    "course_stats_lessons_update": (
+        "lessons",
+        "AFTER UPDATE ON lessons "
+        "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT",
+        """
+        SELECT courses.category, courses.status, 0 AS courses, -1 AS lessons
+        FROM old_rows
+        JOIN new_rows ON new_rows.id = old_rows.id
+        JOIN courses ON courses.id = old_rows.course_id
+        WHERE old_rows.course_id <> new_rows.course_id
+        UNION ALL
+        SELECT courses.category, courses.status, 0, 1
+        FROM old_rows
+        JOIN new_rows ON new_rows.id = old_rows.id
+        JOIN courses ON courses.id = new_rows.course_id
+        WHERE old_rows.course_id <> new_rows.course_id
+        """,
+    ),
+    "course_stats_lessons_delete": (
+        "lessons",
+        "AFTER DELETE ON lessons REFERENCING OLD TABLE AS old_rows "
+        "FOR EACH STATEMENT",
+        "SELECT courses.category, courses.status, 0 AS courses, -count(*) AS lessons "
+        "FROM old_rows JOIN courses ON courses.id = old_rows.course_id "
+        "GROUP BY courses.category, courses.status",
+    ),
+}
+
+POSTGRES_STATS_DDL = [
+    statement
+    for name, (table, timing, deltas) in POSTGRES_STATS_TRIGGERS.items()
+    for statement in (
+        f"""
+        CREATE OR REPLACE FUNCTION {name}() RETURNS trigger AS $$
+        BEGIN
+            {STATS_UPSERT.format(deltas=deltas)};
+            RETURN {"OLD" if timing.startswith("BEFORE") else "NULL"};
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        f"DROP TRIGGER IF EXISTS {name} ON {table}",
+        f"CREATE TRIGGER {name} {timing} EXECUTE FUNCTION {name}()",
+    )
+]
+
+STATS_FROM_SCRATCH = """
+    SELECT courses.category, courses.status,
+           count(*) AS course_count,
+           coalesce(sum(lesson_counts.lessons), 0) AS lesson_count
+    FROM courses
+    LEFT JOIN (
+        SELECT course_id, count(*) AS lessons FROM lessons GROUP BY course_id
+    ) AS lesson_counts ON lesson_counts.course_id = courses.id
+    GROUP BY courses.category, courses.status
+"""
+
+
+def _trigger_names_query(dialect: str) -> str:
+    names = ", ".join(f"'{name}'" for name in POSTGRES_STATS_TRIGGERS)
+    if dialect == "postgresql":
+        return f"SELECT count(*) FROM pg_trigger WHERE tgname IN ({names})"
+    return (
+        f"SELECT count(*) FROM sqlite_master "
+        f"WHERE type = 'trigger' AND name IN ({names})"
+    )
+
+
+def install_course_stats(session: Session, force: bool = False) -> bool:
+    """Create the summary triggers if missing and fill the table once.
+
+    Returns True when the triggers were (re)installed. Migrations install them
+    up front; this covers schemas built with ``db.create_all()``.
+    """
+    connection = session.connection()
+    dialect = connection.dialect.name
+    installed = connection.exec_driver_sql(_trigger_names_query(dialect)).scalar()
+    if installed == len(SQLITE_STATS_TRIGGERS) and not force:
+        return False
+
+    for statement in (
+        POSTGRES_STATS_DDL if dialect == "postgresql" else SQLITE_STATS_DDL
+    ):
+        connection.exec_driver_sql(statement)
+    rebuild_course_stats(session)
+    return True
+
+
+def rebuild_course_stats(session: Session) -> int:
+    connection = session.connection()
+    if connection.dialect.name == "postgresql":
+        # Block writers so the recount and the triggers cannot interleave
+        connection.exec_driver_sql(
+            f"LOCK TABLE courses, lessons, {STATS_TABLE} IN SHARE ROW EXCLUSIVE MODE"
+        )
+    connection.exec_driver_sql(f"DELETE FROM {STATS_TABLE}")
+    return connection.exec_driver_sql(
+        f"INSERT INTO {STATS_TABLE} (category, status, course_count, lesson_count) "
+        f"{STATS_FROM_SCRATCH}"
+    ).rowcount
+
+
+def _counts(rows: Iterable[Sequence[Any]]) -> Dict[tuple, tuple]:
+    return {
+        (str(category), str(status)): (int(courses), int(lessons))
+        for category, status, courses, lessons in rows
+    }
+
+
+def course_stats_drift(session: Session) -> List[Dict[str, Any]]:
+    """Compare the summary table with a full recount; empty when in sync."""
+    connection = session.connection()
+    expected = _counts(connection.exec_driver_sql(STATS_FROM_SCRATCH))
+    stored = _counts(
+        connection.exec_driver_sql(
+            f"SELECT category, status, course_count, lesson_count FROM {STATS_TABLE}"
+        )
+    )
+
+    drift = []
+    for key in sorted(set(expected) | set(stored)):
+        actual = expected.get(key, (0, 0))
+        recorded = stored.get(key, (0, 0))
+        if actual != recorded:
+            drift.append(
+                {
+                    "category": key[0],
+                    "status": key[1],
+                    "courses": {"stored": recorded[0], "actual": actual[0]},
+                    "lessons": {"stored": recorded[1], "actual": actual[1]},
+                }
+            )
+    return drift
+
+
+def summarize_course_stats(rows: Iterable[Sequence[Any]]) -> Dict[str, Any]:
+    counts = {
+        (category, status): (courses, lessons)
+        for category, status, courses, lessons in rows
+    }
+    breakdown = []
+    by_category = {
+        category.value: {"courses": 0, "lessons": 0} for category in Category
+    }
+    by_status = {status.value: {"courses": 0, "lessons": 0} for status in Status}
+    for category in Category:
+        for status in Status:
+            courses, lessons = counts.get((category, status), (0, 0))
+            breakdown.append(
+                {
+                    "category": category.value,
+                    "status": status.value,
+                    "courses": courses,
+                    "lessons": lessons,
+                }
+            )
+            for totals in (by_category[category.value], by_status[status.value]):
+                totals["courses"] += courses
+                totals["lessons"] += lessons
+
+    return {
+        "totalCourses": sum(row["courses"] for row in breakdown),
+        "totalLessons": sum(row["lessons"] for row in breakdown),
+        "byCategory": by_category,
+        "byStatus": by_status,
+        "breakdown": breakdown,
+    }
@@ -0,0 +1,92 @@
+"""add course search vector
+
+Revision ID: 8d4e2b6f0a19
+Revises: 5f1a7c3e9d42
+Create Date: 2026-10-18 12:31:55.417930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '8d4e2b6f0a19'
+down_revision = '5f1a7c3e9d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Full-text search is Postgres only, SQLite builds an FTS5 table on demand
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.add_column('courses', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    op.execute("""
+        CREATE FUNCTION courses_search_document(course_id integer, name text, description text)
+        RETURNS tsvector AS $$
+            SELECT setweight(to_tsvector('simple', coalesce(name, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(description, '')), 'B')
+                || setweight(to_tsvector('simple', coalesce(
+                    (SELECT string_agg(lessons.name, ' ') FROM lessons
+                     WHERE lessons.course_id = courses_search_document.course_id),
+                    '')), 'C')
+        $$ LANGUAGE sql STABLE
+    """)
+
+    op.execute("""
+        CREATE FUNCTION courses_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := courses_search_document(NEW.id, NEW.name, NEW.description);
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+    op.execute("""
+        CREATE TRIGGER courses_search_vector_trigger
+        BEFORE INSERT OR UPDATE OF name, description ON courses
+        FOR EACH ROW EXECUTE FUNCTION courses_search_vector_update()
+    """)
+
+    op.execute("""
+        CREATE FUNCTION lessons_search_vector_update() RETURNS trigger AS $$
+        BEGIN
+            UPDATE courses
+            SET search_vector = courses_search_document(courses.id, courses.name, courses.description)
+            WHERE courses.id IN (SELECT course_id FROM changed_lessons);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    """)
+
+    for event, table in (('INSERT', 'NEW'), ('UPDATE', 'NEW'), ('DELETE', 'OLD')):
+        op.execute(f"""
+            CREATE TRIGGER lessons_search_vector_{event.lower()}_trigger
+            AFTER {event} ON lessons
+            REFERENCING {table} TABLE AS changed_lessons
+            FOR EACH STATEMENT EXECUTE FUNCTION lessons_search_vector_update()
+        """)
+
+    op.execute("""
+        UPDATE courses
+        SET search_vector = courses_search_document(id, name, description)
+    """)
+
+    op.create_index('ix_courses_search_vector', 'courses', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade():
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_courses_search_vector', table_name='courses', postgresql_using='gin')
+    for event in ('insert', 'update', 'delete'):
+        op.execute(f"DROP TRIGGER lessons_search_vector_{event}_trigger ON lessons")
+    op.execute("DROP FUNCTION lessons_search_vector_update()")
+    op.execute("DROP TRIGGER courses_search_vector_trigger ON courses")
+    op.execute("DROP FUNCTION courses_search_vector_update()")
+    op.execute("DROP FUNCTION courses_search_document(integer, text, text)")
+    op.drop_column('courses', 'search_vector')
@@ -0,0 +1,184 @@
+"""add course stats table
+
+Revision ID: dc3702316709
+Revises: 79e3342d38cb
+Create Date: 2026-10-18 09:12:45.470530
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'dc3702316709'
+down_revision = '79e3342d38cb'
+branch_labels = None
+depends_on = None
+
+
+# Each trigger feeds (category, status, course delta, lesson delta) rows into
+# the same upsert
+UPSERT = """
+    INSERT INTO course_stats (category, status, course_count, lesson_count)
+    SELECT category, status, sum(courses), sum(lessons) FROM ({deltas}) AS deltas
+    WHERE true
+    GROUP BY category, status
+    ON CONFLICT (category, status) DO UPDATE SET
+        course_count = course_stats.course_count + excluded.course_count,
+        lesson_count = course_stats.lesson_count + excluded.lesson_count
+"""
+
+LESSONS_OF_OLD_COURSE = "(SELECT count(*) FROM lessons WHERE course_id = OLD.id)"
+
+# Row level, BEFORE DELETE on courses: the cascaded lesson deletes run after
+# the course row is gone and could not be attributed any more
+SQLITE_TRIGGERS = {
+    'course_stats_courses_insert': (
+        "AFTER INSERT ON courses",
+        "SELECT NEW.category AS category, NEW.status AS status, 1 AS courses, 0 AS lessons",
+    ),
+    'course_stats_courses_update': (
+        "AFTER UPDATE OF category, status ON courses "
+        "WHEN OLD.category IS NOT NEW.category OR OLD.status IS NOT NEW.status",
+        f"SELECT OLD.category AS category, OLD.status AS status, -1 AS courses, -{LESSONS_OF_OLD_COURSE} AS lessons "
+        f"UNION ALL SELECT NEW.category, NEW.status, 1, {LESSONS_OF_OLD_COURSE}",
+    ),
+    'course_stats_courses_delete': (
+        "BEFORE DELETE ON courses",
+        f"SELECT OLD.category AS category, OLD.status AS status, -1 AS courses, -{LESSONS_OF_OLD_COURSE} AS lessons",
+    ),
+    'course_stats_lessons_insert': (
+        "AFTER INSERT ON lessons",
+        "SELECT category, status, 0 AS courses, 1 AS lessons FROM courses WHERE id = NEW.course_id",
+    ),
+    'course_stats_lessons_update': (
+        "AFTER UPDATE OF course_id ON lessons WHEN OLD.course_id IS NOT NEW.course_id",
+        "SELECT category, status, 0 AS courses, -1 AS lessons FROM courses WHERE id = OLD.course_id "
+        "UNION ALL SELECT category, status, 0, 1 FROM courses WHERE id = NEW.course_id",
+    ),
+    'course_stats_lessons_delete': (
+        "AFTER DELETE ON lessons",
+        "SELECT category, status, 0 AS courses, -1 AS lessons FROM courses WHERE id = OLD.course_id",
+    ),
+}
+
+# Statement level with transition tables, except the course delete (see above)
+POSTGRES_TRIGGERS = {
+    'course_stats_courses_insert': (
+        'courses',
+        "AFTER INSERT ON courses REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT",
+        "SELECT category, status, count(*) AS courses, 0 AS lessons FROM new_rows GROUP BY category, status",
+    ),
+    'course_stats_courses_update': (
+        'courses',
+        "AFTER UPDATE ON courses REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT",
+        """
+        WITH moved AS (
+            SELECT old_rows.category AS old_category, old_rows.status AS old_status,
+                   new_rows.category AS new_category, new_rows.status AS new_status,
+                   (SELECT count(*) FROM lessons WHERE lessons.course_id = new_rows.id) AS lessons
+            FROM old_rows JOIN new_rows ON new_rows.id = old_rows.id
+            WHERE old_rows.category <> new_rows.category OR old_rows.status <> new_rows.status
+        )
+        SELECT old_category AS category, old_status AS status, -1 AS courses, -lessons AS lessons FROM moved
+        UNION ALL
+        SELECT new_category, new_status, 1, lessons FROM moved
+        """,
+    ),
+    'course_stats_courses_delete': (
+        'courses',
+        "BEFORE DELETE ON courses FOR EACH ROW",
+        f"SELECT OLD.category AS category, OLD.status AS status, -1 AS courses, -{LESSONS_OF_OLD_COURSE} AS lessons",
+    ),
+    'course_stats_lessons_insert': (
+        'lessons',
+        "AFTER INSERT ON lessons REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT",
+        "SELECT courses.category, courses.status, 0 AS courses, count(*) AS lessons "
+        "FROM new_rows JOIN courses ON courses.id = new_rows.course_id "
+        "GROUP BY courses.category, courses.status",
+    ),
+    'course_stats_lessons_update': (
+        'lessons',
+        "AFTER UPDATE ON lessons REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT",
+        """
+        SELECT courses.category, courses.status, 0 AS courses, -1 AS lessons
+        FROM old_rows JOIN new_rows ON new_rows.id = old_rows.id
+        JOIN courses ON courses.id = old_rows.course_id
+        WHERE old_rows.course_id <> new_rows.course_id
+        UNION ALL
+        SELECT courses.category, courses.status, 0, 1
+        FROM old_rows JOIN new_rows ON new_rows.id = old_rows.id
+        JOIN courses ON courses.id = new_rows.course_id
+        WHERE old_rows.course_id <> new_rows.course_id
+        """,
+    ),
+    'course_stats_lessons_delete': (
+        'lessons',
+        "AFTER DELETE ON lessons REFERENCING OLD TABLE AS old_rows FOR EACH STATEMENT",
+        "SELECT courses.category, courses.status, 0 AS courses, -count(*) AS lessons "
+        "FROM old_rows JOIN courses ON courses.id = old_rows.course_id "
+        "GROUP BY courses.category, courses.status",
+    ),
+}
+
+
+def upgrade():
+    is_postgres = op.get_bind().dialect.name == 'postgresql'
+    if is_postgres:
+        category = postgresql.ENUM('BACKEND', 'FRONTEND', 'FULLSTACK', name='category', create_type=False)
+        status = postgresql.ENUM('ACTIVE', 'INACTIVE', name='status', create_type=False)
+    else:
+        category = sa.Enum('BACKEND', 'FRONTEND', 'FULLSTACK', name='category')
+        status = sa.Enum('ACTIVE', 'INACTIVE', name='status')
+
+    op.create_table('course_stats',
+    sa.Column('category', category, nullable=False),
+    sa.Column('status', status, nullable=False),
+    sa.Column('course_count', sa.Integer(), server_default='0', nullable=False),
+    sa.Column('lesson_count', sa.Integer(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('category', 'status')
+    )
+
+    if is_postgres:
+        for name, (table, timing, deltas) in POSTGRES_TRIGGERS.items():
+            op.execute(f"""
+                CREATE FUNCTION {name}() RETURNS trigger AS $$
+                BEGIN
+                    {UPSERT.format(deltas=deltas)};
+                    RETURN {'OLD' if timing.startswith('BEFORE') else 'NULL'};
+                END
+                $$ LANGUAGE plpgsql
+            """)
+            op.execute(f"CREATE TRIGGER {name} {timing} EXECUTE FUNCTION {name}()")
+    else:
+        for name, (timing, deltas) in SQLITE_TRIGGERS.items():
+            op.execute(f"""
+                CREATE TRIGGER {name}
+                {timing} BEGIN
+                    {UPSERT.format(deltas=deltas)};
+                END
+            """)
+
+    op.execute("""
+        INSERT INTO course_stats (category, status, course_count, lesson_count)
+        SELECT courses.category, courses.status, count(*),
+               coalesce(sum(lesson_counts.lessons), 0)
+        FROM courses
+        LEFT JOIN (
+            SELECT course_id, count(*) AS lessons FROM lessons GROUP BY course_id
+        ) AS lesson_counts ON lesson_counts.course_id = courses.id
+        GROUP BY courses.category, courses.status
+    """)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        for name, (table, _, _) in POSTGRES_TRIGGERS.items():
+            op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+            op.execute(f"DROP FUNCTION IF EXISTS {name}()")
+    else:
+        for name in SQLITE_TRIGGERS:
+            op.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+    op.drop_table('course_stats')
@@ -0,0 +1,47 @@
+"""cascade lesson deletes from courses
+
+Revision ID: e41b7f2c9a58
+Revises: 8d4e2b6f0a19
+Create Date: 2026-10-18 15:02:41.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e41b7f2c9a58'
+down_revision = '8d4e2b6f0a19'
+branch_labels = None
+depends_on = None
+
+FK_NAME = 'lessons_course_id_fkey'
+
+# The initial migration left the SQLite constraint unnamed; batch mode needs a
+# convention to find it. Postgres already uses lessons_course_id_fkey.
+NAMING_CONVENTION = {'fk': FK_NAME}
+
+
+def _replace_course_fk(ondelete):
+    if op.get_bind().dialect.name == 'sqlite':
+        with op.batch_alter_table(
+            'lessons', schema=None, naming_convention=NAMING_CONVENTION
+        ) as batch_op:
+            batch_op.drop_constraint(FK_NAME, type_='foreignkey')
+            batch_op.create_foreign_key(
+                FK_NAME, 'courses', ['course_id'], ['id'], ondelete=ondelete
+            )
+        return
+
+    op.drop_constraint(FK_NAME, 'lessons', type_='foreignkey')
+    op.create_foreign_key(
+        FK_NAME, 'lessons', 'courses', ['course_id'], ['id'], ondelete=ondelete
+    )
+
+
+def upgrade():
+    _replace_course_fk('CASCADE')
+
+
+def downgrade():
+    _replace_course_fk(None)
@@ -0,0 +1,122 @@
+"""install search index for moved lessons
+
+Revision ID: f2a8d61c4b37
+Revises: dc3702316709
+Create Date: 2026-10-18 16:40:12.583104
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2a8d61c4b37'
+down_revision = 'dc3702316709'
+branch_labels = None
+depends_on = None
+
+
+# SQLite used to create its FTS5 index on the first search request; it is now
+# owned here. Lesson triggers refresh every course a statement touched, so a
+# lesson moved to another course leaves the old course's document as well.
+LESSON_DOCUMENT = """
+    UPDATE courses_fts
+    SET lessons = (
+        SELECT coalesce(group_concat(lessons.name, ' '), '')
+        FROM lessons WHERE lessons.course_id = courses_fts.course_id
+    )
+    WHERE course_id IN ({course_ids})
+"""
+
+SQLITE_TRIGGERS = {
+    'courses_fts_after_insert': (
+        "AFTER INSERT ON courses",
+        "INSERT INTO courses_fts (course_id, name, description, lessons) "
+        "VALUES (NEW.id, NEW.name, coalesce(NEW.description, ''), '')",
+    ),
+    'courses_fts_after_update': (
+        "AFTER UPDATE OF name, description ON courses",
+        "UPDATE courses_fts SET name = NEW.name, description = coalesce(NEW.description, '') "
+        "WHERE course_id = NEW.id",
+    ),
+    'courses_fts_after_delete': (
+        "AFTER DELETE ON courses",
+        "DELETE FROM courses_fts WHERE course_id = OLD.id",
+    ),
+    'lessons_fts_after_insert': (
+        "AFTER INSERT ON lessons",
+        LESSON_DOCUMENT.format(course_ids="NEW.course_id"),
+    ),
+    'lessons_fts_after_update': (
+        "AFTER UPDATE OF name, course_id ON lessons",
+        LESSON_DOCUMENT.format(course_ids="OLD.course_id, NEW.course_id"),
+    ),
+    'lessons_fts_after_delete': (
+        "AFTER DELETE ON lessons",
+        LESSON_DOCUMENT.format(course_ids="OLD.course_id"),
+    ),
+}
+
+SQLITE_REBUILD = """
+    INSERT INTO courses_fts (course_id, name, description, lessons)
+    SELECT courses.id, courses.name, coalesce(courses.description, ''),
+           coalesce((SELECT group_concat(name, ' ') FROM lessons
+                     WHERE lessons.course_id = courses.id), '')
+    FROM courses
+"""
+
+POSTGRES_REBUILD = """
+    UPDATE courses SET search_vector = courses_search_document(id, name, description)
+"""
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("""
+            CREATE FUNCTION lessons_search_vector_move() RETURNS trigger AS $$
+            BEGIN
+                UPDATE courses
+                SET search_vector = courses_search_document(courses.id, courses.name, courses.description)
+                WHERE courses.id IN (
+                    SELECT course_id FROM old_rows UNION SELECT course_id FROM new_rows
+                );
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+        """)
+        op.execute("DROP TRIGGER lessons_search_vector_update_trigger ON lessons")
+        op.execute("""
+            CREATE TRIGGER lessons_search_vector_update_trigger
+            AFTER UPDATE ON lessons
+            REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION lessons_search_vector_move()
+        """)
+        # Courses that lost a lesson before this revision still index it
+        op.execute(POSTGRES_REBUILD)
+        return
+
+    op.execute("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts
+        USING fts5(course_id UNINDEXED, name, description, lessons)
+    """)
+    for name, (timing, body) in SQLITE_TRIGGERS.items():
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+        op.execute(f"CREATE TRIGGER {name} {timing} BEGIN {body}; END")
+    op.execute("DELETE FROM courses_fts")
+    op.execute(SQLITE_REBUILD)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        op.execute("DROP TRIGGER lessons_search_vector_update_trigger ON lessons")
+        op.execute("DROP FUNCTION lessons_search_vector_move()")
+        op.execute("""
+            CREATE TRIGGER lessons_search_vector_update_trigger
+            AFTER UPDATE ON lessons
+            REFERENCING NEW TABLE AS changed_lessons
+            FOR EACH STATEMENT EXECUTE FUNCTION lessons_search_vector_update()
+        """)
+        return
+
+    for name in SQLITE_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.execute("DROP TABLE IF EXISTS courses_fts")
@@ -1,6 +1,55 @@
-from crud_flask import app, db
+"""Seed the database with mock courses.
+
+Usage:
+    python mock_dump.py
+        50 hand-picked courses, the original quick dump.
+    python mock_dump.py --courses 1000000 --lessons 0-10 --workers 4
+        High-volume deterministic generator for load testing; see --help.
+"""
+
+import argparse
+import csv
+import io
+import math
+import multiprocessing
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import create_engine, func, insert, select, text
+from sqlalchemy.engine import Engine
+
+from crud_flask import create_app, db
 from crud_flask.models.models import Category, Course, Lesson, Status
 
+COURSE_COLUMNS = (
+    "id",
+    "name",
+    "description",
+    "category",
+    "status",
+    "created_at",
+    "updated_at",
+)
+LESSON_COLUMNS = ("name", "youtube_url", "created_at", "updated_at", "course_id")
+TOPICS = (
+    "Python",
+    "Go",
+    "Rust",
+    "React",
+    "Vue",
+    "Django",
+    "Kubernetes",
+    "PostgreSQL",
+    "GraphQL",
+    "TypeScript",
+    "Docker",
+    "Flutter",
+)
+LEVELS = ("Intro to", "Practical", "Advanced", "Mastering", "Hands-on")
+CREATED_AT = datetime(2024, 1, 1)
+
 
 def quick_dump():
     courses = [
@@ -60,6 +109,7 @@ def quick_dump():
         "Microservices",
     ]
 
+    app = create_app()
     with app.app_context():
         Lesson.query.delete()
         Course.query.delete()
@@ -83,5 +133,299 @@ def quick_dump():
         print(f"Created {Course.query.count()} courses")
 
 
+def parse_mix(spec: Optional[str], enum_cls) -> Tuple[List, List[float]]:
+    """``"BACKEND=0.5,FRONTEND=0.3"`` -> members and weights; None is uniform."""
+    if not spec:
+        return list(enum_cls), [1.0] * len(enum_cls)
+
+    members, weights = [], []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        try:
+            members.append(enum_cls[name.strip().upper()])
+            weights.append(float(weight or 1))
+        except (KeyError, ValueError):
+            raise argparse.ArgumentTypeError(f"Invalid {enum_cls.__name__} mix {spec}")
+    return members, weights
+
+
+def parse_lessons(spec: str) -> Callable[[random.Random], int]:
+    """``"5"`` fixed, ``"0-10"`` uniform inclusive, ``"poisson:4"`` Poisson mean."""
+    try:
+        if spec.startswith("poisson:"):
+            limit = math.exp(-float(spec.split(":", 1)[1]))
+
+            def poisson(rng: random.Random) -> int:
+                count, product = 0, rng.random()
+                while product > limit:
+                    count += 1
+                    product *= rng.random()
+                return count
+
+            return poisson
+        if "-" in spec:
+            low, high = (int(value) for value in spec.split("-", 1))
+            return lambda rng: rng.randint(low, high)
+        fixed = int(spec)
+        return lambda rng: fixed
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid lessons distribution {spec}")
+
+
+def generate_chunk(
+    seed: int,
+    first_id: int,
+    count: int,
+    lessons: Callable[[random.Random], int],
+    categories: Tuple[List, List[float]],
+    statuses: Tuple[List, List[float]],
+) -> Tuple[List[Dict], List[Dict]]:
+    # Every course draws from its own RNG keyed by its id, so the data does not
+    # depend on the batch size, the number of workers or chunk completion order.
+    courses, course_lessons = [], []
+    for offset in range(count):
+        id = first_id + offset
+        rng = random.Random(f"{seed}:{id}")
+        created_at = CREATED_AT + timedelta(seconds=id)
+        topic = rng.choice(TOPICS)
+        courses.append(
+            {
+                "id": id,
+                "name": f"{rng.choice(LEVELS)} {topic} #{id}",
+                "description": f"Learn {topic} step by step",
+                "category": rng.choices(*categories)[0],
+                "status": rng.choices(*statuses)[0],
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+        for number in range(lessons(rng)):
+            course_lessons.append(
+                {
+                    "name": f"{topic} lesson {number + 1}",
+                    "youtube_url": f"https://youtube.com/watch?v={id}-{number}",
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "course_id": id,
+                }
+            )
+    return courses, course_lessons
+
+
+def insert_rows(engine: Engine, courses: List[Dict], lessons: List[Dict]) -> None:
+    with engine.begin() as connection:
+        connection.execute(insert(Course.__table__), courses)
+        if lessons:
+            connection.execute(insert(Lesson.__table__), lessons)
+
+
+def copy_rows(engine: Engine, courses: List[Dict], lessons: List[Dict]) -> None:
+    def to_csv(rows: List[Dict], columns: Tuple[str, ...]) -> io.StringIO:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            writer.writerow(
+                [getattr(row[column], "name", row[column]) for column in columns]
+            )
+        buffer.seek(0)
+        return buffer
+
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY courses ({', '.join(COURSE_COLUMNS)}) FROM STDIN WITH CSV",
+                to_csv(courses, COURSE_COLUMNS),
+            )
+            if lessons:
+                cursor.copy_expert(
+                    f"COPY lessons ({', '.join(LESSON_COLUMNS)}) FROM STDIN WITH CSV",
+                    to_csv(lessons, LESSON_COLUMNS),
+                )
+        connection.commit()
+    finally:
+        connection.close()
+
+
+_worker: Dict = {}
+
+
+def init_worker(database_uri: str, method: str, options: Dict) -> None:
+    _worker["engine"] = create_engine(database_uri)
+    _worker["write"] = copy_rows if method == "copy" else insert_rows
+    _worker["options"] = {
+        "seed": options["seed"],
+        "lessons": parse_lessons(options["lessons"]),
+        "categories": parse_mix(options["categories"], Category),
+        "statuses": parse_mix(options["statuses"], Status),
+    }
+
+
+def load_chunk(task: Tuple[int, int]) -> Tuple[int, int]:
+    first_id, count = task
+    courses, lessons = generate_chunk(
+        first_id=first_id, count=count, **_worker["options"]
+    )
+    _worker["write"](_worker["engine"], courses, lessons)
+    return len(courses), len(lessons)
+
+
+def high_volume_dump(
+    database_uri: str,
+    courses: int,
+    lessons: str = "0-10",
+    category_mix: Optional[str] = None,
+    status_mix: Optional[str] = None,
+    seed: int = 42,
+    batch_size: int = 10_000,
+    workers: int = 1,
+    method: str = "auto",
+    truncate: bool = False,
+) -> Dict[str, float]:
+    engine = create_engine(database_uri)
+    dialect = engine.dialect.name
+    if method == "auto":
+        method = "copy" if dialect == "postgresql" else "insert"
+    if method == "copy" and dialect != "postgresql":
+        raise ValueError("COPY is only available on PostgreSQL")
+    if dialect == "sqlite" and workers > 1:
+        print("SQLite allows a single writer, running with one worker")
+        workers = 1
+
+    with engine.begin() as connection:
+        if truncate:
+            if dialect == "postgresql":
+                # TRUNCATE does not fire the course_stats triggers
+                connection.execute(
+                    text("TRUNCATE lessons, courses, course_stats RESTART IDENTITY")
+                )
+            else:
+                connection.execute(Lesson.__table__.delete())
+                connection.execute(Course.__table__.delete())
+        start_id = connection.execute(select(func.max(Course.id))).scalar() or 0
+
+    # Specs rather than parsed callables, so the options can be sent to workers
+    options = {
+        "seed": seed,
+        "lessons": lessons,
+        "categories": category_mix,
+        "statuses": status_mix,
+    }
+    tasks = [
+        (start_id + first + 1, min(batch_size, courses - first))
+        for first in range(0, courses, batch_size)
+    ]
+
+    started = time.perf_counter()
+    course_rows = lesson_rows = 0
+    if workers > 1:
+        pool = multiprocessing.Pool(
+            workers, initializer=init_worker, initargs=(database_uri, method, options)
+        )
+        results = pool.imap_unordered(load_chunk, tasks)
+    else:
+        pool = None
+        init_worker(database_uri, method, options)
+        results = map(load_chunk, tasks)
+
+    try:
+        for done, (chunk_courses, chunk_lessons) in enumerate(results, start=1):
+            course_rows += chunk_courses
+            lesson_rows += chunk_lessons
+            elapsed = time.perf_counter() - started
+            print(
+                f"chunk {done}/{len(tasks)}: {course_rows} courses, "
+                f"{lesson_rows} lessons, "
+                f"{(course_rows + lesson_rows) / elapsed:,.0f} rows/s"
+            )
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    elapsed = time.perf_counter() - started
+    with engine.begin() as connection:
+        if dialect == "postgresql":
+            connection.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence('courses', 'id'), "
+                    "(SELECT max(id) FROM courses))"
+                )
+            )
+            connection.execute(text("ANALYZE courses"))
+            connection.execute(text("ANALYZE lessons"))
+    engine.dispose()
+
+    stats = {
+        "courses": course_rows,
+        "lessons": lesson_rows,
+        "seconds": elapsed,
+        "rows_per_second": (course_rows + lesson_rows) / elapsed if elapsed else 0.0,
+    }
+    print(
+        f"Inserted {course_rows} courses and {lesson_rows} lessons "
+        f"in {elapsed:.1f}s ({stats['rows_per_second']:,.0f} rows/s, {method})"
+    )
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split("\n", 1)[1],
+    )
+    parser.add_argument(
+        "--courses",
+        type=int,
+        help="Generate this many courses instead of the quick dump",
+    )
+    parser.add_argument(
+        "--lessons",
+        default="0-10",
+        help='Lessons per course: "5", "0-10" (uniform) or "poisson:4"',
+    )
+    parser.add_argument(
+        "--category-mix", help='Weights, e.g. "BACKEND=0.5,FRONTEND=0.3,FULLSTACK=0.2"'
+    )
+    parser.add_argument("--status-mix", help='Weights, e.g. "ACTIVE=0.8,INACTIVE=0.2"')
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--method", choices=["auto", "insert", "copy"], default="auto")
+    parser.add_argument(
+        "--truncate", action="store_true", help="Delete existing courses first"
+    )
+    parser.add_argument("--database-uri", help="Defaults to the app configuration")
+    args = parser.parse_args()
+
+    if args.courses is None:
+        quick_dump()
+        return
+
+    parse_lessons(args.lessons)
+    parse_mix(args.category_mix, Category)
+    parse_mix(args.status_mix, Status)
+
+    database_uri = args.database_uri
+    if database_uri is None:
+        app = create_app()
+        with app.app_context():
+            database_uri = db.engine.url.render_as_string(hide_password=False)
+
+    high_volume_dump(
+        database_uri,
+        args.courses,
+        lessons=args.lessons,
+        category_mix=args.category_mix,
+        status_mix=args.status_mix,
+        seed=args.seed,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        method=args.method,
+        truncate=args.truncate,
+    )
+
+
 if __name__ == "__main__":
-    quick_dump()
+    main()
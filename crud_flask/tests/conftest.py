@@ -1,25 +1,21 @@
 import pytest
 import sys
-import os
 from pathlib import Path
 from dotenv import load_dotenv
 
 load_dotenv()
 
+pytest_plugins = ["query_budget"]
+
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
 @pytest.fixture
 def app():
-    from crud_flask import app
+    from crud_flask import create_app
 
-    app.config["TESTING"] = True
-    app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv(
-        "TEST_DB_URI", "sqlite:///:memory:"
-    )
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-    app.config["SECRET_KEY"] = "test_secret_key"
+    app = create_app("testing")
 
     with app.app_context():
         yield app
@@ -40,7 +36,119 @@ def clear_mock_calls():
         if isinstance(obj, Mock):
             obj.reset_mock()
 
+
 @pytest.fixture(autouse=True)
 def app_context(app):
     with app.app_context():
-        yield
\ No newline at end of file
+        yield
+
+
+@pytest.fixture
+def sqlite_engine():
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from sqlalchemy.pool import StaticPool
+    from crud_flask.models.models import db
+    from crud_flask.services.search import install_sqlite_search
+    from crud_flask.services.stats import install_course_stats
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    db.metadata.create_all(engine)
+    # What the migrations install on top of the models
+    with Session(engine) as session:
+        install_sqlite_search(session)
+        install_course_stats(session)
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def sqlite_session_factory(sqlite_engine):
+    from flask_sqlalchemy.query import Query
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(bind=sqlite_engine, query_cls=Query)
+
+
+@pytest.fixture
+def query_counter(sqlite_engine):
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(sqlite_engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(sqlite_engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def seed_courses(sqlite_session_factory):
+    from datetime import datetime, timedelta
+    from crud_flask.models.models import Category, Course, Lesson, Status
+    from test_constants import TestConstants
+
+    def seed(
+        count,
+        lessons_per_course=2,
+        same_created_at=False,
+        category=Category.BACKEND,
+        status=Status.ACTIVE,
+    ):
+        session = sqlite_session_factory()
+        created_at = datetime(2025, 1, 1)
+        for i in range(count):
+            course = Course(
+                name=f"{TestConstants.COURSE_NAME} {i}",
+                description=TestConstants.COURSE_DESCRIPTION,
+                category=category,
+                status=status,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+            for j in range(lessons_per_course):
+                course.lessons.append(
+                    Lesson(
+                        name=f"{TestConstants.LESSON_NAME} {j}",
+                        youtube_url=TestConstants.LESSON_YOUTUBE_URL,
+                    )
+                )
+            session.add(course)
+            if not same_created_at:
+                created_at += timedelta(seconds=1)
+        session.commit()
+        session.close()
+
+    return seed
+
+
+@pytest.fixture
+def sqlite_client(sqlite_session_factory):
+    from flask import Flask
+    from crud_flask.models.models import Course, Lesson
+    from crud_flask.routes.course_routes import CourseRoutes
+    from crud_flask.routes.lesson_routes import LessonRoutes
+    from crud_flask.services.course_service import CourseService
+    from crud_flask.services.lesson_service import LessonService
+
+    test_app = Flask(__name__)
+    course_service = CourseService(
+        session_factory=sqlite_session_factory,
+        course_model=Course,
+        lesson_model=Lesson,
+    )
+    lesson_service = LessonService(
+        session_factory=sqlite_session_factory,
+        course_model=Course,
+        lesson_model=Lesson,
+    )
+    test_app.register_blueprint(CourseRoutes(course_service).bp)
+    test_app.register_blueprint(LessonRoutes(lesson_service).bp)
+    return test_app.test_client()
@@ -0,0 +1,90 @@
+"""Pytest plugin that fails a test when it issues more SQL than budgeted.
+
+Mark a test with ``@pytest.mark.query_budget(n)``. Every statement sent by any
+SQLAlchemy engine during the test body counts against ``n``. To leave data
+setup out of the count, use the ``query_budget`` fixture as a context manager;
+each ``with query_budget:`` block is then checked against ``n`` on its own.
+"""
+
+from typing import List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryBudget:
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.statements: List[str] = []
+        self.scoped = False
+        self._active = False
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if self._active:
+            self.statements.append(statement)
+
+    def __enter__(self) -> "QueryBudget":
+        self.scoped = True
+        self._active = True
+        self.statements = []
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._active = False
+        if exc_type is None:
+            self.check()
+
+    def check(self) -> None:
+        if len(self.statements) <= self.budget:
+            return
+
+        captured = "\n".join(
+            f"  {index}. {' '.join(statement.split())}"
+            for index, statement in enumerate(self.statements, start=1)
+        )
+        pytest.fail(
+            f"Query budget exceeded: {len(self.statements)} statements issued, "
+            f"budget is {self.budget}\n{captured}",
+            pytrace=False,
+        )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail when the test issues more than n SQL statements",
+    )
+
+
+def pytest_collection_modifyitems(items):
+    for item in items:
+        if item.get_closest_marker("query_budget") and hasattr(item, "fixturenames"):
+            if "query_budget" not in item.fixturenames:
+                item.fixturenames.append("query_budget")
+
+
+@pytest.fixture
+def query_budget(request) -> QueryBudget:
+    marker = request.node.get_closest_marker("query_budget")
+    if marker is None:
+        raise pytest.UsageError(
+            "The query_budget fixture needs @pytest.mark.query_budget(n)"
+        )
+
+    budget = QueryBudget(marker.args[0] if marker.args else marker.kwargs["n"])
+    event.listen(Engine, "before_cursor_execute", budget._record)
+    yield budget
+    event.remove(Engine, "before_cursor_execute", budget._record)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    budget = getattr(item, "funcargs", {}).get("query_budget")
+    if isinstance(budget, QueryBudget):
+        budget._active = True
+    result = yield
+    if isinstance(budget, QueryBudget) and not budget.scoped:
+        budget._active = False
+        budget.check()
+    return result
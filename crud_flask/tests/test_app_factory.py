@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import patch
+from crud_flask import create_app, dispose_engines
+from crud_flask.config import ProductionConfig, TestingConfig, get_config
+from crud_flask.models.models import db
+
+
+class TestAppFactory:
+    def test_create_app_with_testing_profile(self):
+        app = create_app("testing")
+
+        assert app.config["TESTING"] is True
+        assert app.config["SQLALCHEMY_ECHO"] is False
+        assert "courses" in app.blueprints
+        assert "course_service" in app.extensions
+
+    def test_create_app_returns_independent_apps(self):
+        first = create_app("testing")
+        second = create_app("testing")
+
+        assert first is not second
+        assert first.extensions["course_service"] is not second.extensions[
+            "course_service"
+        ]
+
+    def test_production_profile_disables_echo(self):
+        assert ProductionConfig.SQLALCHEMY_ECHO is False
+        assert ProductionConfig.SQLALCHEMY_TRACK_MODIFICATIONS is False
+
+    def test_get_config_reads_profile_from_env(self, monkeypatch):
+        monkeypatch.setenv("APP_CONFIG", "testing")
+
+        assert get_config() is TestingConfig
+        assert get_config(ProductionConfig) is ProductionConfig
+
+    def test_get_config_rejects_unknown_profile(self):
+        with pytest.raises(ValueError, match="Invalid config profile"):
+            get_config("staging")
+
+    def test_dispose_engines_keeps_parent_connections_open(self):
+        app = create_app("testing")
+        with app.app_context():
+            engine = db.engine
+
+        with patch.object(engine, "dispose") as dispose:
+            dispose_engines(app)
+
+        dispose.assert_called_once_with(close=False)
@@ -0,0 +1,255 @@
+import asyncio
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from flask_sqlalchemy.query import Query
+from crud_flask.services.async_course_service import (
+    AsyncCourseService,
+    async_database_uri,
+    create_async_course_service,
+)
+from crud_flask.services.course_service import CourseService
+from crud_flask.models.models import Category, Course, Lesson, Status, db
+from test_constants import TestConstants
+
+
+class AwaitingService:
+    """Runs AsyncCourseService coroutines on one loop so scenarios stay sync."""
+
+    def __init__(self, service: AsyncCourseService):
+        self.service = service
+        self.loop = asyncio.new_event_loop()
+
+    def __getattr__(self, name):
+        method = getattr(self.service, name)
+        return lambda *args, **kwargs: self.loop.run_until_complete(
+            method(*args, **kwargs)
+        )
+
+    def close(self):
+        engine = self.service.session_factory.kw["bind"]
+        self.loop.run_until_complete(engine.dispose())
+        self.loop.close()
+
+
+@pytest.fixture(params=["sync", "async"])
+def service(request, tmp_path):
+    database_uri = f"sqlite:///{tmp_path / 'courses.db'}"
+    engine = create_engine(database_uri)
+    db.metadata.create_all(engine)
+
+    if request.param == "sync":
+        yield CourseService(
+            session_factory=sessionmaker(bind=engine, query_cls=Query),
+            course_model=Course,
+            lesson_model=Lesson,
+            count_mode="cached",
+        )
+    else:
+        awaiting = AwaitingService(
+            create_async_course_service(database_uri, count_mode="cached")
+        )
+        yield awaiting
+        awaiting.close()
+    engine.dispose()
+
+
+class TestAsyncCourseService:
+    @pytest.fixture(autouse=True)
+    def setup(self, service):
+        self.service = service
+
+    def create_course(self, **overrides):
+        data = TestConstants.get_complete_course_data(include_id=False)
+        for lesson in data["lessons"]:
+            del lesson["id"]
+        data.update(overrides)
+        return self.service.create(data)
+
+    def test_get_all_success(self):
+        created = self.create_course()
+
+        result = self.service.get_all()
+
+        assert len(result) == 1
+        assert result[0]["id"] == created["id"]
+        assert result[0]["name"] == TestConstants.COURSE_NAME
+        assert result[0]["lessons"][0]["name"] == TestConstants.LESSON_NAME
+
+    def test_get_all_empty_result(self):
+        assert self.service.get_all() == []
+
+    def test_get_by_id_success(self):
+        created = self.create_course()
+
+        result = self.service.get_by_id(created["id"])
+
+        assert result["name"] == TestConstants.COURSE_NAME
+        assert result["category"] == TestConstants.COURSE_CATEGORY
+        assert len(result["lessons"]) == 1
+
+    def test_get_by_id_not_found(self):
+        expected_error = TestConstants.get_error_message("course_not_found")
+        with pytest.raises(Exception, match=expected_error):
+            self.service.get_by_id(TestConstants.NON_EXISTENT_COURSE_ID)
+
+    def test_create_success(self):
+        result = self.create_course()
+
+        assert result["id"] is not None
+        assert result["status"] == TestConstants.COURSE_STATUS
+        assert result["lessons"][0]["youtube_url"] == TestConstants.LESSON_YOUTUBE_URL
+
+    @pytest.mark.parametrize(
+        "field", [{"category": "INVALID_CATEGORY"}, {"status": "INVALID_STATUS"}]
+    )
+    def test_create_with_invalid_enum(self, field):
+        with pytest.raises(Exception, match="Error converting dict to Course"):
+            self.create_course(**field)
+
+        assert self.service.get_all() == []
+
+    def test_update_success(self):
+        created = self.create_course()
+
+        result = self.service.update(created["id"], TestConstants.get_update_data())
+
+        assert result["name"] == TestConstants.UPDATED_COURSE_NAME
+        assert result["description"] == TestConstants.UPDATED_COURSE_DESCRIPTION
+        assert self.service.get_by_id(created["id"])["name"] == result["name"]
+
+    def test_update_course_not_found(self):
+        expected_error = TestConstants.get_error_message("course_not_found")
+        with pytest.raises(Exception, match=expected_error):
+            self.service.update(
+                TestConstants.NON_EXISTENT_COURSE_ID,
+                TestConstants.get_update_data(fields=["name"]),
+            )
+
+    def test_update_with_lessons_add_new(self):
+        created = self.create_course()
+        lesson_id = created["lessons"][0]["id"]
+        update_data = TestConstants.get_lessons_update_data()
+        update_data["lessons"][0]["id"] = lesson_id
+
+        self.service.update(created["id"], update_data)
+
+        lessons = self.service.get_by_id(created["id"])["lessons"]
+        assert [(lesson["name"], lesson["youtube_url"]) for lesson in lessons] == [
+            (TestConstants.LESSON_NAME, TestConstants.UPDATED_LESSON_YOUTUBE_URL),
+            (TestConstants.NEW_LESSON_NAME, TestConstants.NEW_LESSON_YOUTUBE_URL),
+        ]
+
+    def test_update_with_lessons_remove_missing(self):
+        created = self.create_course(
+            lessons=[
+                {"name": f"Lesson {i}", "youtube_url": f"url{i}"} for i in range(3)
+            ]
+        )
+        kept_id = created["lessons"][1]["id"]
+
+        self.service.update(created["id"], {"lessons": [{"id": kept_id}]})
+
+        lessons = self.service.get_by_id(created["id"])["lessons"]
+        assert [lesson["id"] for lesson in lessons] == [kept_id]
+
+    def test_delete_by_id_success(self):
+        created = self.create_course()
+
+        assert self.service.delete_by_id(created["id"]) is True
+        assert self.service.get_all() == []
+
+    def test_delete_by_id_not_found(self):
+        expected_error = TestConstants.get_error_message("course_not_found")
+        with pytest.raises(Exception, match=expected_error):
+            self.service.delete_by_id(TestConstants.NON_EXISTENT_COURSE_ID)
+
+    def test_get_all_paginated_with_multiple_pages(self):
+        for i in range(5):
+            self.create_course(name=f"{TestConstants.COURSE_NAME} {i}")
+
+        result = self.service.get_all_paginated(2, 2, sort="id")
+
+        assert result["totalCount"] == 5
+        assert result["totalPages"] == 3
+        assert result["canPreviousPage"] is True
+        assert result["canNextPage"] is True
+        assert [course["name"] for course in result["data"]] == [
+            f"{TestConstants.COURSE_NAME} 2",
+            f"{TestConstants.COURSE_NAME} 3",
+        ]
+
+    def test_create_invalidates_cached_count(self):
+        self.create_course()
+        assert self.service.get_all_paginated(1, 10)["totalCount"] == 1
+
+        self.create_course()
+
+        assert self.service.get_all_paginated(1, 10)["totalCount"] == 2
+
+    def test_get_page_by_cursor_follows_next_cursor(self):
+        for i in range(3):
+            self.create_course(name=f"{TestConstants.COURSE_NAME} {i}")
+
+        first = self.service.get_page_by_cursor(2, sort="id")
+        second = self.service.get_page_by_cursor(2, after=first["nextCursor"], sort="id")
+
+        assert len(first["data"]) == 2
+        assert [course["name"] for course in second["data"]] == [
+            f"{TestConstants.COURSE_NAME} 2"
+        ]
+        assert second["nextCursor"] is None
+
+
+class TestAsyncOnlyBehaviour:
+    def test_iter_all_streams_courses_with_lessons(self, tmp_path):
+        database_uri = f"sqlite:///{tmp_path / 'courses.db'}"
+        engine = create_engine(database_uri)
+        db.metadata.create_all(engine)
+        awaiting = AwaitingService(create_async_course_service(database_uri))
+        for i in range(3):
+            awaiting.create(
+                {
+                    "name": f"Course {i}",
+                    "category": Category.BACKEND.name,
+                    "status": Status.ACTIVE.name,
+                    "lessons": [{"name": "Lesson", "youtube_url": "url"}],
+                }
+            )
+
+        async def collect():
+            return [
+                course async for course in awaiting.service.iter_all(batch_size=2)
+            ]
+
+        courses = awaiting.loop.run_until_complete(collect())
+        awaiting.close()
+        engine.dispose()
+
+        assert [course["name"] for course in courses] == [
+            "Course 0",
+            "Course 1",
+            "Course 2",
+        ]
+        assert all(len(course["lessons"]) == 1 for course in courses)
+
+    @pytest.mark.parametrize(
+        "uri, expected",
+        [
+            ("sqlite:///courses.db", "sqlite+aiosqlite:///courses.db"),
+            (
+                "postgresql://user:secret@db:5432/courses",
+                "postgresql+asyncpg://user:secret@db:5432/courses",
+            ),
+            (
+                "postgresql+psycopg2://user@db/courses",
+                "postgresql+asyncpg://user@db/courses",
+            ),
+        ],
+    )
+    def test_async_database_uri(self, uri, expected):
+        assert async_database_uri(uri) == expected
+
+    def test_async_database_uri_rejects_unknown_backend(self):
+        with pytest.raises(ValueError):
+            async_database_uri("mysql://user@db/courses")
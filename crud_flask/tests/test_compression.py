@@ -0,0 +1,165 @@
+import gzip
+import brotli
+import pytest
+import zstandard
+from crud_flask import create_app
+from crud_flask.config import TestingConfig
+from crud_flask.compression import CODECS, ResponseCompressor, available_encodings
+from crud_flask.models.models import db
+
+DECOMPRESS = {
+    "gzip": gzip.decompress,
+    "br": brotli.decompress,
+    "zstd": lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data),
+}
+
+
+class TestResponseCompression:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.app = create_app("testing")
+        with self.app.app_context():
+            db.create_all()
+        self.client = self.app.test_client()
+
+    def create_courses(self, count):
+        for i in range(count):
+            self.client.post(
+                "/api/courses",
+                json={
+                    "name": f"Course {i}",
+                    "description": "A fairly repetitive description " * 3,
+                    "category": "BACKEND",
+                    "lessons": [{"name": "Lesson", "youtube_url": "url"}],
+                },
+            )
+
+    @pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+    def test_large_json_is_compressed(self, encoding):
+        self.create_courses(20)
+        identity = self.client.get("/api/courses").get_data()
+
+        response = self.client.get(
+            "/api/courses", headers={"Accept-Encoding": encoding}
+        )
+
+        assert response.headers["Content-Encoding"] == encoding
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert int(response.headers["Content-Length"]) < len(identity)
+        assert DECOMPRESS[encoding](response.get_data()) == identity
+
+    def test_negotiation_prefers_quality_then_server_order(self):
+        self.create_courses(20)
+
+        preferred = self.client.get(
+            "/api/courses", headers={"Accept-Encoding": "gzip, br, zstd"}
+        )
+        weighted = self.client.get(
+            "/api/courses", headers={"Accept-Encoding": "gzip;q=1.0, zstd;q=0.5"}
+        )
+        refused = self.client.get(
+            "/api/courses", headers={"Accept-Encoding": "gzip;q=0, identity"}
+        )
+
+        assert preferred.headers["Content-Encoding"] == "zstd"
+        assert weighted.headers["Content-Encoding"] == "gzip"
+        assert "Content-Encoding" not in refused.headers
+
+    def test_small_responses_are_sent_as_is(self):
+        self.create_courses(1)
+
+        response = self.client.get(
+            "/api/courses/1", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert response.get_json()["name"] == "Course 0"
+
+    def test_without_accept_encoding_nothing_changes(self):
+        self.create_courses(20)
+
+        response = self.client.get("/api/courses")
+
+        assert "Content-Encoding" not in response.headers
+        assert len(response.get_json()) == 20
+
+    def test_export_stream_is_compressed(self):
+        self.create_courses(30)
+        identity = self.client.get("/api/courses/export").get_data()
+
+        response = self.client.get(
+            "/api/courses/export", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.is_streamed
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        assert gzip.decompress(response.get_data()) == identity
+
+    def test_compressed_etag_is_weak_and_still_validates(self):
+        self.create_courses(20)
+        headers = {"Accept-Encoding": "gzip"}
+
+        response = self.client.get("/api/courses", headers=headers)
+        etag = response.headers["ETag"]
+        not_modified = self.client.get(
+            "/api/courses", headers={**headers, "If-None-Match": etag}
+        )
+
+        assert etag.startswith('W/"')
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+
+    def test_weak_etag_satisfies_if_match(self):
+        self.create_courses(1)
+        etag = self.client.get("/api/courses/1").headers["ETag"]
+
+        response = self.client.patch(
+            "/api/courses/1",
+            json={"status": "INACTIVE"},
+            headers={"If-Match": f"W/{etag}"},
+        )
+
+        assert response.status_code == 200
+
+    def test_compression_can_be_disabled(self):
+        app = create_app(
+            type("NoCompression", (TestingConfig,), {"COMPRESSION_ENABLED": False})
+        )
+        with app.app_context():
+            db.create_all()
+        self.client = app.test_client()
+        self.create_courses(20)
+
+        response = self.client.get("/api/courses", headers={"Accept-Encoding": "gzip"})
+
+        assert "compression" not in app.extensions
+        assert "Content-Encoding" not in response.headers
+
+
+class TestEncodingSelection:
+    def test_missing_optional_codecs_are_skipped(self, monkeypatch):
+        monkeypatch.setitem(CODECS, "br", (None, CODECS["br"][1]))
+
+        assert available_encodings(["zstd", "br", "gzip"]) == ["zstd", "gzip"]
+
+    def test_unknown_encoding_is_rejected(self):
+        with pytest.raises(ValueError, match="Invalid compression encoding"):
+            ResponseCompressor(encodings=["deflate"])
+
+
+class TestStreamCompression:
+    @pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+    def test_stream_flushes_before_the_end(self, encoding):
+        rows = [
+            f'{{"id": {i}, "name": "Course {i}", "category": "Backend"}}\n'.encode()
+            for i in range(2000)
+        ]
+        compressor = ResponseCompressor(stream_flush_size=8 * 1024)
+
+        chunks = list(compressor._stream(encoding, iter(rows)))
+
+        assert len([chunk for chunk in chunks[:-1] if chunk]) > 1
+        assert len(chunks[0]) > 10
+        assert DECOMPRESS[encoding](b"".join(chunks)) == b"".join(rows)
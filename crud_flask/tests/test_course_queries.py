@@ -0,0 +1,488 @@
+import pytest
+from sqlalchemy import text
+from crud_flask.services.course_service import CourseService
+from crud_flask.services.search import install_sqlite_search
+from crud_flask.models.models import Category, Course, Lesson, Status
+from test_constants import TestConstants
+
+
+class TestCourseQueries:
+    @pytest.fixture(autouse=True)
+    def setup(self, sqlite_session_factory, query_counter, seed_courses):
+        self.session_factory = sqlite_session_factory
+        self.queries = query_counter
+        self.seed_courses = seed_courses
+
+    def make_service(self, lesson_loading="selectin", fast_serialization=False):
+        return CourseService(
+            session_factory=self.session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+            lesson_loading=lesson_loading,
+            fast_serialization=fast_serialization,
+        )
+
+    def count_queries(self, func, *args):
+        self.queries.clear()
+        result = func(*args)
+        return result, len(self.queries)
+
+    @pytest.mark.parametrize("lesson_loading", ["selectin", "joined"])
+    def test_get_all_query_count_is_constant(self, lesson_loading):
+        service = self.make_service(lesson_loading)
+
+        self.seed_courses(3)
+        small, small_count = self.count_queries(service.get_all)
+
+        self.seed_courses(30)
+        large, large_count = self.count_queries(service.get_all)
+
+        assert len(small) == 3
+        assert len(large) == 33
+        assert all(len(course["lessons"]) == 2 for course in large)
+        assert small_count == large_count
+        assert large_count <= 2
+
+    @pytest.mark.parametrize("lesson_loading", ["selectin", "joined"])
+    def test_get_all_paginated_query_count_is_constant(self, lesson_loading):
+        service = self.make_service(lesson_loading)
+        self.seed_courses(60)
+
+        small, small_count = self.count_queries(service.get_all_paginated, 1, 5)
+        large, large_count = self.count_queries(service.get_all_paginated, 1, 50)
+
+        assert len(small["data"]) == 5
+        assert len(large["data"]) == 50
+        assert all(len(course["lessons"]) == 2 for course in large["data"])
+        assert small_count == large_count
+
+    def test_lazy_loading_issues_one_query_per_course(self):
+        service = self.make_service("none")
+        self.seed_courses(5)
+
+        _, query_count = self.count_queries(service.get_all)
+
+        assert query_count == 1 + 5
+
+    def test_invalid_lesson_loading_strategy(self):
+        with pytest.raises(ValueError):
+            self.make_service("eager")
+
+    def test_cursor_pages_walk_forward_and_back(self):
+        service = self.make_service()
+        self.seed_courses(7, same_created_at=True)
+
+        first = service.get_page_by_cursor(3)
+        second = service.get_page_by_cursor(3, after=first["nextCursor"])
+        third = service.get_page_by_cursor(3, after=second["nextCursor"])
+        back = service.get_page_by_cursor(3, before=second["prevCursor"])
+
+        ids = [
+            course["id"] for page in (first, second, third) for course in page["data"]
+        ]
+        assert ids == list(range(1, 8))
+        assert first["prevCursor"] is None
+        assert third["nextCursor"] is None
+        assert third["prevCursor"] is not None
+        assert back["data"] == first["data"]
+        assert back["prevCursor"] is None
+
+    def test_cursor_page_query_count_is_constant(self):
+        service = self.make_service()
+        self.seed_courses(40)
+        cursor = service.get_page_by_cursor(5)["nextCursor"]
+
+        small, small_count = self.count_queries(service.get_page_by_cursor, 5, cursor)
+        large, large_count = self.count_queries(service.get_page_by_cursor, 30, cursor)
+
+        assert len(small["data"]) == 5
+        assert len(large["data"]) == 30
+        assert small_count == large_count == 2
+
+    def test_cursor_invalid(self):
+        service = self.make_service()
+
+        with pytest.raises(ValueError):
+            service.get_page_by_cursor(5, after="not-a-cursor")
+
+    def test_iter_all_streams_in_batches(self):
+        service = self.make_service()
+        self.seed_courses(25)
+        self.queries.clear()
+
+        courses = service.iter_all(batch_size=10)
+        first = next(courses)
+
+        assert first["id"] == 1
+        assert len(self.queries) == 2
+
+        remaining = list(courses)
+
+        assert len(remaining) == 24
+        assert len(self.queries) == 4
+
+    def test_bulk_create_inserts_courses_and_lessons(self):
+        service = self.make_service()
+        items = [
+            TestConstants.get_complete_course_data(include_id=False) for _ in range(3)
+        ]
+
+        self.queries.clear()
+        result = service.bulk_create(items)
+
+        assert result["created"] == 3
+        assert result["failed"] == 0
+        assert [item["id"] for item in result["results"]] == [1, 2, 3]
+        assert (
+            len([q for q in self.queries if q.startswith("INSERT INTO lessons")]) == 1
+        )
+        courses = service.get_all()
+        assert [len(course["lessons"]) for course in courses] == [1, 1, 1]
+        assert courses[0]["created_at"] is not None
+
+    def test_bulk_create_atomic_rejects_everything_on_error(self):
+        service = self.make_service()
+        valid = TestConstants.get_complete_course_data(include_id=False)
+        invalid = dict(valid, category=TestConstants.INVALID_CATEGORY)
+
+        result = service.bulk_create([valid, invalid])
+
+        assert result["created"] == 0
+        assert result["failed"] == 1
+        assert [item["status"] for item in result["results"]] == ["skipped", "error"]
+        assert service.get_all() == []
+
+    def test_bulk_create_partial_inserts_valid_items(self):
+        service = self.make_service()
+        valid = TestConstants.get_complete_course_data(include_id=False)
+        invalid = dict(valid, lessons=[{"name": TestConstants.LESSON_NAME}])
+
+        result = service.bulk_create([invalid, valid], atomic=False)
+
+        assert result["created"] == 1
+        assert result["results"][0]["status"] == "error"
+        assert result["results"][1] == {"index": 1, "status": "created", "id": 1}
+        assert len(service.get_all()) == 1
+
+    @pytest.mark.parametrize(
+        "bad", [{"description": 42}, {"lessons": "Lesson 1"}, {"lessons": 3}]
+    )
+    def test_bulk_create_partial_reports_type_errors_per_item(self, bad):
+        service = self.make_service()
+        valid = TestConstants.get_complete_course_data(include_id=False)
+
+        result = service.bulk_create([dict(valid, **bad), valid], atomic=False)
+
+        assert result["created"] == 1
+        assert result["results"][0]["status"] == "error"
+        assert len(service.get_all()) == 1
+
+    def test_update_syncs_lessons_with_set_based_statements(self):
+        service = self.make_service()
+        self.seed_courses(1, lessons_per_course=50)
+        lessons = [{"id": id, "name": f"Renamed {id}"} for id in range(1, 26)]
+        lessons += [
+            {"name": TestConstants.NEW_LESSON_NAME, "youtube_url": f"url{i}"}
+            for i in range(10)
+        ]
+
+        self.queries.clear()
+        result = service.update(
+            1, {"name": TestConstants.UPDATED_COURSE_NAME, "lessons": lessons}
+        )
+        writes = [q.split()[0] for q in self.queries if not q.startswith("SELECT")]
+
+        assert result["name"] == TestConstants.UPDATED_COURSE_NAME
+        assert len(result["lessons"]) == 35
+        assert result["lessons"][0]["name"] == "Renamed 1"
+        assert result["lessons"][0]["youtube_url"] == TestConstants.LESSON_YOUTUBE_URL
+        assert writes == ["UPDATE", "DELETE", "UPDATE", "INSERT"]
+
+    def test_update_moving_a_course_invalidates_cached_counts(self):
+        service = CourseService(
+            session_factory=self.session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+            count_mode="cached",
+        )
+        self.seed_courses(3, lessons_per_course=0)
+        assert service.get_all_paginated(1, 10, category="BACKEND")["totalCount"] == 3
+
+        service.update(1, {"category": "FRONTEND"})
+
+        assert service.get_all_paginated(1, 10, category="BACKEND")["totalCount"] == 2
+        assert service.get_all_paginated(1, 10, category="FRONTEND")["totalCount"] == 1
+
+    def seed_catalog(self):
+        self.seed_courses(3, category=Category.BACKEND, status=Status.ACTIVE)
+        self.seed_courses(2, category=Category.FRONTEND, status=Status.ACTIVE)
+        self.seed_courses(4, category=Category.FRONTEND, status=Status.INACTIVE)
+
+    def test_get_all_paginated_filters(self):
+        service = self.make_service()
+        self.seed_catalog()
+
+        result = service.get_all_paginated(
+            1, 10, category="Frontend", status="INACTIVE"
+        )
+
+        assert result["totalCount"] == 4
+        assert {course["category"] for course in result["data"]} == {"Frontend"}
+        assert {course["status"] for course in result["data"]} == {"Inactive"}
+
+    def test_get_all_paginated_sorts(self):
+        service = self.make_service()
+        self.seed_catalog()
+
+        result = service.get_all_paginated(1, 3, sort="name", order="desc")
+
+        assert [course["name"] for course in result["data"]] == [
+            f"{TestConstants.COURSE_NAME} 3",
+            f"{TestConstants.COURSE_NAME} 2",
+            f"{TestConstants.COURSE_NAME} 2",
+        ]
+        assert [course["id"] for course in result["data"]] == [9, 8, 3]
+
+    def test_get_all_paginated_invalid_filters(self):
+        service = self.make_service()
+
+        with pytest.raises(ValueError):
+            service.get_all_paginated(1, 10, category=TestConstants.INVALID_CATEGORY)
+        with pytest.raises(ValueError):
+            service.get_all_paginated(1, 10, sort="description")
+        with pytest.raises(ValueError):
+            service.get_all_paginated(1, 10, order="sideways")
+
+    def test_cursor_pages_with_filters_and_sort(self):
+        service = self.make_service()
+        self.seed_catalog()
+        query = {"category": "FRONTEND", "sort": "name", "order": "desc"}
+
+        first = service.get_page_by_cursor(4, **query)
+        second = service.get_page_by_cursor(4, after=first["nextCursor"], **query)
+        back = service.get_page_by_cursor(4, before=second["prevCursor"], **query)
+
+        ids = [course["id"] for page in (first, second) for course in page["data"]]
+        assert ids == [9, 8, 7, 5, 6, 4]
+        assert second["nextCursor"] is None
+        assert back["data"] == first["data"]
+
+    def test_cursor_must_match_sort(self):
+        service = self.make_service()
+        self.seed_courses(3)
+        cursor = service.get_page_by_cursor(1, sort="name")["nextCursor"]
+
+        with pytest.raises(ValueError):
+            service.get_page_by_cursor(1, after=cursor)
+
+    def test_search_ranks_and_rolls_up_lessons(self):
+        service = self.make_service()
+        service.bulk_create(
+            [
+                {"name": "Python basics", "category": "BACKEND"},
+                {
+                    "name": "Web APIs",
+                    "description": "Build APIs with Python and Flask",
+                    "category": "BACKEND",
+                },
+                {
+                    "name": "React",
+                    "category": "FRONTEND",
+                    "lessons": [
+                        {"name": "Calling python services", "youtube_url": "u"}
+                    ],
+                },
+                {"name": "Go", "category": "BACKEND"},
+            ]
+        )
+
+        result = service.search("python")
+
+        assert result["totalCount"] == 3
+        assert {course["id"] for course in result["data"]} == {1, 2, 3}
+        assert result["data"][0]["id"] == 1
+        ranks = [course["rank"] for course in result["data"]]
+        assert ranks == sorted(ranks, reverse=True)
+
+    def test_search_indexes_existing_rows_and_tracks_changes(self):
+        service = self.make_service()
+        self.seed_courses(3)
+        assert service.search(TestConstants.LESSON_NAME)["totalCount"] == 3
+
+        service.update(
+            1, {"lessons": [{"name": "Kubernetes deep dive", "youtube_url": "u"}]}
+        )
+        service.update(2, {"name": "Kubernetes"})
+
+        result = service.search("kubernetes")
+        assert {course["id"] for course in result["data"]} == {1, 2}
+        assert service.search(TestConstants.LESSON_NAME)["totalCount"] == 2
+
+    def test_search_follows_a_lesson_moved_to_another_course(self):
+        service = self.make_service()
+        self.seed_courses(2, lessons_per_course=0)
+        session = self.session_factory()
+        session.add(Lesson(name="Kubernetes", youtube_url="u", course_id=1))
+        session.commit()
+
+        session.execute(text("UPDATE lessons SET course_id = 2"))
+        session.commit()
+        session.close()
+
+        result = service.search("kubernetes")
+        assert [course["id"] for course in result["data"]] == [2]
+
+    def test_search_reinstall_rebuilds_after_a_lost_trigger(self):
+        service = self.make_service()
+        session = self.session_factory()
+        session.execute(text("DROP TRIGGER courses_fts_after_insert"))
+        session.commit()
+        self.seed_courses(2)
+
+        assert install_sqlite_search(session) is True
+        session.commit()
+        assert install_sqlite_search(session) is False
+        session.close()
+        assert service.search(TestConstants.COURSE_NAME)["totalCount"] == 2
+
+    def test_search_paginates(self):
+        service = self.make_service()
+        self.seed_courses(5)
+
+        page = service.search(TestConstants.COURSE_NAME, page=2, per_page=2)
+        beyond = service.search(TestConstants.COURSE_NAME, page=4, per_page=2)
+
+        assert len(page["data"]) == 2
+        assert page["totalCount"] == 5
+        assert page["canNextPage"] is True
+        assert beyond["data"] == []
+        assert beyond["totalCount"] == 5
+
+    def test_search_escapes_query_syntax(self):
+        service = self.make_service()
+        self.seed_courses(1)
+
+        assert service.search('"Test AND OR (')["totalCount"] == 0
+
+    def test_sparse_fields_select_only_requested_columns(self):
+        service = self.make_service()
+        self.seed_courses(3)
+
+        courses, query_count = self.count_queries(
+            service.get_all, ["id", "name", "status"], False
+        )
+
+        assert query_count == 1
+        assert "description" not in self.queries[0]
+        assert "lessons" not in self.queries[0]
+        assert courses[0] == {
+            "id": 1,
+            "name": f"{TestConstants.COURSE_NAME} 0",
+            "status": TestConstants.COURSE_STATUS,
+        }
+
+    def test_sparse_fields_with_lessons(self):
+        service = self.make_service()
+        self.seed_courses(2)
+
+        page = service.get_all_paginated(1, 10, fields=["name"], include_lessons=True)
+
+        assert set(page["data"][0]) == {"name", "lessons"}
+        assert len(page["data"][0]["lessons"]) == 2
+
+    def test_sparse_fields_on_cursor_pages(self):
+        service = self.make_service()
+        self.seed_courses(3)
+
+        query = {"sort": "name", "fields": ["id"], "include_lessons": False}
+
+        first = service.get_page_by_cursor(2, **query)
+        second = service.get_page_by_cursor(2, after=first["nextCursor"], **query)
+
+        assert first["data"] == [{"id": 1}, {"id": 2}]
+        assert second["data"] == [{"id": 3}]
+
+    def test_get_by_id_without_lessons(self):
+        service = self.make_service()
+        self.seed_courses(1)
+
+        course, query_count = self.count_queries(service.get_by_id, 1, None, False)
+
+        assert query_count == 1
+        assert "lessons" not in course
+        assert course["name"] == f"{TestConstants.COURSE_NAME} 0"
+
+    def test_invalid_fields(self):
+        service = self.make_service()
+
+        with pytest.raises(ValueError):
+            service.get_all(fields=["id", "password"])
+
+    @pytest.mark.parametrize(
+        "projection",
+        [
+            {},
+            {"fields": ["name", "status"]},
+            {"fields": ["id"], "include_lessons": True},
+        ],
+    )
+    def test_fast_serialization_matches_orm_output(self, projection):
+        service = self.make_service()
+        fast_service = self.make_service(fast_serialization=True)
+        self.seed_catalog()
+
+        assert fast_service.get_all(**projection) == service.get_all(**projection)
+        assert fast_service.get_all_paginated(
+            2, 4, category="FRONTEND", sort="name", **projection
+        ) == service.get_all_paginated(
+            2, 4, category="FRONTEND", sort="name", **projection
+        )
+
+    def test_fast_serialization_query_count(self):
+        service = self.make_service(fast_serialization=True)
+        self.seed_courses(30)
+
+        _, all_count = self.count_queries(service.get_all)
+        _, page_count = self.count_queries(service.get_all_paginated, 1, 20)
+
+        assert all_count == 2
+        assert page_count == 3
+
+    def test_delete_cascades_lessons_in_one_statement(self):
+        service = self.make_service()
+        self.seed_courses(2)
+
+        _, delete_count = self.count_queries(service.delete_by_id, 1)
+
+        session = self.session_factory()
+        assert session.query(Lesson).filter_by(course_id=1).count() == 0
+        assert session.query(Lesson).filter_by(course_id=2).count() == 2
+        session.close()
+        assert [q for q in self.queries if q.startswith("DELETE")] == [
+            "DELETE FROM courses WHERE courses.id = ?"
+        ]
+        assert delete_count == 1
+
+    def test_delete_missing_course(self):
+        service = self.make_service()
+
+        with pytest.raises(Exception, match="Course with ID 99 not found"):
+            service.delete_by_id(99)
+
+    def test_delete_many(self):
+        service = self.make_service()
+        self.seed_courses(4)
+
+        result, query_count = self.count_queries(service.delete_many, [3, 1, 99, 3])
+
+        assert result == {"deleted": [3, 1], "notFound": [99]}
+        assert query_count == 1
+        session = self.session_factory()
+        assert [c.id for c in session.query(Course).order_by(Course.id)] == [2, 4]
+        assert session.query(Lesson).count() == 4
+        session.close()
+
+    @pytest.mark.parametrize("ids", [[], list(range(1, 1002))])
+    def test_delete_many_rejects_empty_or_oversized_batches(self, ids):
+        with pytest.raises(ValueError):
+            self.make_service().delete_many(ids)
@@ -0,0 +1,363 @@
+import json
+import pytest
+from crud_flask.models.models import Category
+from crud_flask.services.course_service import MAX_BULK_ITEMS
+from test_constants import TestConstants
+
+
+class TestCourseRoutes:
+    def test_get_all_paginated_by_cursor(self, sqlite_client, seed_courses):
+        seed_courses(5)
+
+        first = sqlite_client.get("/api/courses/paginated?per_page=2&after=")
+        second = sqlite_client.get(
+            f"/api/courses/paginated?per_page=2&after={first.json['nextCursor']}"
+        )
+
+        assert first.status_code == 200
+        assert [course["id"] for course in first.json["data"]] == [1, 2]
+        assert [course["id"] for course in second.json["data"]] == [3, 4]
+        assert "pageIndex" not in second.json
+
+    def test_get_all_paginated_invalid_cursor(self, sqlite_client):
+        response = sqlite_client.get("/api/courses/paginated?after=garbage")
+
+        assert response.status_code == 400
+        assert response.json == {"error": "Invalid pagination parameters"}
+
+    def test_export_ndjson(self, sqlite_client, seed_courses):
+        seed_courses(3)
+
+        response = sqlite_client.get("/api/courses/export")
+        lines = response.get_data(as_text=True).splitlines()
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/x-ndjson"
+        assert [json.loads(line)["id"] for line in lines] == [1, 2, 3]
+        assert all(len(json.loads(line)["lessons"]) == 2 for line in lines)
+
+    def test_export_json(self, sqlite_client, seed_courses):
+        seed_courses(3)
+
+        response = sqlite_client.get("/api/courses/export?format=json")
+
+        assert response.status_code == 200
+        assert [course["id"] for course in response.json] == [1, 2, 3]
+
+    def test_export_empty_json(self, sqlite_client):
+        response = sqlite_client.get("/api/courses/export?format=json")
+
+        assert response.json == []
+
+    def test_export_unsupported_format(self, sqlite_client):
+        response = sqlite_client.get("/api/courses/export?format=csv")
+
+        assert response.status_code == 400
+
+    def test_bulk_create(self, sqlite_client):
+        payload = [TestConstants.get_complete_course_data(include_id=False)] * 2
+
+        response = sqlite_client.post("/api/courses/bulk", json=payload)
+
+        assert response.status_code == 201
+        assert response.json["created"] == 2
+
+    def test_bulk_create_partial_failure(self, sqlite_client):
+        valid = TestConstants.get_complete_course_data(include_id=False)
+        invalid = dict(valid, name="")
+
+        response = sqlite_client.post(
+            "/api/courses/bulk?mode=partial", json=[valid, invalid]
+        )
+
+        assert response.status_code == 207
+        assert response.json["created"] == 1
+        assert response.json["failed"] == 1
+
+    def test_bulk_create_rejects_too_many_items(self, sqlite_client):
+        payload = [TestConstants.get_complete_course_data(include_id=False)] * (
+            MAX_BULK_ITEMS + 1
+        )
+
+        response = sqlite_client.post("/api/courses/bulk", json=payload)
+
+        assert response.status_code == 400
+        assert sqlite_client.get("/api/courses").json == []
+
+    def test_bulk_create_requires_array(self, sqlite_client):
+        response = sqlite_client.post("/api/courses/bulk", json={"name": "x"})
+
+        assert response.status_code == 400
+
+    def test_get_by_id_not_modified(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        first = sqlite_client.get("/api/courses/1")
+
+        second = sqlite_client.get(
+            "/api/courses/1", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.get_data() == b""
+        assert second.headers["ETag"] == first.headers["ETag"]
+
+    def test_get_by_id_not_found(self, sqlite_client):
+        response = sqlite_client.get("/api/courses/9")
+
+        assert response.status_code == 404
+
+    def test_get_by_id_etag_changes_with_lessons(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1").headers["ETag"]
+
+        sqlite_client.put(
+            "/api/courses/1",
+            json={"lessons": [{"id": 1}, {"name": "New", "youtube_url": "url"}]},
+        )
+        response = sqlite_client.get("/api/courses/1", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_get_all_paginated_not_modified(self, sqlite_client, seed_courses):
+        seed_courses(3)
+        url = "/api/courses/paginated?page=1&per_page=2"
+        etag = sqlite_client.get(url).headers["ETag"]
+
+        cached = sqlite_client.get(url, headers={"If-None-Match": etag})
+        other_page = sqlite_client.get(
+            "/api/courses/paginated?page=2&per_page=2", headers={"If-None-Match": etag}
+        )
+
+        assert cached.status_code == 304
+        assert other_page.status_code == 200
+
+    def test_cursor_page_etag_costs_no_extra_query(
+        self, sqlite_client, seed_courses, query_counter
+    ):
+        seed_courses(3, lessons_per_course=0)
+        url = "/api/courses/paginated?per_page=2&after="
+
+        query_counter.clear()
+        etag = sqlite_client.get(url).headers["ETag"]
+        # The page and its lessons, nothing over the whole table
+        assert len(query_counter) == 2
+        assert not any("count(" in statement for statement in query_counter)
+
+        assert (
+            sqlite_client.get(url, headers={"If-None-Match": etag}).status_code == 304
+        )
+        sqlite_client.patch("/api/courses/1", json={"name": "Renamed"})
+        assert (
+            sqlite_client.get(url, headers={"If-None-Match": etag}).status_code == 200
+        )
+
+    def test_update_rejects_stale_if_match(self, sqlite_client, seed_courses):
+        seed_courses(1)
+
+        response = sqlite_client.put(
+            "/api/courses/1",
+            json={"name": TestConstants.UPDATED_COURSE_NAME},
+            headers={"If-Match": '"stale"'},
+        )
+
+        assert response.status_code == 412
+        assert sqlite_client.get("/api/courses/1").json["name"] != (
+            TestConstants.UPDATED_COURSE_NAME
+        )
+
+    def test_patch_merges_fields(self, sqlite_client, seed_courses, query_counter):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1").headers["ETag"]
+
+        query_counter.clear()
+        response = sqlite_client.patch(
+            "/api/courses/1",
+            json={"status": "inactive", "description": None},
+            content_type="application/merge-patch+json",
+            headers={"If-Match": etag},
+        )
+
+        course = response.get_json()
+        assert response.status_code == 200
+        assert course["status"] == "Inactive"
+        assert course["description"] is None
+        assert course["name"] == f"{TestConstants.COURSE_NAME} 0"
+        assert "lessons" not in course
+        assert response.headers["ETag"] not in (None, etag)
+        # If-Match, the write and the new ETag all come from one statement
+        assert len(query_counter) == 1
+        assert query_counter[0].startswith("UPDATE")
+        assert "courses.version IN" in query_counter[0]
+        assert "RETURNING" in query_counter[0]
+        assert len(sqlite_client.get("/api/courses/1").get_json()["lessons"]) == 2
+
+    def test_patch_missing_course(self, sqlite_client):
+        response = sqlite_client.patch("/api/courses/9", json={"status": "ACTIVE"})
+
+        assert response.status_code == 404
+
+    def test_empty_patch_returns_course_unchanged(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1").headers["ETag"]
+
+        response = sqlite_client.patch("/api/courses/1", json={})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] == etag
+
+    @pytest.mark.parametrize(
+        "body",
+        [
+            {"lessons": []},
+            {"id": 5},
+            {"name": None},
+            {"category": "unknown"},
+            {"description": 3},
+            ["status", "ACTIVE"],
+        ],
+    )
+    def test_patch_rejects_invalid_documents(self, sqlite_client, seed_courses, body):
+        seed_courses(1)
+
+        response = sqlite_client.patch("/api/courses/1", json=body)
+
+        assert response.status_code == 400
+
+    def test_patch_rejects_stale_if_match(self, sqlite_client, seed_courses):
+        seed_courses(1)
+
+        response = sqlite_client.patch(
+            "/api/courses/1", json={"name": "Changed"}, headers={"If-Match": '"stale"'}
+        )
+
+        assert response.status_code == 412
+
+    def test_delete_with_matching_if_match(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1").headers["ETag"]
+
+        response = sqlite_client.delete("/api/courses/1", headers={"If-Match": etag})
+
+        assert response.status_code == 200
+
+    def test_writer_holding_an_outdated_tag_loses(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1").headers["ETag"]
+
+        first = sqlite_client.put(
+            "/api/courses/1", json={"name": "First"}, headers={"If-Match": etag}
+        )
+        second = sqlite_client.patch(
+            "/api/courses/1", json={"name": "Second"}, headers={"If-Match": etag}
+        )
+        third = sqlite_client.delete("/api/courses/1", headers={"If-Match": etag})
+
+        assert first.status_code == 200
+        assert (second.status_code, third.status_code) == (412, 412)
+        assert sqlite_client.get("/api/courses/1").get_json()["name"] == "First"
+
+    def test_if_match_is_checked_by_the_write(
+        self, sqlite_client, seed_courses, query_counter
+    ):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1").headers["ETag"]
+
+        query_counter.clear()
+        response = sqlite_client.delete("/api/courses/1", headers={"If-Match": etag})
+
+        assert response.status_code == 200
+        assert len(query_counter) == 1
+        assert query_counter[0].startswith("DELETE")
+        assert "courses.version IN" in query_counter[0]
+
+    def test_if_match_on_missing_course(self, sqlite_client):
+        response = sqlite_client.patch(
+            "/api/courses/9", json={"name": "Gone"}, headers={"If-Match": '"9-1"'}
+        )
+
+        assert response.status_code == 404
+
+    def test_delete_many(self, sqlite_client, seed_courses):
+        seed_courses(3)
+
+        response = sqlite_client.delete("/api/courses?ids=1,3,7")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"deleted": [1, 3], "notFound": [7]}
+        assert sqlite_client.get("/api/courses/2").status_code == 200
+
+    @pytest.mark.parametrize("ids", ["", "1,abc"])
+    def test_delete_many_invalid_ids(self, sqlite_client, ids):
+        response = sqlite_client.delete(f"/api/courses?ids={ids}")
+
+        assert response.status_code == 400
+
+    def test_get_all_paginated_filters_and_sorts(self, sqlite_client, seed_courses):
+        seed_courses(2, category=Category.BACKEND)
+        seed_courses(2, category=Category.FRONTEND)
+
+        response = sqlite_client.get(
+            "/api/courses/paginated?category=Frontend&sort=id&order=desc"
+        )
+
+        assert response.status_code == 200
+        assert response.json["totalCount"] == 2
+        assert [course["id"] for course in response.json["data"]] == [4, 3]
+
+    def test_get_all_paginated_invalid_sort(self, sqlite_client):
+        response = sqlite_client.get("/api/courses/paginated?sort=description")
+
+        assert response.status_code == 400
+
+    def test_search(self, sqlite_client, seed_courses):
+        seed_courses(2)
+
+        response = sqlite_client.get("/api/courses/search?q=course&per_page=1")
+
+        assert response.status_code == 200
+        assert response.json["totalCount"] == 2
+        assert len(response.json["data"]) == 1
+
+    def test_search_requires_query(self, sqlite_client):
+        response = sqlite_client.get("/api/courses/search?q=%20")
+
+        assert response.status_code == 400
+
+    def test_sparse_fieldsets(self, sqlite_client, seed_courses):
+        seed_courses(1)
+
+        sparse = sqlite_client.get("/api/courses?fields=id,name")
+        with_lessons = sqlite_client.get("/api/courses/1?fields=id&include=lessons")
+        without_lessons = sqlite_client.get("/api/courses/1?include=")
+
+        assert sparse.json == [{"id": 1, "name": f"{TestConstants.COURSE_NAME} 0"}]
+        assert set(with_lessons.json) == {"id", "lessons"}
+        assert "lessons" not in without_lessons.json
+        assert "description" in without_lessons.json
+        assert with_lessons.headers["ETag"] != without_lessons.headers["ETag"]
+
+    def test_projection_etag_works_as_if_match(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1?fields=id,name").headers["ETag"]
+
+        response = sqlite_client.patch(
+            "/api/courses/1", json={"name": "Renamed"}, headers={"If-Match": etag}
+        )
+
+        assert etag.startswith('"1-1;')
+        assert response.status_code == 200
+
+    def test_sparse_fieldsets_on_export(self, sqlite_client, seed_courses):
+        seed_courses(2)
+
+        response = sqlite_client.get("/api/courses/export?format=json&fields=id")
+
+        assert response.json == [{"id": 1}, {"id": 2}]
+
+    def test_invalid_fields(self, sqlite_client):
+        for url in ("/api/courses?fields=secret", "/api/courses/paginated?include=x"):
+            response = sqlite_client.get(url)
+
+            assert response.status_code == 400
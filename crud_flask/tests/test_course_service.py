@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from crud_flask.services.course_service import CourseService
+from crud_flask.services.count_cache import TotalCountCache
 from crud_flask.models.models import Course, Lesson, Category, Status
 from datetime import datetime
 from test_constants import TestConstants  # Import the new constants class
@@ -35,7 +36,7 @@ class TestCourseService:
     def test_get_all_success(self):
         # Arrange
         mock_courses = [self.mock_course]
-        self.mock_session.query.return_value.all.return_value = mock_courses
+        self.mock_session.query.return_value.options.return_value.all.return_value = mock_courses
 
         # Act
         result = self.course_service.get_all()
@@ -50,7 +51,7 @@ class TestCourseService:
 
     def test_get_all_empty_result(self):
         # Arrange
-        self.mock_session.query.return_value.all.return_value = []
+        self.mock_session.query.return_value.options.return_value.all.return_value = []
 
         # Act
         result = self.course_service.get_all()
@@ -219,79 +220,47 @@ class TestCourseService:
     def test_update_with_lessons_add_new(self):
         # Arrange
         course_id = TestConstants.COURSE_ID
-        existing_lesson = Mock(spec=Lesson)
-        existing_lesson.id = TestConstants.LESSON_ID
-        existing_lesson.name = TestConstants.LESSON_NAME
-
         existing_course = Mock(spec=Course)
         existing_course.id = course_id
-        existing_course.lessons = Mock()
-        existing_course.lessons.__iter__ = Mock(return_value=iter([existing_lesson]))
-        existing_course.lessons.append = Mock()
         existing_course.to_dict.return_value = {"id": course_id}
 
         update_data = TestConstants.get_lessons_update_data()
 
         self.mock_session.query.return_value.get.return_value = existing_course
+        self.mock_session.scalars.return_value = [TestConstants.LESSON_ID]
 
-        with patch.object(
-            self.course_service, "_CourseService__dict_to_course"
-        ) as mock_dict_to_course:
-            temp_course_mock = Mock(spec=Course)
-            temp_course_mock.lessons = []
-            for lesson_data in update_data.get("lessons", []):
-                lesson_mock = Mock(spec=Lesson)
-                lesson_mock.id = lesson_data.get("id")
-                lesson_mock.name = lesson_data.get("name")
-                lesson_mock.youtube_url = lesson_data.get("youtube_url")
-                temp_course_mock.lessons.append(lesson_mock)
-
-            mock_dict_to_course.return_value = temp_course_mock
-
-            with patch(
-                "crud_flask.services.course_service.Lesson"
-            ) as mock_lesson_class:
-                # Configure what the constructor should return
-                new_lesson_instance = Mock(spec=Lesson)
-                new_lesson_instance.name = TestConstants.NEW_LESSON_NAME
-                new_lesson_instance.youtube_url = TestConstants.NEW_LESSON_YOUTUBE_URL
-                mock_lesson_class.return_value = new_lesson_instance
-
-                # Act
-                self.course_service.update(course_id, update_data)
-
-                # Assert
-                # Verify Lesson constructor was called with correct parameters
-                mock_lesson_class.assert_called_once_with(
-                    name=TestConstants.NEW_LESSON_NAME,
-                    youtube_url=TestConstants.NEW_LESSON_YOUTUBE_URL,
-                    course=existing_course,
-                )
-
-                # Verify new lesson was added to list
-                existing_course.lessons.append.assert_called_once_with(
-                    new_lesson_instance
-                )
-
-                # Verify session.add was called with new lesson
-                self.mock_session.add.assert_called_once_with(new_lesson_instance)
-                self.mock_session.commit.assert_called_once()
-                self.mock_session.close.assert_called_once()
+        # Act
+        self.course_service.update(course_id, update_data)
+
+        # Assert
+        # Existing lesson is updated in bulk, new lesson inserted in bulk,
+        # nothing is deleted because every existing lesson was submitted
+        assert self.mock_session.execute.call_count == 2
+        update_call, insert_call = self.mock_session.execute.call_args_list
+        assert update_call.args[1] == [
+            {
+                "id": TestConstants.LESSON_ID,
+                "name": TestConstants.LESSON_NAME,
+                "youtube_url": TestConstants.UPDATED_LESSON_YOUTUBE_URL,
+            }
+        ]
+        assert insert_call.args[1] == [
+            {
+                "name": TestConstants.NEW_LESSON_NAME,
+                "youtube_url": TestConstants.NEW_LESSON_YOUTUBE_URL,
+                "course_id": course_id,
+            }
+        ]
+        self.mock_session.add.assert_not_called()
+        self.mock_session.commit.assert_called_once()
+        self.mock_session.close.assert_called_once()
 
     def test_update_with_lessons_modify_existing(self):
         """Test course update by modifying existing lesson"""
         # Arrange
         course_id = TestConstants.COURSE_ID
-        existing_lesson = Mock(spec=Lesson)
-        existing_lesson.id = TestConstants.LESSON_ID
-        existing_lesson.name = TestConstants.LESSON_NAME
-        existing_lesson.youtube_url = TestConstants.LESSON_YOUTUBE_URL
-
         existing_course = Mock(spec=Course)
         existing_course.id = course_id
-        existing_course.lessons = Mock()
-        existing_course.lessons.__iter__ = Mock(return_value=iter([existing_lesson]))
-        existing_course.lessons.append = Mock()
         existing_course.to_dict.return_value = {"id": course_id}
 
         update_data = {
@@ -305,36 +274,66 @@ class TestCourseService:
         }
 
         self.mock_session.query.return_value.get.return_value = existing_course
+        self.mock_session.scalars.return_value = [TestConstants.LESSON_ID]
 
         # Act
         self.course_service.update(course_id, update_data)
 
         # Assert
-        # Verify existing lesson was updated
-        assert existing_lesson.name == "Updated Lesson Name"
-        assert existing_lesson.youtube_url == "updated_url"
+        # Verify existing lesson was updated with a single bulk statement
+        self.mock_session.execute.assert_called_once()
+        assert self.mock_session.execute.call_args.args[1] == [
+            {
+                "id": TestConstants.LESSON_ID,
+                "name": "Updated Lesson Name",
+                "youtube_url": "updated_url",
+            }
+        ]
         self.mock_session.commit.assert_called_once()
         self.mock_session.close.assert_called_once()
 
+    def test_update_with_lessons_remove_missing(self):
+        # Arrange
+        course_id = TestConstants.COURSE_ID
+        existing_course = Mock(spec=Course)
+        existing_course.id = course_id
+        existing_course.to_dict.return_value = {"id": course_id}
+
+        update_data = {"lessons": [{"id": TestConstants.LESSON_ID}]}
+
+        self.mock_session.query.return_value.get.return_value = existing_course
+        self.mock_session.scalars.return_value = [TestConstants.LESSON_ID, 2]
+
+        # Act
+        self.course_service.update(course_id, update_data)
+
+        # Assert
+        # Only the delete runs, the kept lesson has nothing to update
+        self.mock_session.execute.assert_called_once()
+        statement = str(self.mock_session.execute.call_args.args[0])
+        assert statement.startswith("DELETE FROM lessons")
+        self.mock_session.commit.assert_called_once()
+
     # DELETE TESTS
     def test_delete_by_id_success(self):
         # Arrange
         course_id = TestConstants.COURSE_ID
-        self.mock_session.query.return_value.get.return_value = self.mock_course
+        self.mock_session.execute.return_value.rowcount = 1
 
         # Act
         result = self.course_service.delete_by_id(course_id)
 
         # Assert
         assert result is True
-        self.mock_session.delete.assert_called_once_with(self.mock_course)
+        self.mock_session.execute.assert_called_once()
+        self.mock_session.delete.assert_not_called()
         self.mock_session.commit.assert_called_once()
         self.mock_session.close.assert_called_once()
 
     def test_delete_by_id_not_found(self):
         # Arrange
         course_id = TestConstants.NON_EXISTENT_COURSE_ID
-        self.mock_session.query.return_value.get.return_value = None
+        self.mock_session.execute.return_value.rowcount = 0
 
         # Act & Assert
         expected_error = TestConstants.get_error_message(
@@ -343,6 +342,7 @@ class TestCourseService:
         with pytest.raises(Exception, match=expected_error):
             self.course_service.delete_by_id(course_id)
 
+        self.mock_session.commit.assert_not_called()
         self.mock_session.rollback.assert_called_once()
         self.mock_session.close.assert_called_once()
 
@@ -354,7 +354,7 @@ class TestCourseService:
         mock_paginate = Mock()
         mock_paginate.items = [self.mock_course]
 
-        self.mock_session.query.return_value.paginate.return_value = mock_paginate
+        self.mock_session.query.return_value.options.return_value.order_by.return_value.paginate.return_value = mock_paginate
         self.mock_session.query.return_value.count.return_value = 1
 
         # Act
@@ -370,9 +370,10 @@ class TestCourseService:
         assert len(result["data"]) == 1
 
         self.mock_session.query.assert_called_with(Course)
-        self.mock_session.query.return_value.paginate.assert_called_once_with(
-            page=page, per_page=per_page, error_out=False
+        self.mock_session.query.return_value.options.return_value.order_by.return_value.paginate.assert_called_once_with(
+            page=page, per_page=per_page, error_out=False, count=False
         )
+        self.mock_session.query.return_value.count.assert_called_once()
         self.mock_session.close.assert_called_once()
 
     def test_get_all_paginated_with_multiple_pages(self):
@@ -383,7 +384,7 @@ class TestCourseService:
         mock_paginate = Mock()
         mock_paginate.items = [self.mock_course]
 
-        self.mock_session.query.return_value.paginate.return_value = mock_paginate
+        self.mock_session.query.return_value.options.return_value.order_by.return_value.paginate.return_value = mock_paginate
         self.mock_session.query.return_value.count.return_value = total_count
 
         # Act
@@ -396,9 +397,109 @@ class TestCourseService:
         assert result["totalPages"] == 3
         assert result["canPreviousPage"] is True
         assert result["canNextPage"] is True
+        assert result["totalCountExact"] is True
 
         self.mock_session.close.assert_called_once()
 
+    def test_get_all_paginated_cached_count(self):
+        # Arrange
+        service = CourseService(
+            session_factory=self.mock_session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+            count_mode="cached",
+        )
+        mock_paginate = Mock()
+        mock_paginate.items = [self.mock_course]
+        self.mock_session.query.return_value.options.return_value.order_by.return_value.paginate.return_value = mock_paginate
+        self.mock_session.query.return_value.count.return_value = 25
+
+        # Act
+        service.get_all_paginated(1, 10)
+        result = service.get_all_paginated(2, 10)
+
+        # Assert
+        assert result["totalCount"] == 25
+        assert result["totalCountExact"] is True
+        self.mock_session.query.return_value.count.assert_called_once()
+
+    def test_create_invalidates_cached_count(self):
+        # Arrange
+        service = CourseService(
+            session_factory=self.mock_session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+            count_mode="cached",
+        )
+        service.count_cache.set(25)
+
+        # Act
+        with patch.object(
+            CourseService,
+            "_CourseService__dict_to_course",
+            return_value=self.mock_course,
+        ):
+            service.create(TestConstants.get_complete_course_data(include_id=False))
+
+        # Assert
+        assert service.count_cache.get() is None
+
+    def test_get_all_paginated_estimated_count(self):
+        # Arrange
+        service = CourseService(
+            session_factory=self.mock_session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+            count_mode="estimated",
+            estimate_threshold=1000,
+        )
+        mock_paginate = Mock()
+        mock_paginate.items = [self.mock_course]
+        self.mock_session.query.return_value.options.return_value.order_by.return_value.paginate.return_value = mock_paginate
+        self.mock_session.get_bind.return_value.dialect.name = "postgresql"
+        self.mock_session.execute.return_value.scalar.return_value = 5000
+
+        # Act
+        result = service.get_all_paginated(1, 10)
+
+        # Assert
+        assert result["totalCount"] == 5000
+        assert result["totalCountExact"] is False
+        assert result["totalPages"] == 500
+        self.mock_session.query.return_value.count.assert_not_called()
+
+    def test_get_all_paginated_estimated_count_falls_back_to_exact(self):
+        # Arrange
+        service = CourseService(
+            session_factory=self.mock_session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+            count_mode="estimated",
+        )
+        mock_paginate = Mock()
+        mock_paginate.items = [self.mock_course]
+        self.mock_session.query.return_value.options.return_value.order_by.return_value.paginate.return_value = mock_paginate
+        self.mock_session.get_bind.return_value.dialect.name = "sqlite"
+        self.mock_session.query.return_value.count.return_value = 3
+
+        # Act
+        result = service.get_all_paginated(1, 10)
+
+        # Assert
+        assert result["totalCount"] == 3
+        assert result["totalCountExact"] is True
+
+    def test_total_count_cache_expires(self):
+        # Arrange
+        now = [0.0]
+        cache = TotalCountCache(ttl=5, clock=lambda: now[0])
+        cache.set(10)
+
+        # Act & Assert
+        assert cache.get() == 10
+        now[0] = 5.0
+        assert cache.get() is None
+
     # DICT CONVERSION TESTS
     def test_dict_to_course_with_lessons(self):
         # Arrange
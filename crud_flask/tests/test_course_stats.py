@@ -0,0 +1,167 @@
+import pytest
+from sqlalchemy import text
+from crud_flask.models.models import Category, Course, Lesson, Status, db
+from crud_flask.services.course_service import CourseService
+from crud_flask.services.lesson_service import LessonService
+from crud_flask.services.stats import course_stats_drift
+from test_constants import TestConstants
+
+
+def new_course(**overrides):
+    data = TestConstants.get_complete_course_data(include_id=False)
+    data["lessons"] = [{"name": TestConstants.LESSON_NAME, "youtube_url": "url"}]
+    return {**data, **overrides}
+
+
+class TestCourseStats:
+    @pytest.fixture(autouse=True)
+    def setup(self, sqlite_session_factory, query_counter, seed_courses):
+        self.session_factory = sqlite_session_factory
+        self.queries = query_counter
+        self.seed_courses = seed_courses
+        self.service = CourseService(
+            session_factory=sqlite_session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+        )
+
+    def drift(self):
+        session = self.session_factory()
+        try:
+            return course_stats_drift(session)
+        finally:
+            session.close()
+
+    def cell(self, stats, category, status):
+        return next(
+            (row["courses"], row["lessons"])
+            for row in stats["breakdown"]
+            if row["category"] == category and row["status"] == status
+        )
+
+    def test_first_read_counts_existing_rows(self):
+        self.seed_courses(3, lessons_per_course=2)
+        self.seed_courses(1, lessons_per_course=4, category=Category.FRONTEND)
+
+        stats = self.service.get_stats()
+
+        assert stats["totalCourses"] == 4
+        assert stats["totalLessons"] == 10
+        assert stats["byCategory"]["Backend"] == {"courses": 3, "lessons": 6}
+        assert stats["byCategory"]["Fullstack"] == {"courses": 0, "lessons": 0}
+        assert stats["byStatus"]["Active"] == {"courses": 4, "lessons": 10}
+        assert len(stats["breakdown"]) == len(Category) * len(Status)
+
+    def test_reads_the_summary_table_only(self):
+        self.seed_courses(2)
+        self.service.get_stats()
+
+        self.queries.clear()
+        self.service.get_stats()
+
+        assert len(self.queries) == 1
+        assert "FROM course_stats" in self.queries[0]
+        assert "lessons" not in self.queries[0]
+
+    def test_writes_keep_stats_in_sync(self):
+        self.seed_courses(3, lessons_per_course=2)
+        self.service.get_stats()
+        lessons = LessonService(self.session_factory, Course, Lesson)
+
+        self.service.create(new_course())
+        self.service.bulk_create([new_course(category="FULLSTACK") for _ in range(2)])
+        self.service.patch(1, {"status": "INACTIVE"})
+        self.service.patch(2, {"category": "FRONTEND", "name": "Renamed"})
+        self.service.update(
+            3,
+            {
+                "lessons": [
+                    {"name": TestConstants.NEW_LESSON_NAME, "youtube_url": "url"}
+                ]
+            },
+        )
+        lessons.create(1, {"name": "Extra", "youtube_url": "url"})
+        lessons.delete_by_id(2, 3)
+        self.service.delete_by_id(4)
+        self.service.delete_many([5, 99])
+
+        stats = self.service.get_stats()
+
+        assert self.drift() == []
+        assert stats["totalCourses"] == 4
+        assert stats["totalLessons"] == 3 + 1 + 1 + 1
+        assert self.cell(stats, "Backend", "Inactive") == (1, 3)
+        assert self.cell(stats, "Frontend", "Active") == (1, 1)
+        assert self.cell(stats, "Fullstack", "Active") == (1, 1)
+
+    def test_drift_reports_corrupted_rows(self):
+        self.seed_courses(2, lessons_per_course=1)
+        self.service.get_stats()
+        session = self.session_factory()
+        session.execute(text("UPDATE course_stats SET lesson_count = 7"))
+        session.commit()
+        session.close()
+
+        assert self.drift() == [
+            {
+                "category": "BACKEND",
+                "status": "ACTIVE",
+                "courses": {"stored": 2, "actual": 2},
+                "lessons": {"stored": 7, "actual": 2},
+            }
+        ]
+
+    def test_stats_route(self, sqlite_client):
+        self.seed_courses(2, lessons_per_course=3)
+
+        response = sqlite_client.get("/api/courses/stats")
+
+        assert response.status_code == 200
+        assert response.get_json()["totalLessons"] == 6
+
+
+class TestCourseStatsCli:
+    @pytest.fixture(autouse=True)
+    def setup(self, app):
+        self.app = app
+        db.create_all()
+        self.runner = self.app.test_cli_runner()
+        self.client = self.app.test_client()
+        for _ in range(3):
+            self.client.post(
+                "/api/courses",
+                json=new_course(),
+            )
+
+    def corrupt(self):
+        db.session.execute(text("UPDATE course_stats SET course_count = 0"))
+        db.session.commit()
+
+    def test_rebuild_then_check_in_sync(self):
+        result = self.runner.invoke(args=["course-stats", "rebuild"])
+        assert result.exit_code == 0
+
+        result = self.runner.invoke(args=["course-stats", "check"])
+
+        assert result.exit_code == 0
+        assert "in sync" in result.output
+        assert self.client.get("/api/courses/stats").get_json()["totalCourses"] == 3
+
+    def test_check_fails_on_drift_and_fix_rebuilds(self):
+        self.runner.invoke(args=["course-stats", "rebuild"])
+        self.corrupt()
+
+        result = self.runner.invoke(args=["course-stats", "check"])
+        assert result.exit_code == 1
+        assert "BACKEND/ACTIVE: courses 0 != 3" in result.output
+
+        result = self.runner.invoke(args=["course-stats", "check", "--fix"])
+        assert result.exit_code == 0
+        assert self.runner.invoke(args=["course-stats", "check"]).exit_code == 0
+
+    def test_search_rebuild_indexes_existing_courses(self):
+        result = self.runner.invoke(args=["search", "rebuild"])
+
+        assert result.exit_code == 0
+        response = self.client.get("/api/courses/search?q=course")
+        assert response.get_json()["totalCount"] == 3
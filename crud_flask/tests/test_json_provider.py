@@ -0,0 +1,36 @@
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from crud_flask.json_provider import OrjsonProvider, get_json_provider_class
+from test_constants import TestConstants
+
+orjson = pytest.importorskip("orjson")
+
+
+class TestJsonProvider:
+    def setup_method(self):
+        self.app = Flask(__name__)
+
+    def test_orjson_response_matches_stdlib(self):
+        payload = TestConstants.get_course_dict_response()
+        self.app.json = OrjsonProvider(self.app)
+
+        with self.app.app_context():
+            response = self.app.json.response(payload)
+            expected = DefaultJSONProvider(self.app).response(payload)
+
+        assert response.mimetype == "application/json"
+        assert response.get_data() == expected.get_data()
+
+    def test_orjson_loads(self):
+        provider = OrjsonProvider(self.app)
+
+        assert provider.loads(provider.dumps({"id": 1})) == {"id": 1}
+
+    def test_auto_prefers_fast_provider(self):
+        assert get_json_provider_class("auto") is OrjsonProvider
+        assert get_json_provider_class("stdlib") is DefaultJSONProvider
+
+    def test_invalid_provider(self):
+        with pytest.raises(ValueError):
+            get_json_provider_class("yaml")
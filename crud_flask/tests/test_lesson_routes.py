@@ -0,0 +1,136 @@
+import pytest
+from crud_flask.models.models import Course, Lesson
+from crud_flask.services.lesson_service import LessonService
+
+
+class TestLessonRoutes:
+    def lesson_ids(self, sqlite_client, course_id, per_page):
+        ids, cursor = [], ""
+        while True:
+            response = sqlite_client.get(
+                f"/api/courses/{course_id}/lessons?per_page={per_page}&after={cursor}"
+            )
+            assert response.status_code == 200
+            page = response.get_json()
+            ids.extend(lesson["id"] for lesson in page["data"])
+            cursor = page["nextCursor"]
+            if cursor is None:
+                return ids
+
+    def test_pages_through_lessons_of_one_course(self, sqlite_client, seed_courses):
+        seed_courses(2, lessons_per_course=5)
+
+        first = sqlite_client.get("/api/courses/2/lessons?per_page=2").get_json()
+
+        assert first["pageSize"] == 2
+        assert [lesson["course_id"] for lesson in first["data"]] == [2, 2]
+        assert self.lesson_ids(sqlite_client, 2, 2) == [6, 7, 8, 9, 10]
+
+    def test_page_uses_one_query(self, sqlite_client, seed_courses, query_counter):
+        seed_courses(1, lessons_per_course=3)
+
+        query_counter.clear()
+        sqlite_client.get("/api/courses/1/lessons")
+
+        assert len(query_counter) == 1
+        assert "lessons.course_id = ?" in query_counter[0]
+
+    def test_empty_course_and_missing_course(self, sqlite_client, seed_courses):
+        seed_courses(1, lessons_per_course=0)
+
+        empty = sqlite_client.get("/api/courses/1/lessons")
+        missing = sqlite_client.get("/api/courses/9/lessons")
+
+        assert empty.get_json() == {"pageSize": 20, "nextCursor": None, "data": []}
+        assert missing.status_code == 404
+
+    @pytest.mark.parametrize("query", ["per_page=0", "per_page=101", "after=abc"])
+    def test_invalid_page_parameters(self, sqlite_client, seed_courses, query):
+        seed_courses(1)
+
+        response = sqlite_client.get(f"/api/courses/1/lessons?{query}")
+
+        assert response.status_code == 400
+
+    def test_get_lesson_is_scoped_to_course(self, sqlite_client, seed_courses):
+        seed_courses(2)
+
+        assert sqlite_client.get("/api/courses/1/lessons/1").get_json()["id"] == 1
+        assert sqlite_client.get("/api/courses/2/lessons/1").status_code == 404
+
+    def test_lesson_writes_bump_course_etag(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        etag = sqlite_client.get("/api/courses/1").headers["ETag"]
+
+        created = sqlite_client.post(
+            "/api/courses/1/lessons",
+            json={"name": "Extra", "youtube_url": "https://youtu.be/extra"},
+        )
+        after_create = sqlite_client.get("/api/courses/1").headers["ETag"]
+        updated = sqlite_client.put(
+            f"/api/courses/1/lessons/{created.get_json()['id']}",
+            json={"name": "Renamed"},
+        )
+        after_update = sqlite_client.get("/api/courses/1").headers["ETag"]
+        deleted = sqlite_client.delete("/api/courses/1/lessons/1")
+
+        assert created.status_code == 201
+        assert created.get_json()["course_id"] == 1
+        assert updated.get_json()["name"] == "Renamed"
+        assert updated.get_json()["youtube_url"] == "https://youtu.be/extra"
+        assert deleted.status_code == 200
+        assert len({etag, after_create, after_update}) == 3
+        course = sqlite_client.get("/api/courses/1").get_json()
+        assert [lesson["name"] for lesson in course["lessons"]] == [
+            "Lesson 1 1",
+            "Renamed",
+        ]
+
+    def test_writes_to_missing_resources(self, sqlite_client, seed_courses):
+        seed_courses(1)
+        lesson = {"name": "Lesson", "youtube_url": "url"}
+
+        assert (
+            sqlite_client.post("/api/courses/9/lessons", json=lesson).status_code == 404
+        )
+        assert (
+            sqlite_client.put("/api/courses/1/lessons/99", json=lesson).status_code
+            == 404
+        )
+        assert sqlite_client.delete("/api/courses/1/lessons/99").status_code == 404
+
+    @pytest.mark.parametrize(
+        "method, path, body",
+        [
+            ("post", "/api/courses/1/lessons", {"name": "No url"}),
+            ("post", "/api/courses/1/lessons", ["not", "an", "object"]),
+            ("put", "/api/courses/1/lessons/1", {}),
+            ("put", "/api/courses/1/lessons/1", {"youtube_url": "x" * 101}),
+        ],
+    )
+    def test_invalid_lesson_payload(
+        self, sqlite_client, seed_courses, method, path, body
+    ):
+        seed_courses(1)
+
+        response = getattr(sqlite_client, method)(path, json=body)
+
+        assert response.status_code == 400
+
+
+def test_writes_notify_on_change(sqlite_session_factory, seed_courses):
+    seed_courses(1)
+    changes = []
+    service = LessonService(
+        session_factory=sqlite_session_factory,
+        course_model=Course,
+        lesson_model=Lesson,
+        on_change=lambda: changes.append(True),
+    )
+
+    service.create(1, {"name": "Lesson", "youtube_url": "url"})
+    service.update(1, 1, {"name": "Renamed"})
+    service.delete_by_id(1, 1)
+    service.delete_by_id(1, 1)
+
+    assert len(changes) == 3
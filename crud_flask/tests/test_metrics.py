@@ -0,0 +1,112 @@
+import re
+import pytest
+from crud_flask import create_app
+from crud_flask.metrics import CACHE_SERIES, RequestMetrics, render_stats
+from crud_flask.models.models import db
+
+
+class TestRequestMetrics:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.app = create_app("testing")
+        with self.app.app_context():
+            db.create_all()
+        self.client = self.app.test_client()
+
+    def create_course(self):
+        return self.client.post(
+            "/api/courses",
+            json={
+                "name": "Course",
+                "category": "BACKEND",
+                "status": "ACTIVE",
+                "lessons": [{"name": "Lesson", "youtube_url": "url"}],
+            },
+        )
+
+    def server_timing(self, response):
+        header = response.headers["Server-Timing"]
+        match = re.match(
+            r'db;dur=([\d.]+);desc="(\d+) queries", total;dur=([\d.]+)', header
+        )
+        assert match, header
+        return float(match.group(1)), int(match.group(2)), float(match.group(3))
+
+    def test_server_timing_reports_queries_for_request(self):
+        self.create_course()
+
+        response = self.client.get("/api/courses")
+
+        # Courses and their lessons
+        db_ms, queries, total_ms = self.server_timing(response)
+        assert queries == 2
+        assert 0 <= db_ms <= total_ms
+
+    def test_metrics_exposes_latency_histogram_per_route_and_status(self):
+        self.create_course()
+        self.client.get("/api/courses/1")
+        self.client.get("/api/courses/1?fields=bogus")
+
+        body = self.client.get("/metrics").get_data(as_text=True)
+
+        ok = 'method="GET",route="/api/courses/<int:id>",status="200"'
+        invalid = 'method="GET",route="/api/courses/<int:id>",status="400"'
+        assert f'http_request_duration_seconds_bucket{{{ok},le="+Inf"}} 1' in body
+        assert f"http_request_duration_seconds_count{{{invalid}}} 1" in body
+        assert (
+            'http_request_duration_seconds_count{method="POST",route="/api/courses",'
+            'status="201"} 1' in body
+        )
+
+    def test_metrics_exposes_query_totals_and_pool_stats(self):
+        self.client.get("/api/courses")
+        self.client.get("/api/courses")
+
+        response = self.client.get("/metrics")
+        body = response.get_data(as_text=True)
+
+        assert response.mimetype == "text/plain"
+        assert (
+            'http_request_db_queries_total{method="GET",route="/api/courses"} 2'
+            in body
+        )
+        assert 'http_request_db_seconds_total{method="GET",route="/api/courses"}' in body
+        assert re.search(r'db_pool_checkouts_total\{pool="default"\} \d+', body)
+
+    def test_unmatched_routes_share_one_label(self):
+        self.client.get("/nope/1")
+        self.client.get("/nope/2")
+
+        body = self.client.get("/metrics").get_data(as_text=True)
+
+        assert (
+            'http_request_duration_seconds_count{method="GET",route="unmatched",'
+            'status="404"} 2' in body
+        )
+
+
+class TestMetricsRendering:
+    def test_histogram_buckets_are_cumulative(self):
+        metrics = RequestMetrics(buckets=(0.1, 1.0))
+        metrics.observe("GET", "/a", 200, 0.05, 1, 0.01)
+        metrics.observe("GET", "/a", 200, 0.5, 2, 0.02)
+        metrics.observe("GET", "/a", 200, 5.0, 3, 0.03)
+
+        lines = metrics.render()
+
+        labels = 'method="GET",route="/a",status="200"'
+        assert f'http_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+        assert f'http_request_duration_seconds_bucket{{{labels},le="1.0"}} 2' in lines
+        assert f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in lines
+        assert 'http_request_db_queries_total{method="GET",route="/a"} 6' in lines
+
+    def test_render_stats_for_cache(self):
+        lines = render_stats(
+            CACHE_SERIES,
+            {'cache="course"': {"hits": 3, "misses": 1, "evictions": 0, "size": 2}},
+        )
+
+        assert "# TYPE course_cache_hits_total counter" in lines
+        assert 'course_cache_hits_total{cache="course"} 3' in lines
+        assert 'course_cache_size{cache="course"} 2' in lines
+        assert not any("invalidations" in line for line in lines)
@@ -0,0 +1,78 @@
+import argparse
+import random
+import pytest
+from sqlalchemy import func, select
+from crud_flask.models.models import Category, Course, Lesson, Status, db
+from mock_dump import generate_chunk, high_volume_dump, parse_lessons, parse_mix
+
+
+class TestMockDump:
+    def options(self, lessons="0-4", categories=None, statuses=None):
+        return {
+            "seed": 7,
+            "lessons": parse_lessons(lessons),
+            "categories": parse_mix(categories, Category),
+            "statuses": parse_mix(statuses, Status),
+        }
+
+    def test_parse_lessons_distributions(self):
+        rng = random.Random(1)
+
+        assert parse_lessons("3")(rng) == 3
+        assert {parse_lessons("1-2")(rng) for _ in range(50)} == {1, 2}
+        draws = [parse_lessons("poisson:4")(rng) for _ in range(2000)]
+        assert 3.7 < sum(draws) / len(draws) < 4.3
+
+    @pytest.mark.parametrize("spec", ["x", "poisson:", "1-"])
+    def test_parse_lessons_rejects_invalid_spec(self, spec):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_lessons(spec)
+
+    def test_parse_mix(self):
+        assert parse_mix("backend=3,FULLSTACK=1", Category) == (
+            [Category.BACKEND, Category.FULLSTACK],
+            [3.0, 1.0],
+        )
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_mix("MOBILE=1", Category)
+
+    def test_chunks_are_independent_of_batch_size(self):
+        whole, whole_lessons = generate_chunk(first_id=1, count=10, **self.options())
+        head, head_lessons = generate_chunk(first_id=1, count=4, **self.options())
+        tail, tail_lessons = generate_chunk(first_id=5, count=6, **self.options())
+
+        assert head + tail == whole
+        assert head_lessons + tail_lessons == whole_lessons
+
+    def test_mix_is_respected(self):
+        courses, _ = generate_chunk(
+            first_id=1,
+            count=200,
+            **self.options(categories="FRONTEND=1", statuses="ACTIVE=1,INACTIVE=0"),
+        )
+
+        assert {course["category"] for course in courses} == {Category.FRONTEND}
+        assert {course["status"] for course in courses} == {Status.ACTIVE}
+
+    def test_high_volume_dump_inserts_in_batches(self, tmp_path):
+        from sqlalchemy import create_engine
+
+        database_uri = f"sqlite:///{tmp_path / 'dump.db'}"
+        engine = create_engine(database_uri)
+        db.metadata.create_all(engine)
+
+        stats = high_volume_dump(
+            database_uri, 250, lessons="2", batch_size=100, workers=4
+        )
+
+        with engine.connect() as connection:
+            courses = connection.execute(select(func.count(Course.id))).scalar()
+            lessons = connection.execute(select(func.count(Lesson.id))).scalar()
+        engine.dispose()
+        assert (courses, lessons) == (250, 500)
+        assert stats["courses"] == 250
+        assert stats["rows_per_second"] > 0
+
+    def test_copy_requires_postgres(self, tmp_path):
+        with pytest.raises(ValueError, match="PostgreSQL"):
+            high_volume_dump(f"sqlite:///{tmp_path / 'dump.db'}", 1, method="copy")
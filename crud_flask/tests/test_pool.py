@@ -0,0 +1,147 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+from crud_flask import create_app, warm_up_pools
+from crud_flask.config import TestingConfig
+from crud_flask.models.models import db
+from crud_flask.pool import (
+    InstrumentedQueuePool,
+    engine_options_for,
+    engine_options_from_env,
+    instrument_pool,
+    warm_up_pool,
+)
+
+
+class TestPool:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        self.engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=2,
+            max_overflow=1,
+            pool_timeout=0.05,
+        )
+        self.metrics = instrument_pool(self.engine)
+        yield
+        self.engine.dispose()
+
+    def test_engine_options_from_env(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "20")
+        monkeypatch.setenv("DB_MAX_OVERFLOW", "5")
+        monkeypatch.setenv("DB_POOL_TIMEOUT", "2.5")
+        monkeypatch.setenv("DB_POOL_PRE_PING", "false")
+        monkeypatch.delenv("DB_POOL_RECYCLE", raising=False)
+
+        options = engine_options_from_env(pool_pre_ping=True)
+
+        assert options == {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": 20,
+            "max_overflow": 5,
+            "pool_timeout": 2.5,
+            "pool_pre_ping": False,
+        }
+
+    def test_in_memory_sqlite_drops_queue_only_options(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE", "20")
+        monkeypatch.setenv("DB_POOL_USE_LIFO", "true")
+        monkeypatch.setenv("DB_POOL_RECYCLE", "300")
+        options = engine_options_from_env()
+
+        app = create_app(
+            type(
+                "PooledTesting",
+                (TestingConfig,),
+                {"SQLALCHEMY_ENGINE_OPTIONS": options},
+            )
+        )
+
+        assert app.config["SQLALCHEMY_ENGINE_OPTIONS"] == {"pool_recycle": 300}
+        with app.app_context():
+            db.session.execute(text("SELECT 1"))
+        assert engine_options_for("sqlite:////tmp/file.db", options) == options
+
+    def test_counts_checkouts_and_checkins(self):
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+        with self.engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        stats = self.metrics.snapshot()
+        assert stats["connects"] == 1
+        assert stats["checkouts"] == 2
+        assert stats["checkins"] == 2
+        assert self.metrics.waits == 2
+        assert stats["checkedOut"] == 0
+
+    def test_counts_overflow_and_timeouts(self):
+        connections = [self.engine.connect() for _ in range(3)]
+
+        with pytest.raises(exc.TimeoutError):
+            self.engine.connect()
+
+        stats = self.metrics.snapshot()
+        assert stats["overflowCheckouts"] == 1
+        assert stats["overflow"] == 1
+        assert stats["checkedOut"] == 3
+        assert stats["timeouts"] == 1
+        assert stats["waitSecondsMax"] >= 0.05
+        for connection in connections:
+            connection.close()
+
+    def test_counts_invalidations(self):
+        with self.engine.connect() as connection:
+            connection.invalidate()
+
+        assert self.metrics.snapshot()["invalidations"] == 1
+
+    def test_metrics_survive_dispose(self):
+        self.engine.dispose()
+
+        with self.engine.connect():
+            pass
+
+        assert self.engine.pool.metrics is self.metrics
+        assert self.metrics.snapshot()["checkouts"] == 1
+        assert self.metrics.waits == 1
+
+    def test_warm_up_opens_connections_up_front(self):
+        assert warm_up_pool(self.engine, 2) == 2
+
+        stats = self.metrics.snapshot()
+        assert stats["connects"] == 2
+        assert stats["checkedIn"] == 2
+        assert stats["checkedOut"] == 0
+
+
+class TestHealthRoutes:
+    def test_health_db_reports_pool_stats(self):
+        app = create_app("testing")
+        client = app.test_client()
+
+        response = client.get("/health/db")
+
+        assert response.status_code == 200
+        assert response.json["status"] == "ok"
+        assert response.json["pools"]["default"]["pool"] == "StaticPool"
+        assert response.json["pools"]["default"]["checkouts"] >= 1
+
+    def test_health_db_reports_unavailable_database(self):
+        app = create_app("testing")
+        client = app.test_client()
+        metrics = app.extensions["pool_metrics"]["default"]
+
+        def fail():
+            raise exc.OperationalError("SELECT 1", {}, Exception("down"))
+
+        metrics.engine.pool._creator = fail
+        metrics.engine.dispose()
+
+        response = client.get("/health/db")
+
+        assert response.status_code == 503
+        assert response.json["status"] == "unavailable"
+
+    def test_warm_up_pools_is_disabled_by_default(self):
+        assert warm_up_pools(create_app("testing")) == 0
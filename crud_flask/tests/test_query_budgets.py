@@ -0,0 +1,166 @@
+import pytest
+from crud_flask.services.course_service import CourseService
+from crud_flask.models.models import Course, Lesson
+from query_budget import QueryBudget
+
+COURSES = 20
+
+
+class TestCourseServiceQueryBudgets:
+    """Every CourseService method must issue a fixed number of statements.
+
+    The catalog holds COURSES courses with two lessons each, so a per-course
+    lazy load would blow any of these budgets.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, sqlite_session_factory, seed_courses):
+        seed_courses(COURSES)
+        self.service = CourseService(
+            session_factory=sqlite_session_factory,
+            course_model=Course,
+            lesson_model=Lesson,
+        )
+
+    def course_payload(self, name="Budget course"):
+        return {
+            "name": name,
+            "category": "BACKEND",
+            "lessons": [
+                {"name": "Lesson 1", "youtube_url": "url1"},
+                {"name": "Lesson 2", "youtube_url": "url2"},
+            ],
+        }
+
+    @pytest.mark.query_budget(2)
+    def test_get_all(self, query_budget):
+        with query_budget:
+            courses = self.service.get_all()
+        assert len(courses) == COURSES
+
+    # One course query plus one selectin lesson query per yielded batch
+    @pytest.mark.query_budget(1 + COURSES // 5)
+    def test_iter_all(self, query_budget):
+        with query_budget:
+            courses = list(self.service.iter_all(batch_size=5))
+        assert len(courses) == COURSES
+
+    @pytest.mark.query_budget(3)
+    def test_get_all_paginated(self, query_budget):
+        with query_budget:
+            page = self.service.get_all_paginated(1, 10, category="backend")
+        assert len(page["data"]) == 10
+
+    @pytest.mark.query_budget(2)
+    def test_get_page_by_cursor(self, query_budget):
+        first = self.service.get_page_by_cursor(5)
+        with query_budget:
+            page = self.service.get_page_by_cursor(10, after=first["nextCursor"])
+        assert len(page["data"]) == 10
+
+    @pytest.mark.query_budget(3)
+    def test_search(self, query_budget):
+        with query_budget:
+            results = self.service.search("Test Course", per_page=10)
+        assert len(results["data"]) == 10
+
+    @pytest.mark.query_budget(2)
+    def test_get_by_id(self, query_budget):
+        with query_budget:
+            course = self.service.get_by_id(1)
+        assert len(course["lessons"]) == 2
+
+    @pytest.mark.query_budget(2)
+    def test_get_tagged_by_id(self, query_budget):
+        with query_budget:
+            tagged = self.service.get_tagged_by_id(1)
+        assert len(tagged["course"]["lessons"]) == 2
+
+    @pytest.mark.query_budget(1)
+    def test_get_version_tag(self, query_budget):
+        with query_budget:
+            assert self.service.get_version_tag(1) is not None
+
+    # Served from the trigger-maintained course_stats table alone
+    @pytest.mark.query_budget(1)
+    def test_get_stats(self, query_budget):
+        with query_budget:
+            stats = self.service.get_stats()
+        assert stats["totalCourses"] == COURSES
+        assert stats["totalLessons"] == COURSES * 2
+
+    @pytest.mark.query_budget(5)
+    def test_create(self, query_budget):
+        with query_budget:
+            course = self.service.create(self.course_payload())
+        assert len(course["lessons"]) == 2
+
+    # SQLite cannot batch INSERT .. RETURNING with sort_by_parameter_order, so
+    # courses go in one row per statement there; lessons are always one insert.
+    @pytest.mark.query_budget(11)
+    def test_bulk_create(self, query_budget):
+        items = [self.course_payload(f"Bulk {i}") for i in range(10)]
+        with query_budget:
+            result = self.service.bulk_create(items)
+        assert result["created"] == 10
+        assert (
+            len([s for s in query_budget.statements if "INSERT INTO lessons" in s]) == 1
+        )
+
+    # Load, version bump, set-based lesson sync, then refresh for the response
+    @pytest.mark.query_budget(8)
+    def test_update(self, query_budget):
+        lessons = self.service.get_by_id(1)["lessons"]
+        with query_budget:
+            self.service.update(
+                1,
+                {
+                    "name": "Renamed",
+                    "lessons": [
+                        {"id": lessons[0]["id"], "name": "Changed"},
+                        {"name": "New", "youtube_url": "url"},
+                    ],
+                },
+            )
+
+    @pytest.mark.query_budget(1)
+    def test_patch(self, query_budget):
+        with query_budget:
+            course, etag = self.service.patch(
+                1, {"status": "INACTIVE", "description": None}, expected_versions=[1]
+            )
+        assert course["status"] == "Inactive"
+        assert etag == "1-2"
+
+    # Lessons go with the course through ON DELETE CASCADE
+    @pytest.mark.query_budget(1)
+    def test_delete_by_id(self, query_budget):
+        with query_budget:
+            assert self.service.delete_by_id(1) is True
+
+    @pytest.mark.query_budget(1)
+    def test_delete_many(self, query_budget):
+        with query_budget:
+            result = self.service.delete_many(list(range(1, COURSES + 1)))
+        assert len(result["deleted"]) == COURSES
+
+
+@pytest.mark.query_budget(1)
+def test_whole_test_is_counted_without_context_manager(sqlite_engine):
+    from sqlalchemy import text
+
+    with sqlite_engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def test_budget_failure_lists_captured_statements():
+    budget = QueryBudget(1)
+    budget.statements = ["SELECT 1", "SELECT\n  2"]
+
+    with pytest.raises(pytest.fail.Exception) as error:
+        budget.check()
+
+    message = str(error.value)
+    assert "2 statements issued, budget is 1" in message
+    assert "1. SELECT 1" in message
+    assert "2. SELECT 2" in message
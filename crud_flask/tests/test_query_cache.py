@@ -0,0 +1,160 @@
+import pytest
+from unittest.mock import Mock
+from crud_flask.models.models import Course, Lesson
+from crud_flask.services.course_service import CourseService, version_tag
+from crud_flask.services.query_cache import (
+    CachedCourseService,
+    LRUCacheBackend,
+    RedisCacheBackend,
+)
+from test_constants import TestConstants
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode() if isinstance(value, str) else value
+
+    def incr(self, key):
+        self.values[key] = int(self.values.get(key, 0)) + 1
+        return self.values[key]
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request):
+    if request.param == "memory":
+        return LRUCacheBackend(maxsize=10, ttl=60)
+    return RedisCacheBackend(FakeRedis())
+
+
+class TestCachedCourseService:
+    @pytest.fixture(autouse=True)
+    def setup(self, backend):
+        self.course_service = Mock()
+        self.course_service.get_by_id.return_value = (
+            TestConstants.get_course_dict_response()
+        )
+        self.course_service.get_all_paginated.return_value = {"data": []}
+        self.cached_service = CachedCourseService(self.course_service, backend)
+
+    def test_read_is_cached(self):
+        first = self.cached_service.get_by_id(TestConstants.COURSE_ID)
+        second = self.cached_service.get_by_id(TestConstants.COURSE_ID)
+
+        assert first == second == TestConstants.get_course_dict_response()
+        self.course_service.get_by_id.assert_called_once_with(TestConstants.COURSE_ID)
+        assert self.cached_service.stats()["hits"] == 1
+        assert self.cached_service.stats()["misses"] == 1
+
+    def test_arguments_are_part_of_the_key(self):
+        self.cached_service.get_all_paginated(1, 10)
+        self.cached_service.get_all_paginated(2, 10)
+
+        assert self.course_service.get_all_paginated.call_count == 2
+
+    @pytest.mark.parametrize(
+        "write", ["create", "bulk_create", "update", "delete_by_id"]
+    )
+    def test_writes_invalidate(self, write):
+        self.cached_service.get_by_id(TestConstants.COURSE_ID)
+
+        getattr(self.cached_service, write)(TestConstants.COURSE_ID)
+        self.cached_service.get_by_id(TestConstants.COURSE_ID)
+
+        assert self.course_service.get_by_id.call_count == 2
+        assert self.cached_service.stats()["invalidations"] == 1
+
+    def test_failed_write_still_invalidates(self):
+        self.course_service.update.side_effect = Exception(TestConstants.ERROR_DATABASE)
+        self.cached_service.get_by_id(TestConstants.COURSE_ID)
+
+        with pytest.raises(Exception):
+            self.cached_service.update(TestConstants.COURSE_ID, {})
+        self.cached_service.get_by_id(TestConstants.COURSE_ID)
+
+        assert self.course_service.get_by_id.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        self.course_service.get_by_id.side_effect = [
+            Exception(TestConstants.ERROR_DATABASE),
+            TestConstants.get_course_dict_response(),
+        ]
+
+        with pytest.raises(Exception):
+            self.cached_service.get_by_id(TestConstants.COURSE_ID)
+        result = self.cached_service.get_by_id(TestConstants.COURSE_ID)
+
+        assert result["id"] == TestConstants.COURSE_ID
+
+    def test_other_methods_pass_through(self):
+        self.cached_service.get_version_tag(TestConstants.COURSE_ID)
+        self.cached_service.get_version_tag(TestConstants.COURSE_ID)
+
+        assert self.course_service.get_version_tag.call_count == 2
+        assert self.cached_service.stats()["invalidations"] == 0
+
+    @pytest.mark.parametrize("from_replica, calls", [(True, 3), (False, 1)])
+    def test_replica_reads_right_after_a_write_are_not_cached(
+        self, backend, from_replica, calls
+    ):
+        cached_service = CachedCourseService(
+            self.course_service,
+            backend,
+            pin_seconds=5.0,
+            served_by_replica=lambda: from_replica,
+        )
+        cached_service.update(TestConstants.COURSE_ID, {})
+
+        for _ in range(2):
+            cached_service.get_by_id(TestConstants.COURSE_ID)
+        cached_service.pin_seconds = 0.0
+        cached_service.get_by_id(TestConstants.COURSE_ID)
+
+        assert self.course_service.get_by_id.call_count == calls
+
+    def test_tagged_read_caches_body_and_etag_together(
+        self, backend, sqlite_session_factory, seed_courses
+    ):
+        seed_courses(1)
+        service = CourseService(sqlite_session_factory, Course, Lesson)
+        worker = CachedCourseService(service, backend)
+        before = worker.get_tagged_by_id(1)
+
+        # Written through another worker: this one's cache is not invalidated
+        service.patch(1, {"name": "Renamed"})
+        after = worker.get_tagged_by_id(1)
+
+        assert after == before
+        assert after["etag"] == version_tag(1, 1)
+        assert service.get_tagged_by_id(1)["etag"] == version_tag(1, 2)
+
+
+class TestLRUCacheBackend:
+    def test_evicts_least_recently_used(self):
+        backend = LRUCacheBackend(maxsize=2)
+        backend.set("a", 1)
+        backend.set("b", 2)
+        backend.get("a")
+
+        backend.set("c", 3)
+
+        assert backend.get("a") == 1
+        assert backend.get("c") == 3
+        assert backend.evictions == 1
+        assert len(backend) == 2
+
+    def test_entries_expire(self):
+        now = [0.0]
+        backend = LRUCacheBackend(ttl=5, clock=lambda: now[0])
+        backend.set("a", 1)
+
+        now[0] = 5.0
+
+        backend.get("a")
+
+        assert len(backend) == 0
@@ -0,0 +1,178 @@
+import time
+import pytest
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import Engine
+from crud_flask import create_app
+from crud_flask.config import TestingConfig
+from crud_flask.models.models import Category, Course, db
+from crud_flask.replicas import PIN_COOKIE, PIN_HEADER, ReplicaRouter
+
+
+def make_database(uri, name):
+    engine = create_engine(uri)
+    db.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Course), [{"name": name, "category": Category.BACKEND}]
+        )
+    engine.dispose()
+
+
+class TestReplicaRouting:
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        # Primary and replicas hold different rows so responses show the source
+        self.primary_uri = f"sqlite:///{tmp_path / 'primary.db'}"
+        self.replica_uris = [
+            f"sqlite:///{tmp_path / 'replica_a.db'}",
+            f"sqlite:///{tmp_path / 'replica_b.db'}",
+        ]
+        make_database(self.primary_uri, "Primary")
+        make_database(self.replica_uris[0], "Replica A")
+        make_database(self.replica_uris[1], "Replica B")
+
+    def make_app(self, replica_uris=None):
+        config = type(
+            "ReplicaConfig",
+            (TestingConfig,),
+            {
+                "SQLALCHEMY_DATABASE_URI": self.primary_uri,
+                "SQLALCHEMY_REPLICA_URIS": replica_uris or self.replica_uris,
+                "METRICS_ENABLED": False,
+            },
+        )
+        return create_app(config)
+
+    def course_name(self, client):
+        return client.get("/api/courses/1").get_json()["name"]
+
+    def test_reads_rotate_over_replicas(self):
+        client = self.make_app().test_client()
+
+        names = [self.course_name(client) for _ in range(4)]
+
+        assert names == ["Replica A", "Replica B", "Replica A", "Replica B"]
+
+    def test_one_request_reads_from_one_replica(self):
+        client = self.make_app().test_client()
+        databases = []
+
+        def record(conn, cursor, statement, *args):
+            if statement != "SELECT 1":
+                databases.append(conn.engine.url.database)
+
+        event.listen(Engine, "before_cursor_execute", record)
+        try:
+            client.get("/api/courses/1")
+        finally:
+            event.remove(Engine, "before_cursor_execute", record)
+
+        # The ETag lookup and the course query must agree on one snapshot
+        assert len(databases) >= 2
+        assert {database.rsplit("/", 1)[-1] for database in databases} == {
+            "replica_a.db"
+        }
+
+    def test_writes_go_to_primary_and_pin_the_client(self):
+        app = self.make_app()
+        client = app.test_client()
+
+        response = client.post(
+            "/api/courses", json={"name": "Written", "category": "BACKEND"}
+        )
+
+        assert response.status_code == 201
+        assert response.get_json()["id"] == 2
+        assert client.get_cookie(PIN_COOKIE) is not None
+        assert client.get("/api/courses/2").get_json()["name"] == "Written"
+        assert self.course_name(client) == "Primary"
+        assert self.course_name(app.test_client()) == "Replica A"
+
+    def test_pin_header_works_without_cookies(self):
+        app = self.make_app()
+        writer = app.test_client(use_cookies=False)
+
+        response = writer.post(
+            "/api/courses",
+            json={"name": "Written", "category": "BACKEND"},
+            headers={"Origin": "http://frontend.test"},
+        )
+        pin = response.headers[PIN_HEADER]
+        read = writer.get("/api/courses/2", headers={PIN_HEADER: pin})
+
+        assert PIN_HEADER in response.headers["Access-Control-Expose-Headers"]
+        assert read.get_json()["name"] == "Written"
+        assert self.course_name(writer) == "Replica A"
+
+    def test_pin_beyond_one_window_is_ignored(self):
+        client = self.make_app().test_client()
+        forged = str(time.time() + 3600)
+
+        name = client.get("/api/courses/1", headers={PIN_HEADER: forged}).get_json()
+
+        assert name["name"] == "Replica A"
+
+    def test_expired_pin_reads_from_replica(self):
+        client = self.make_app().test_client()
+        client.set_cookie(PIN_COOKIE, str(time.time() - 1))
+
+        assert self.course_name(client) == "Replica A"
+
+    def test_failed_writes_do_not_pin(self):
+        client = self.make_app().test_client()
+
+        response = client.post("/api/courses", json={"name": "No category"})
+
+        assert response.status_code == 400
+        assert client.get_cookie(PIN_COOKIE) is None
+
+    def test_unhealthy_replica_is_skipped(self, tmp_path):
+        missing = f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"
+        app = self.make_app([missing, self.replica_uris[1]])
+        client = app.test_client()
+
+        names = [self.course_name(client) for _ in range(3)]
+        health = client.get("/health/db").get_json()
+
+        assert names == ["Replica B"] * 3
+        assert health["replicas"]["replica_0"]["healthy"] is False
+        assert health["replicas"]["replica_1"]["healthy"] is True
+        assert set(health["pools"]) == {"default", "replica_0", "replica_1"}
+
+    def test_no_healthy_replica_falls_back_to_primary(self, tmp_path):
+        app = self.make_app([f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"])
+
+        assert self.course_name(app.test_client()) == "Primary"
+
+    def test_without_replicas_reads_use_primary(self):
+        app = create_app(
+            type(
+                "PrimaryOnly",
+                (TestingConfig,),
+                {"SQLALCHEMY_DATABASE_URI": self.primary_uri},
+            )
+        )
+
+        assert self.course_name(app.test_client()) == "Primary"
+        assert app.extensions["replica_router"].replicas == []
+
+
+class TestReplicaHealthChecks:
+    def test_health_is_cached_for_the_interval(self):
+        now = [0.0]
+        engine = create_engine("sqlite://")
+        router = ReplicaRouter(
+            lambda: None,
+            {"replica_0": engine},
+            health_check_interval=5.0,
+            clock=lambda: now[0],
+        )
+        probes = []
+        event.listen(engine, "before_cursor_execute", lambda *args: probes.append(1))
+
+        router.choose()
+        router.choose()
+        now[0] = 6.0
+        router.choose()
+
+        assert len(probes) == 2
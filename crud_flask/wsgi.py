@@ -0,0 +1,4 @@
+import os
+from crud_flask import create_app
+
+app = create_app(os.getenv("APP_CONFIG", "production"))
@@ -1,6 +1,11 @@
 import axios, { AxiosResponse, Method } from 'axios';
 import { useCallback, useEffect, useReducer } from 'react';
 
+// The API pins a client to the primary database for a few seconds after a write.
+// Requests are cross-origin without cookies, so the pin is echoed as a header.
+const PRIMARY_UNTIL_HEADER = 'X-DB-Primary-Until';
+let primaryUntil: string | null = null;
+
 interface HttpState<T> {
 	loading: boolean;
 	data: T | null;
@@ -59,8 +64,13 @@ const useHttp = <T,>(
 					data: config?.body !== undefined ? config.body : body,
 					headers: {
 						'Content-Type': 'application/json',
+						...(primaryUntil ? { [PRIMARY_UNTIL_HEADER]: primaryUntil } : {}),
 					},
 				});
+				const pin = response.headers[PRIMARY_UNTIL_HEADER.toLowerCase()];
+				if (pin) {
+					primaryUntil = String(pin);
+				}
 				dispatch({ type: 'success', responseData: response.data });
 				return response.data;
 			} catch (error) {
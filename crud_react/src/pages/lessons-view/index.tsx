@@ -1,14 +1,24 @@
 import { ArrowBackIcon } from '@chakra-ui/icons';
 import { Box, Flex, Grid, GridItem, Text } from '@chakra-ui/layout';
 import { Button, Heading } from '@chakra-ui/react';
-import { useLocation, useNavigate } from 'react-router';
+import { useLocation, useNavigate, useParams } from 'react-router';
+import useHttp from '../../hooks/utils/useHttp';
 import { Lesson } from '../../models/interfaces/lesson';
 import Layout from '../../templates/layout';
 
 const LessonViewPage = () => {
 	const navigate = useNavigate();
 	const location = useLocation();
-	const lesson = location.state?.lesson as Lesson | undefined;
+	const { id, lessonId } = useParams();
+	const stateLesson = location.state?.lesson as Lesson | undefined;
+	const { data: fetchedLesson, loading } = useHttp<Lesson>(
+		`${import.meta.env.VITE_API_URL}/courses/${id}/lessons/${lessonId}`,
+		'GET',
+		null,
+		[id, lessonId],
+		!stateLesson && !!id && !!lessonId
+	);
+	const lesson = stateLesson ?? fetchedLesson ?? undefined;
 
 	const getYouTubeVideoId = (url: string) => {
 		const regExp = /^.*(youtu.be\/|v\/|u\/\w\/|embed\/|watch\?v=|&v=)([^#&?]*).*/;
@@ -26,7 +36,7 @@ const LessonViewPage = () => {
 					py={10}
 				>
 					<Box>
-						<Text>Lesson not found</Text>
+						<Text>{loading ? 'Loading lesson...' : 'Lesson not found'}</Text>
 					</Box>
 				</Flex>
 			</Layout>